@@ -0,0 +1,113 @@
+"""
+Benchmarks for the hot paths of subtypes. Each 'bench_*' module registers setup functions with the @benchmark decorator. A setup function builds its inputs and returns the zero-argument callable that is timed.
+Run them with 'python -m benchmarks run', or compare two git revisions with 'python -m benchmarks compare <base> [<target>]'.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import fnmatch
+import gc
+from importlib import import_module
+import pkgutil
+import timeit
+import tracemalloc
+from typing import Any, Callable, Optional, Union
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark. Its setup function returns the callable to measure."""
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+@dataclass
+class Result:
+    """The best time per call in seconds over all repeats, and the peak memory in bytes allocated by a single call."""
+    name: str
+    seconds: float
+    peak_bytes: int
+    number: int
+
+
+@dataclass
+class Failure:
+    """A benchmark that raised while being set up or measured, with the type and message of the exception."""
+    name: str
+    error: str
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+    """Register the decorated setup function under the given name. The function is returned unchanged."""
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in REGISTRY:
+            raise ValueError(f"A benchmark named {repr(name)} is already registered.")
+
+        REGISTRY[name] = Benchmark(name=name, setup=setup)
+        return setup
+
+    return decorator
+
+
+def discover() -> dict[str, Benchmark]:
+    """Import every 'bench_*' module in this package so that its benchmarks are registered, and return the registry."""
+    for module in pkgutil.iter_modules(__path__):
+        if module.name.startswith("bench_"):
+            import_module(f"{__name__}.{module.name}")
+
+    return REGISTRY
+
+
+def measure(bench: Benchmark, repeat: int = 7, min_time: float = 0.2) -> Result:
+    """
+    Time a benchmark with timeit, calibrating the number of calls per repeat so that each repeat takes at least 'min_time' seconds, and keep the fastest repeat, which is the least disturbed by the rest of the system.
+    Garbage collection is disabled while timing, as with timeit. Memory is measured separately with tracemalloc, over one call.
+    """
+    func = bench.setup()
+    func()
+
+    timer = timeit.Timer(func)
+    number = 1
+    if min_time > 0:
+        while (elapsed := timer.timeit(number)) < min_time:
+            number = number * 10 if elapsed == 0 else max(number * 2, int(number * min_time / elapsed * 1.2))
+
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(name=bench.name, seconds=seconds, peak_bytes=peak_bytes, number=number)
+
+
+def run(pattern: str = "*", repeat: int = 7, min_time: float = 0.2, on_result: Optional[Callable[[Union[Result, Failure]], None]] = None) -> dict[str, Union[Result, Failure]]:
+    """
+    Run every registered benchmark whose name matches the glob pattern, in name order. Benchmarks that fail with an ImportError are skipped, since older revisions of subtypes may not have the API that they measure.
+    Any other exception is returned as a Failure rather than being swallowed.
+    """
+    results = {}
+    for name, bench in sorted(discover().items()):
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+
+        try:
+            result = measure(bench, repeat=repeat, min_time=min_time)
+        except ImportError:
+            continue
+        except Exception as ex:
+            result = Failure(name=name, error=f"{type(ex).__name__}: {ex}")
+
+        results[name] = result
+        if on_result is not None:
+            on_result(result)
+
+    return results
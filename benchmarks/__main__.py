@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+from typing import Union
+
+from . import Failure, Result, run
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def format_result(result: Union[Result, Failure]) -> str:
+    if isinstance(result, Failure):
+        return f"{result.name:45} FAILED: {result.error}"
+
+    return f"{result.name:45} {result.seconds * 1e6:12.2f}us {result.peak_bytes / 1024:10.1f}KiB"
+
+
+def run_command(args: argparse.Namespace) -> int:
+    if args.path is not None:
+        sys.path.insert(0, str(Path(args.path).resolve()))
+
+    results = run(pattern=args.filter, repeat=args.repeat, min_time=args.min_time, on_result=None if args.quiet else lambda result: print(format_result(result), flush=True))
+
+    if args.output is not None:
+        Path(args.output).write_text(json.dumps({name: asdict(result) for name, result in results.items()}, indent=4))
+
+    return 1 if any(isinstance(result, Failure) for result in results.values()) else 0
+
+
+def measure_revision(revision: str | None, args: argparse.Namespace, directory: Path) -> dict[str, dict]:
+    """
+    Run the benchmarks of this tree against the subtypes package of the given git revision (checked out in a temporary worktree), or of this tree if the revision is None.
+    Benchmarks that failed are kept in the results, with an 'error' entry in place of the measurements.
+    """
+    output = directory / f"{revision or 'working-tree'}.json".replace("/", "_")
+    command = [sys.executable, "-m", "benchmarks", "run", "--quiet", "--filter", args.filter, "--repeat", str(args.repeat), "--min-time", str(args.min_time), "--output", str(output)]
+
+    if revision is None:
+        process = subprocess.run(command, cwd=ROOT)
+    else:
+        worktree = directory / "worktree"
+        subprocess.run(["git", "worktree", "add", "--detach", "--quiet", str(worktree), revision], cwd=ROOT, check=True)
+        try:
+            process = subprocess.run([*command, "--path", str(worktree)], cwd=ROOT, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"})
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], cwd=ROOT, check=True)
+
+    # The run exits with status 1 when some benchmarks failed, which are recorded in its output, so only a run that wrote no output is an error here.
+    if not output.exists():
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+
+    return json.loads(output.read_text())
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        base = measure_revision(args.base, args, Path(directory))
+        target = measure_revision(args.target, args, Path(directory))
+
+    print(f"{'benchmark':45} {args.base:>14} {args.target or 'working tree':>14} {'change':>9} {'peak memory':>27}")
+
+    slower, failed = [], []
+    for name in sorted(base.keys() | target.keys()):
+        if "error" in target.get(name, {}):
+            print(f"{name:45} FAILED in target: {target[name]['error']}")
+            failed.append(name)
+            continue
+
+        if "error" in base.get(name, {}):
+            print(f"{name:45} failed in base: {base[name]['error']}")
+            continue
+
+        if name not in base or name not in target:
+            print(f"{name:45} only measured in {'base' if name in base else 'target'}")
+            continue
+
+        change = target[name]["seconds"] / base[name]["seconds"] - 1
+        flag = "  SLOWER" if change > args.threshold else ("  faster" if change < -args.threshold else "")
+        memory = f"{base[name]['peak_bytes'] / 1024:10.1f}KiB -> {target[name]['peak_bytes'] / 1024:10.1f}KiB"
+        print(f"{name:45} {base[name]['seconds'] * 1e6:12.2f}us {target[name]['seconds'] * 1e6:12.2f}us {change:+9.1%} {memory}{flag}")
+
+        if change > args.threshold:
+            slower.append(name)
+
+    if slower:
+        print(f"\n{len(slower)} benchmark(s) slowed down by more than {args.threshold:.0%}: {', '.join(slower)}")
+
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) failed in the target: {', '.join(failed)}")
+
+    return 1 if slower or failed else 0
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the subtypes benchmarks, or compare them between two git revisions.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--filter", default="*", help="Only run the benchmarks whose names match this glob pattern.")
+    common.add_argument("--repeat", type=int, default=7, help="Number of timed repeats, of which the fastest is kept.")
+    common.add_argument("--min-time", type=float, default=0.2, help="Minimum duration in seconds of each repeat.")
+
+    run_parser = subparsers.add_parser("run", parents=[common], help="Run the benchmarks against the current tree, exiting with status 1 if any failed.")
+    run_parser.add_argument("--output", help="Write the results to this json file.")
+    run_parser.add_argument("--path", help="Import subtypes from this directory instead.")
+    run_parser.add_argument("--quiet", action="store_true", help="Do not print the results.")
+    run_parser.set_defaults(func=run_command)
+
+    compare_parser = subparsers.add_parser("compare", parents=[common], help="Compare the benchmarks between two git revisions, exiting with status 1 if any slowed down beyond the threshold or failed in the target.")
+    compare_parser.add_argument("base", help="The git revision to compare against.")
+    compare_parser.add_argument("target", nargs="?", help="The git revision to compare. Defaults to the working tree.")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown beyond which a benchmark is flagged (default: 0.1, i.e. 10%%).")
+    compare_parser.set_defaults(func=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
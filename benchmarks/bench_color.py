@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from subtypes import Color
+
+from . import benchmark
+
+
+@benchmark("color.from_name")
+def color_from_name():
+    return lambda: Color("darkslateblue")
+
+
+@benchmark("color.get_rgb")
+def color_get_rgb():
+    color = Color("darkslateblue")
+    return lambda: color.get_rgb()
+
+
+@benchmark("color.hex")
+def color_hex():
+    color = Color("darkslateblue")
+    return lambda: color.hex_l
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from subtypes import Date, DateTime
+
+from . import benchmark
+
+
+@benchmark("datetime.from_isoformat")
+def datetime_from_isoformat():
+    return lambda: DateTime.from_isoformat("2021-03-04 05:06:07")
+
+
+@benchmark("datetime.from_string")
+def datetime_from_string():
+    return lambda: DateTime.from_string("March 4th 2021 5:06pm")
+
+
+@benchmark("datetime.to_format")
+def datetime_to_format():
+    value = DateTime(2021, 3, 4, 5, 6, 7)
+    return lambda: value.to_format("%Y-%m-%d %H:%M:%S")
+
+
+@benchmark("datetime.shift")
+def datetime_shift():
+    value = DateTime(2021, 3, 4, 5, 6, 7)
+    return lambda: value.shift(months=1, days=-3, hours=5)
+
+
+@benchmark("date.shift")
+def date_shift():
+    value = Date(2021, 3, 4)
+    return lambda: value.shift(years=1, weeks=-2)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+from subtypes import Dict, List
+
+from . import benchmark
+
+
+RECORD = {f"field_{index}": {"value": index, "tags": [f"tag_{index}", "common"], "nested": {"flag": index % 2 == 0}} for index in range(100)}
+
+
+@benchmark("dict.construct")
+def dict_construct():
+    return lambda: Dict(RECORD)
+
+
+@benchmark("dict.attribute")
+def dict_attribute():
+    record = Dict(RECORD)
+    return lambda: [record.field_50 for _ in range(100)]
+
+
+@benchmark("dict.re.filter")
+def dict_re_filter():
+    record = Dict(RECORD)
+    return lambda: record.re.filter(r"field_[1-3]\d")
+
+
+@benchmark("dict.json_roundtrip")
+def dict_json_roundtrip():
+    text = json.dumps(RECORD)
+    return lambda: Dict.from_json(text).to_json()
+
+
+def _nested(depth: int, width: int) -> dict:
+    return {f"key_{index}": _nested(depth - 1, width) if depth > 1 else index for index in range(width)}
+
+
+NESTED = _nested(5, 8)
+
+
+@benchmark("dict.construct.nested")
+def dict_construct_nested():
+    """4681 nested Dicts, 4 levels below the root and 8 keys wide. Peak memory is mostly the Dicts built, which used to carry an attribute mirror each."""
+    return lambda: Dict(NESTED)
+
+
+@benchmark("dict.attribute.nested")
+def dict_attribute_nested():
+    record = Dict(NESTED)
+    return lambda: [record.key_1.key_2.key_3.key_4.key_5 for _ in range(100)]
+
+
+ROWS = [{"id": index, "name": f"user {index}", "email": f"user{index}@example.com", "active": index % 2 == 0, "score": index * 0.5} for index in range(100_000)]
+
+
+@benchmark("dict.records.as_dicts")
+def dict_records_as_dicts():
+    """100k homogeneous five-field rows held as a List of Dicts, the baseline for dict.records.as_records."""
+    return lambda: List(ROWS)
+
+
+@benchmark("dict.records.as_records")
+def dict_records_as_records():
+    """The same rows converted into slotted records compiled from their keys."""
+    record = Dict.compile_record(ROWS[0])
+    return lambda: List.of_records(ROWS, record=record)
+
+
+@benchmark("dict.diff.equal")
+def dict_diff_equal():
+    """Two equal but distinct trees, as after reloading the same payload, so nothing needs to be walked key by key."""
+    old, new = Dict(NESTED), json.loads(json.dumps(NESTED))
+    return lambda: old.diff(new)
+
+
+@benchmark("dict.diff.one_change")
+def dict_diff_one_change():
+    old, new = Dict(NESTED), json.loads(json.dumps(NESTED))
+    new["key_3"]["key_5"]["key_1"]["key_0"]["key_7"] = -1
+    return lambda: old.diff(new)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from subtypes import Enum
+
+from . import benchmark
+
+
+class Color(Enum):
+    RED = GREEN = BLUE = CYAN = MAGENTA = YELLOW = BLACK = WHITE = Enum.Auto()
+
+
+NAMES = [member.name for member in Color] * 125
+
+
+@benchmark("enum.getitem")
+def enum_getitem():
+    return lambda: [Color[name] for name in NAMES]
+
+
+@benchmark("enum.call_member")
+def enum_call_member():
+    members = [Color[name] for name in NAMES]
+    return lambda: [Color(member) for member in members]
+
+
+@benchmark("enum.eq")
+def enum_eq():
+    member = Color.WHITE
+    return lambda: [member == name for name in NAMES]
+
+
+@benchmark("enum.eq_member")
+def enum_eq_member():
+    member, others = Color.WHITE, [Color[name] for name in NAMES]
+    return lambda: [member == other for other in others]
+
+
+@benchmark("enum.getitem_case_insensitive")
+def enum_getitem_case_insensitive():
+    try:
+        class FoldedColor(Enum, case_insensitive=True):
+            RED = GREEN = BLUE = CYAN = MAGENTA = YELLOW = BLACK = WHITE = Enum.Auto()
+    except TypeError as ex:
+        # Revisions without the 'case_insensitive' class keyword reject it, so report the case as unavailable there.
+        raise AttributeError("case_insensitive") from ex
+
+    names = [name.lower() for name in NAMES]
+    return lambda: [FoldedColor[name] for name in names]
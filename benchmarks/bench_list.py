@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from subtypes import List
+
+from . import benchmark
+
+
+@benchmark("list.index")
+def list_index():
+    items = List(range(10_000))
+    return lambda: [items[index] for index in range(0, 10_000, 10)]
+
+
+@benchmark("list.slice")
+def list_slice():
+    items = List(range(10_000))
+    return lambda: items[100:9_900]
+
+
+@benchmark("list.flatten")
+def list_flatten():
+    items = List([[index, [index, (index, index)]] for index in range(1_000)])
+    return lambda: items.flatten()
+
+
+@benchmark("list.split_into_batches")
+def list_split_into_batches():
+    items = List(range(10_000))
+    return lambda: list(items.split_into_batches(7))
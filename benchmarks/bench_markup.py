@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from subtypes import Html
+
+from . import benchmark
+
+
+def build() -> Html:
+    html = Html()
+    with html:
+        with html.tag.div(attrs={"class": "container"}):
+            for index in range(20):
+                html.tag.p(f"Paragraph {index}", attrs={"id": f"p{index}"})
+
+    return html
+
+
+@benchmark("markup.build")
+def markup_build():
+    return build
+
+
+@benchmark("markup.render")
+def markup_render():
+    html = build()
+    return lambda: str(html)
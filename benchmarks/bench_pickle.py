@@ -0,0 +1,49 @@
+"""
+Pickling 20k translated records, 2k of which have had their accessors used, against the same records as builtins. Payload sizes are not timed; compare them with payload_sizes().
+"""
+
+from __future__ import annotations
+
+import pickle
+
+from subtypes import List
+
+from . import benchmark
+
+
+def _payloads() -> tuple[list, List]:
+    rows = [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "meta": {"active": index % 2 == 0}} for index in range(20_000)]
+    records = List(rows)
+    for record in records[:2_000]:
+        record.re.get_all(r"^na"), record.name.re.search(r"\d+")
+
+    return rows, records
+
+
+def payload_sizes() -> dict[str, int]:
+    """Return the size in bytes of the builtin and translated payloads pickled with the highest protocol."""
+    return {name: len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)) for name, payload in zip(("builtin", "subtypes"), _payloads())}
+
+
+@benchmark("pickle.dumps.builtin")
+def pickle_dumps_builtin():
+    rows, _ = _payloads()
+    return lambda: pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@benchmark("pickle.dumps.subtypes")
+def pickle_dumps_subtypes():
+    _, records = _payloads()
+    return lambda: pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@benchmark("pickle.loads.builtin")
+def pickle_loads_builtin():
+    data = pickle.dumps(_payloads()[0], protocol=pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+@benchmark("pickle.loads.subtypes")
+def pickle_loads_subtypes():
+    data = pickle.dumps(_payloads()[1], protocol=pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
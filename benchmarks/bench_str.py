@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from subtypes import Str
+
+from . import benchmark
+
+
+TEXT = "The quick brown fox jumps over the lazy dog, then naps  in the\tsun. " * 20
+
+
+@benchmark("str.construct")
+def str_construct():
+    return lambda: Str(TEXT)
+
+
+@benchmark("str.accessor")
+def str_accessor():
+    text = Str(TEXT)
+    return lambda: (Str(text).re, Str(text).slice, Str(text).trim, Str(text).case)
+
+
+@benchmark("str.re.sub")
+def str_re_sub():
+    text = Str(TEXT)
+    return lambda: text.re.sub(r"\bfox\b", "cat")
+
+
+@benchmark("str.re.search")
+def str_re_search():
+    text = Str(TEXT)
+    return lambda: text.re.search(r"lazy\s+\w+")
+
+
+@benchmark("str.slice.after_first")
+def str_slice_after_first():
+    text = Str(TEXT)
+    return lambda: text.slice.after_first(r"lazy")
+
+
+@benchmark("str.trim.whitespace_runs")
+def str_trim_whitespace_runs():
+    text = Str(TEXT)
+    return lambda: text.trim.whitespace_runs()
+
+
+@benchmark("str.case.snake")
+def str_case_snake():
+    text = Str("SomeFairlyLongPascalCaseIdentifierWithHTTPAcronym")
+    return lambda: text.case.snake()
+
+
+@benchmark("str.fuzzy.best_n_matches")
+def str_fuzzy_best_n_matches():
+    text, candidates = Str("subtypes benchmark"), [f"benchmark subtype {index}" for index in range(50)]
+    return lambda: text.fuzzy.best_n_matches(candidates)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from subtypes import TranslatableMeta
+
+from . import benchmark
+
+
+@benchmark("translator.translate_recursively.wide")
+def translator_translate_recursively_wide():
+    data = [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "meta": {"active": True}} for index in range(2_000)]
+    return lambda: TranslatableMeta.translator.translate_recursively(data)
+
+
+@benchmark("translator.translate_recursively.deep")
+def translator_translate_recursively_deep():
+    data = node = {}
+    for _ in range(500):
+        node["child"] = node = {"value": "x"}
+
+    return lambda: TranslatableMeta.translator.translate_recursively(data)
+
+
+def _records(count: int) -> list[dict]:
+    return [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "meta": {"active": True, "owner": f"user {index % 10}"}} for index in range(count)]
+
+
+@benchmark("translator.to_builtin.translated")
+def translator_to_builtin_translated():
+    data = TranslatableMeta.translator.translate_recursively(_records(20_000))
+    return lambda: TranslatableMeta.translator.to_builtin(data)
+
+
+@benchmark("translator.to_builtin.builtin")
+def translator_to_builtin_builtin():
+    data = _records(20_000)
+    return lambda: TranslatableMeta.translator.to_builtin(data)
+
+
+@benchmark("translator.to_builtin.naive_walk")
+def translator_to_builtin_naive_walk():
+    """The bare isinstance-based recursive walk that to_builtin is measured against."""
+    def walk(item):
+        if isinstance(item, dict):
+            return {walk(key): walk(val) for key, val in item.items()}
+        elif isinstance(item, list):
+            return [walk(val) for val in item]
+        elif isinstance(item, str):
+            return str.__str__(item)
+
+        return item
+
+    data = TranslatableMeta.translator.translate_recursively(_records(20_000))
+    return lambda: walk(data)
+
+
+@benchmark("translator.to_builtin.very_deep")
+def translator_to_builtin_very_deep():
+    data = node = {}
+    for _ in range(3_000):
+        node["child"] = node = {"value": "x"}
+
+    data = TranslatableMeta.translator.translate_recursively(data)
+    return lambda: TranslatableMeta.translator.to_builtin(data)
+
+
+@benchmark("translator.translate_recursively.wide_keys")
+def translator_translate_recursively_wide_keys():
+    data = {f"key_{index}": {"value": index, "tags": ["a", "b"]} for index in range(50_000)}
+    return lambda: TranslatableMeta.translator.translate_recursively(data)
+
+
+@benchmark("translator.translate_recursively.very_deep")
+def translator_translate_recursively_very_deep():
+    data = node = {}
+    for _ in range(3_000):
+        node["child"] = node = {"value": "x"}
+
+    return lambda: TranslatableMeta.translator.translate_recursively(data)
+
+
+@benchmark("translator.translate_recursively.shared")
+def translator_translate_recursively_shared():
+    """One 1000-item subtree referenced 200 times, which is translated once when sharing is preserved."""
+    shared = [{"id": index, "name": f"item {index}"} for index in range(1_000)]
+    data = {f"ref_{index}": shared for index in range(200)}
+    return lambda: TranslatableMeta.translator.translate_recursively(data)
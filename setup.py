@@ -24,8 +24,9 @@ setup(
       "Intended Audience :: Developers",
       "Programming Language :: Python :: 3.8",
     ],
-    packages=find_packages(exclude=["tests*"]),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     install_requires=dependencies,
+    extras_require={"async": ["aiohttp"]},
     author="Matt GdV",
     author_email="matthewgdv@gmail.com"
 )
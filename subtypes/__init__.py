@@ -1,25 +1,49 @@
+from __future__ import annotations
+
 __all__ = [
-    "Enum",
+    "Enum", "EnumMap", "EnumSet",
     "Html", "Xml",
-    "Http",
+    "Http", "AsyncHttp",
     "NameSpace",
     "Str", "BaseStr",
-    "List", "BaseList",
-    "Dict", "DefaultDict", "BaseDict",
+    "List", "BaseList", "SpillList",
+    "Dict", "DefaultDict", "BaseDict", "FrozenDict", "CacheDict",
+    "SharedList", "SharedDict", "SharedArray",
     "DateTime", "Date", "Time",
     "Process",
     "Color",
     "Translator", "TranslatableMeta", "DoNotTranslateMeta"
 ]
 
-from .enum_ import Enum
-from .markup import Html, Xml
-from .http import Http
+from importlib import import_module
+from typing import Any
+
+from .enum_ import Enum, EnumMap, EnumSet
 from .namespace import NameSpace
 from .translator import Translator, TranslatableMeta, DoNotTranslateMeta
 from .str import Str, BaseStr
-from .list import List, BaseList
-from .dict import Dict, DefaultDict, BaseDict
-from .datetime_ import DateTime, Date, Time
-from .process import Process
-from .color import Color
+from .list import List, BaseList, SpillList
+from .dict import Dict, DefaultDict, BaseDict, FrozenDict, CacheDict
+
+# These submodules pull in heavy third-party dependencies (bs4, requests, colour, parsedatetime...), so they are only imported when one of their names is first accessed.
+_lazy_names = {
+    "Html": "markup", "Xml": "markup",
+    "Http": "http",
+    "AsyncHttp": "async_http",
+    "SharedList": "shared", "SharedDict": "shared", "SharedArray": "shared",
+    "DateTime": "datetime_", "Date": "datetime_", "Time": "datetime_",
+    "Process": "process",
+    "Color": "color",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _lazy_names.get(name)) is None:
+        raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
+
+    globals()[name] = val = getattr(import_module(f".{module}", __name__), name)
+    return val
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_names})
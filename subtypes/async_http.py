@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from base64 import b64encode
+import json
+from typing import Any, Awaitable, Iterable, Optional
+
+try:
+    import aiohttp
+    from multidict import CIMultiDictProxy
+except ImportError as ex:
+    raise ImportError("AsyncHttp requires aiohttp, which is not a core dependency. Install it with: pip install pysubtypes[async]", name=ex.name) from ex
+
+from .http import BaseHttp
+from .translator import TranslatableMeta
+
+
+class AsyncResponse:
+    """A fully-read response from AsyncHttp. Its body has already been read and its connection released, so it can be used outside the request and outside the event loop."""
+
+    def __init__(self, response: aiohttp.ClientResponse, content: bytes) -> None:
+        self.status_code, self.reason, self.url, self.method = response.status, response.reason, str(response.url), response.method
+        self.headers: CIMultiDictProxy = response.headers
+        self.encoding, self.content = response.get_encoding() if content else "utf-8", content
+        self._response = response
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status_code}]>"
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        """Returns Str, List, and Dict items rather than their builtin superclasses. If there is no data will return None rather than raising JSONDecodeError."""
+        try:
+            return TranslatableMeta.translator.translate(json.loads(self.content))
+        except json.JSONDecodeError:
+            return None
+
+    def raise_for_status(self) -> None:
+        self._response.raise_for_status()
+
+
+class AsyncHttp(BaseHttp):
+    """
+    An asyncio http client which takes a 'base_url' constructor argument and prepends it to all future requests, in the same way as Http.
+    It returns Str, List, and Dict instances when deserializing json from responses and can automatically quote all urls passed to its http methods.
+    All requests share one aiohttp connection pool of at most 'limit' connections ('limit_per_host' per host, 0 meaning no per-host limit), and at most 'concurrency' requests are in flight at once, the rest waiting on a semaphore.
+    'timeout' is the default total timeout in seconds of each request, which any request can override. The session is created on first use inside the running event loop. Use it as an async context manager, or await AsyncHttp.close().
+    """
+
+    Error, Response = aiohttp.ClientResponseError, AsyncResponse
+
+    def __init__(self, base_url: str = "", auth: tuple[str, str] = None, quote_level: AsyncHttp.QuoteLevel = BaseHttp.QuoteLevel.NONE,
+                 concurrency: int = 100, limit: int = 100, limit_per_host: int = 0, timeout: float = None, headers: dict = None) -> None:
+        self.base_url, self.auth, self.quote_level = base_url.strip('/'), auth, quote_level
+        self.concurrency, self.limit, self.limit_per_host, self.timeout, self.headers = concurrency, limit, limit_per_host, timeout, dict(headers or {})
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base_url={repr(self.base_url)}, auth={repr(self.auth)}, headers={repr(self.headers)})"
+
+    async def __aenter__(self) -> AsyncHttp:
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
+        await self.close()
+
+    async def request(self, method: str, url: str, timeout: float = None, **kwargs: Any) -> AsyncResponse:
+        """Make a request, waiting for a free slot if 'concurrency' requests are already in flight. Any other keyword arguments are passed to aiohttp.ClientSession.request()."""
+        session = self._ensure_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else session.timeout
+
+        async with self._semaphore:
+            async with session.request(method, self._url(url), timeout=request_timeout, **kwargs) as response:
+                return self.Response(response, await response.read())
+
+    async def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("OPTIONS", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def gather(self, requests: Iterable[Awaitable], return_exceptions: bool = False) -> list[Any]:
+        """Await the given requests concurrently (bounded by the concurrency semaphore) and return their results in the same order."""
+        return list(await asyncio.gather(*requests, return_exceptions=return_exceptions))
+
+    async def request_many(self, method: str, urls: Iterable[str], return_exceptions: bool = False, **kwargs: Any) -> list[Any]:
+        """Make the same kind of request to each of the urls concurrently and return the responses in the same order as the urls."""
+        return await self.gather([self.request(method, url, **kwargs) for url in urls], return_exceptions=return_exceptions)
+
+    async def get_many(self, urls: Iterable[str], return_exceptions: bool = False, **kwargs: Any) -> list[Any]:
+        """GET each of the urls concurrently and return the responses in the same order as the urls."""
+        return await self.request_many("GET", urls, return_exceptions=return_exceptions, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session and its connection pool. A new session is created if this client is used again."""
+        if self._session is not None:
+            session, self._session, self._semaphore = self._session, None, None
+            await session.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=self.headers if self.auth is None else {"Authorization": f"Basic {b64encode(':'.join(self.auth).encode()).decode()}", **self.headers},
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        return self._session
@@ -6,6 +6,7 @@ from typing import Any, Union
 from dateutil.relativedelta import relativedelta
 
 from functools import cached_property
+from ..instrumentation import instrumented
 from .mixin import MetaInfoMixin
 from .accessor import YearAccessor, MonthAccessor, DayAccessor, WeekAccessor, WeekDayAccessor
 
@@ -81,6 +82,7 @@ class Date(dt.date, MetaInfoMixin):
         return DateTime.strptime(date_string, format_string).date()
 
     @classmethod
+    @instrumented
     def from_string(cls, text: str) -> Date:
         """Attempt to parse a string of text into a Date."""
         val, code = cls._calendar.parse(text)
@@ -92,6 +94,7 @@ class Date(dt.date, MetaInfoMixin):
         return cls(year, month, day)
 
     @classmethod
+    @instrumented
     def infer(cls, datelike: Union[dt.datetime, dt.date, int, str]) -> Date:
         """Create a Date from a valid python object. Raises TypeError if an unsupported type is passed. Raises ValueError if an invalid instance of a supported type (like 'str' or 'int') is passed."""
         if isinstance(datelike, dt.datetime):
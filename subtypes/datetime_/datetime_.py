@@ -6,6 +6,7 @@ from typing import Union
 from dateutil.relativedelta import relativedelta
 
 from functools import cached_property
+from ..instrumentation import instrumented
 from .date import Date
 from .time_ import Time
 from .accessor import TimeZoneAccessor, HourAccessor, MinuteAccessor, SecondAccessor, MicroSecondAccessor
@@ -76,6 +77,7 @@ class DateTime(Date, dt.datetime):
         return cls.strptime(date_string, format_string)
 
     @classmethod
+    @instrumented
     def from_string(cls, text: str) -> DateTime:
         """Attempt to parse a string of text into a DateTime."""
         val, code = cls._calendar.parse(text)
@@ -91,6 +93,7 @@ class DateTime(Date, dt.datetime):
         return cls.combine(date=date, time=time, tzinfo=tzinfo)
 
     @classmethod
+    @instrumented
     def infer(cls, datelike: Union[dt.datetime, dt.date, int, str]) -> DateTime:
         """Create a DateTime from a valid python object. Raises TypeError if an unsupported type is passed. Raises ValueError if an invalid instance of a supported type (like 'str' or 'int') is passed."""
         if isinstance(datelike, cls):
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Generic, TypeVar
-from collections.abc import Mapping
+from bisect import bisect_left
+from functools import lru_cache, wraps
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, Sequence, TypeVar, Union
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping, ItemsView, KeysView, Set, ValuesView
 import json
+import operator
+import re
+import threading
+import time
 
+import regex
+
+from .enum_ import Enum, bit_count
+from .instrumentation import instrumented
+from .namespace import NameSpace
 from .str import Str, ReprMixin, RegexAccessor as StrRegexAccessor
 from .translator import TranslatableMeta, DoNotTranslateMeta
 
-from maybe import Maybe
-
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -24,40 +34,437 @@ class AccessError(KeyError, AttributeError):
     pass
 
 
+def literal_prefix(pattern: str) -> Optional[str]:
+    """Return the literal text that any match of this regex must start the string with, or None if the pattern is not anchored to the start by a literal prefix."""
+    if pattern.startswith("^"):
+        body = pattern[1:]
+    elif pattern.startswith(r"\A"):
+        body = pattern[2:]
+    else:
+        return None
+
+    if "|" in body or "(?" in body:
+        return None
+
+    prefix = []
+    for char in body:
+        if char in KeyIndex.special_chars:
+            break
+
+        prefix.append(char)
+
+    if prefix and len(prefix) < len(body) and body[len(prefix)] in "*?{":
+        prefix.pop()
+
+    return "".join(prefix) or None
+
+
+class KeyIndex:
+    """A sorted index over the string keys of a Dict, used to serve regexes anchored by a literal prefix without searching every key."""
+
+    special_chars = frozenset(".^$*+?{}[]\\|()")
+    min_size = 64
+
+    def __init__(self, keys: Iterable[Any], ignorecase: bool) -> None:
+        self.ignorecase = ignorecase
+
+        entries, self.multiline_entries = [], []
+        for position, key in enumerate(keys):
+            if isinstance(key, str):
+                (entries if "\n" not in key else self.multiline_entries).append((self._fold(key), position, key))
+
+        entries.sort()
+        self.entries, self.folded = entries, [folded for folded, _, _ in entries]
+
+    def candidates(self, prefix: str) -> Optional[list[str]]:
+        """Return, in insertion order, the keys that could match a regex with this literal prefix, or None if the index cannot narrow them down."""
+        if self.ignorecase and not prefix.isascii():
+            return None
+
+        folded = self._fold(prefix)
+        matches = list(self.multiline_entries)
+
+        for index in range(bisect_left(self.folded, folded), len(self.folded)):
+            if not self.folded[index].startswith(folded):
+                break
+
+            matches.append(self.entries[index])
+
+        return [key for _, key in sorted((position, key) for _, position, key in matches)]
+
+    def _fold(self, text: str) -> str:
+        return text.casefold() if self.ignorecase else text
+
+
 class RegexAccessor(ReprMixin):
     """An accessor class for all regex-related Dict methods"""
 
-    def __init__(self, parent: Dict = None) -> None:
-        self.parent, self.settings = parent, StrRegexAccessor.Settings()
+    def __init__(self, parent: Dict = None, settings: StrRegexAccessor.Settings = None) -> None:
+        self.parent, self.settings = parent, settings if settings is not None else StrRegexAccessor.Settings()
 
     def __call__(self, dotall: bool = None, ignorecase: bool = None, multiline: bool = None) -> RegexAccessor:
-        self.settings.dotall = Maybe(dotall).else_(self.settings.dotall)
-        self.settings.ignorecase = Maybe(ignorecase).else_(self.settings.ignorecase)
-        self.settings.multiline = Maybe(multiline).else_(self.settings.multiline)
-        return self
+        """Return a new accessor with the given settings changed. This accessor and its settings are left as they are."""
+        return type(self)(parent=self.parent, settings=self.settings.derive(dotall=dotall, ignorecase=ignorecase, multiline=multiline))
 
+    @instrumented
     def filter(self, regex: str) -> Dict:
         """Remove any key-value pairs where the key is not a string, or where it is a string but doesn't match the given regex."""
-        return type(self.parent)(
-            {key: val for key, val in self.parent.items()
-             if isinstance(key, str) and Str(key).re(dotall=self.settings.dotall,
-                                                     ignorecase=self.settings.ignorecase,
-                                                     multiline=self.settings.multiline).search(regex) is not None}
-        )
+        return type(self.parent)({key: dict.__getitem__(self.parent, key) for key in self._matching_keys(regex)})
 
+    @instrumented
     def get_all(self, regex: str, limit: int = None) -> list[Any]:
         """Return a list of all the values whose keys match the given regex."""
-        vals = self.filter(regex)
+        keys = self._matching_keys(regex)
 
-        if limit is not None and len(vals) > limit:
-            raise KeyError(f"Got {len(vals)} matches: {', '.join([repr(val) for val in vals])}. Expected at most {limit} match(es).")
+        if limit is not None and len(keys) > limit:
+            raise KeyError(f"Got {len(keys)} matches: {', '.join([repr(key) for key in keys])}. Expected at most {limit} match(es).")
         else:
-            return list(vals.values())
+            return [dict.__getitem__(self.parent, key) for key in keys]
 
+    @instrumented
     def get_one(self, regex: str) -> Any:
         """Return the value whose key matches the given regex. KeyError will be raised if multiple matches are found."""
         return self.get_all(regex=regex, limit=1)[0]
 
+    def _matching_keys(self, pattern: str) -> list[str]:
+        flags = self.settings.to_flag()
+        compiled = regex.compile(pattern, flags)
+
+        keys = None
+        if (prefix := literal_prefix(pattern)) is not None and len(self.parent) >= KeyIndex.min_size:
+            keys = self.parent._key_index_(ignorecase=bool(flags & re.IGNORECASE)).candidates(prefix)
+
+        if keys is None:
+            keys = [key for key in self.parent if isinstance(key, str)]
+
+        return [key for key in keys if compiled.search(key) is not None]
+
+
+class KeyPath:
+    """
+    A compiled path expression such as 'data.items[*].price.amount', which is parsed once and can then be evaluated against (or used to set values within) any number of nested mappings and sequences.
+    Supports attribute-style keys, quoted keys (['some.key']), integer indices ([0], [-1]) and wildcards ([*] or .*), which fan out over every element of a sequence or every value of a mapping.
+    """
+
+    KEY, INDEX, ALL = "key", "index", "all"
+    MISSING = object()
+
+    _token = re.compile(r"""\[(?:(-?\d+)|(\*)|"([^"]*)"|'([^']*)')\]|(\.)|([^.\[\]]+)""")
+
+    def __init__(self, expression: str) -> None:
+        self.expression, self.steps = expression, self._parse(expression)
+        self.has_wildcard = any(kind == self.ALL for kind, _ in self.steps)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({repr(self.expression)})"
+
+    def __str__(self) -> str:
+        return self.expression
+
+    def __call__(self, item: Any, default: Any = MISSING) -> Any:
+        return self.get(item, default=default)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def compile(cls, expression: str) -> KeyPath:
+        """Return the compiled KeyPath for this expression, reusing a cached one if this expression has been compiled before."""
+        return cls(expression)
+
+    def get(self, item: Any, default: Any = MISSING) -> Any:
+        """Evaluate this path against the given item. Wildcards produce a List of results. If a key or index is missing, return the default if one was given, otherwise raise AccessError."""
+        return self._get(item, 0, default) if self.has_wildcard else self._get_simple(item, default)
+
+    def column(self, items: Iterable[Any], default: Any = MISSING) -> list[Any]:
+        """Evaluate this path against every item of an iterable (such as a List of Dicts) in one pass, returning the results in order."""
+        get = self.get
+        return [get(item, default) for item in items]
+
+    def set(self, item: Any, value: Any) -> Any:
+        """Set the value at this path within the given item, creating any missing intermediate mappings as Dicts. Wildcards set the value for every element they fan out over. Returns the item."""
+        self._set(item, 0, value)
+        return item
+
+    def _get_simple(self, item: Any, default: Any) -> Any:
+        for kind, key in self.steps:
+            try:
+                item = dict.__getitem__(item, key) if isinstance(item, dict) else list.__getitem__(item, key) if isinstance(item, list) else item[key]
+            except (KeyError, IndexError, TypeError):
+                return self._missing(key, default)
+
+        return item
+
+    def _get(self, item: Any, start: int, default: Any) -> Any:
+        for position in range(start, len(self.steps)):
+            kind, key = self.steps[position]
+
+            if kind == self.ALL:
+                if (children := self._children(item)) is None:
+                    return self._missing("*", default)
+
+                return Dict.translator.translate([self._get(child, position + 1, default) for child in children])
+
+            try:
+                item = dict.__getitem__(item, key) if isinstance(item, dict) else list.__getitem__(item, key) if isinstance(item, list) else item[key]
+            except (KeyError, IndexError, TypeError):
+                return self._missing(key, default)
+
+        return item
+
+    def _set(self, item: Any, start: int, value: Any) -> None:
+        for position in range(start, len(self.steps) - 1):
+            kind, key = self.steps[position]
+
+            if kind == self.ALL:
+                if (children := self._children(item)) is None:
+                    raise AccessError(f"Cannot fan out over {repr(item)} while evaluating {self}.")
+
+                for child in children:
+                    self._set(child, position + 1, value)
+                return
+
+            if kind == self.KEY and isinstance(item, Mapping) and key not in item:
+                item[key] = Dict()
+
+            item = dict.__getitem__(item, key) if isinstance(item, dict) else item[key]
+
+        kind, key = self.steps[-1]
+        if kind == self.ALL:
+            for index_or_key in (list(item) if isinstance(item, Mapping) else range(len(item))):
+                item[index_or_key] = Dict.translator.translate(value)
+        else:
+            item[key] = Dict.translator.translate(value)
+
+    def _missing(self, key: Any, default: Any) -> Any:
+        if default is self.MISSING:
+            raise AccessError(f"{repr(key)} not found while evaluating {self}.")
+
+        return default
+
+    @staticmethod
+    def _children(item: Any) -> Optional[Iterable[Any]]:
+        """Return the values a wildcard fans out over, or None if the item is not a container (None, a scalar or a str), so that it counts as missing."""
+        if isinstance(item, Mapping):
+            return item.values()
+        elif isinstance(item, (Sequence, Set)) and not isinstance(item, (str, bytes, bytearray)):
+            return item
+
+        return None
+
+    @classmethod
+    def _parse(cls, expression: str) -> list[tuple[str, Any]]:
+        steps, position, expect_name = [], 0, True
+
+        while position < len(expression):
+            if (match := cls._token.match(expression, position)) is None:
+                raise ValueError(f"Invalid path expression {repr(expression)} at position {position}.")
+
+            index, wildcard, double_quoted, single_quoted, dot, name = match.groups()
+
+            if dot is not None:
+                if expect_name:
+                    raise ValueError(f"Invalid path expression {repr(expression)}, unexpected '.' at position {position}.")
+                expect_name = True
+            elif name is not None:
+                if not expect_name:
+                    raise ValueError(f"Invalid path expression {repr(expression)}, expected '.' or '[' at position {position}.")
+                steps.append((cls.ALL, None) if name == "*" else (cls.KEY, name))
+                expect_name = False
+            else:
+                if expect_name and steps:
+                    raise ValueError(f"Invalid path expression {repr(expression)}, expected a key at position {position}.")
+
+                if index is not None:
+                    steps.append((cls.INDEX, int(index)))
+                elif wildcard is not None:
+                    steps.append((cls.ALL, None))
+                else:
+                    steps.append((cls.KEY, double_quoted if double_quoted is not None else single_quoted))
+                expect_name = False
+
+            position = match.end()
+
+        if not steps or expect_name:
+            raise ValueError(f"Invalid path expression {repr(expression)}.")
+
+        return steps
+
+
+def _merge_copy(item: Any) -> Any:
+    """
+    Translate a value being merged in by Dict.deep_update(), copying any mappings, lists and tuples nested within it so that the merged Dict never shares a mutable container with the mapping it was merged from.
+    Nested Dicts keep their own type (so DefaultDict subtrees still auto-vivify) and other mappings become Dicts. The copy is built with an explicit stack rather than recursion.
+    """
+    translate, root, tuples = TranslatableMeta.translator.translate, [], []
+    stack = [(item, root, 0)]
+
+    while stack:
+        source, parent, key = stack.pop()
+
+        # Children are pushed in reverse so that they are popped, and therefore inserted into their copied parent, in their original order.
+        if isinstance(source, Mapping):
+            copy = (type(source) if isinstance(source, Dict) and not isinstance(source, CacheDict) else Dict)()
+            stack.extend([(val, copy, child_key) for child_key, val in reversed(list(source.items()))])
+        elif isinstance(source, list) or type(source) is tuple:
+            copy = translate([]) if isinstance(source, list) else []
+            stack.extend([(source[index], copy, index) for index in range(len(source) - 1, -1, -1)])
+
+            if type(source) is tuple:
+                tuples.append((copy, parent, key))
+        else:
+            copy = translate(source)
+
+        # Copies are already translated (tuples are still lists at this point), so they are inserted as they are.
+        if isinstance(parent, list):
+            list.append(parent, copy)
+        else:
+            dict.__setitem__(parent, key, copy)
+
+    # Tuples are collected as lists, and are frozen innermost first once all their items are in place.
+    for copy, parent, key in reversed(tuples):
+        parent[key] = tuple(copy)
+
+    return root[0]
+
+
+def _merge_append(current: Any, new: Any) -> Any:
+    if not (isinstance(current, list) and isinstance(new, (list, tuple))):
+        return new
+
+    current.extend([_merge_copy(item) for item in new])
+    return current
+
+
+def _merge_union(current: Any, new: Any) -> Any:
+    if not (isinstance(current, list) and isinstance(new, (list, tuple))):
+        return new
+
+    try:
+        seen = set(current)
+        for item in new:
+            if item not in seen:
+                seen.add(item)
+                current.append(_merge_copy(item))
+    except TypeError:
+        for item in new:
+            if item not in current:
+                current.append(_merge_copy(item))
+
+    return current
+
+
+class Record(Mapping):
+    """
+    Base class for the __slots__-backed record classes generated by Dict.compile_record(). Each instance stores one value per field and no per-instance hash table.
+    Fields can be read and written through both attribute and item access, and records compare equal to mappings with the same items.
+    """
+
+    __slots__ = ()
+
+    _fields_: tuple[str, ...] = ()
+    _field_set_: frozenset[str] = frozenset()
+    _setters_: tuple[Callable, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        if len(args) + len(kwargs) != len(self._fields_) or len(args) > len(self._fields_):
+            raise TypeError(f"{type(self).__name__} expects exactly these fields: {', '.join(self._fields_)}.")
+
+        translate = Dict.translator.translate
+        for setter, val in zip(self._setters_, args):
+            setter(self, translate(val))
+
+        for name, val in kwargs.items():
+            if name not in self._field_set_ or name in self._fields_[:len(args)]:
+                raise TypeError(f"Unexpected or duplicate field '{name}' for {type(self).__name__}, expected: {', '.join(self._fields_)}.")
+            setattr(self, name, translate(val))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join([f'{name}={repr(getattr(self, name))}' for name in self._fields_])})"
+
+    def __len__(self) -> int:
+        return len(self._fields_)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields_)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._field_set_
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set_:
+            raise AccessError(f"'{key}' not found in {type(self).__name__}: {self}")
+
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        if key not in self._field_set_:
+            raise AccessError(f"'{key}' is not a field of {type(self).__name__}, expected one of: {', '.join(self._fields_)}.")
+
+        setattr(self, key, Dict.translator.translate(val))
+
+    def __reduce__(self) -> tuple:
+        return _rebuild_record, (self._fields_, type(self).__name__, tuple(getattr(self, name) for name in self._fields_))
+
+    def to_dict(self) -> Dict:
+        """Create a Dict with the same items as this record."""
+        return Dict(zip(self._fields_, self.values()))
+
+    @classmethod
+    def from_dict(cls, mapping: Mapping) -> Record:
+        """Create a record from a mapping holding (at least) all of this record's fields."""
+        record = cls.__new__(cls)
+
+        if isinstance(mapping, Dict):
+            for setter, name in zip(cls._setters_, cls._fields_):
+                setter(record, dict.__getitem__(mapping, name))
+        else:
+            translate = Dict.translator.translate
+            for setter, name in zip(cls._setters_, cls._fields_):
+                setter(record, translate(mapping[name]))
+
+        return record
+
+    def to_json(self, indent: int = 4, **kwargs: Any) -> str:
+        return json.dumps(dict(zip(self._fields_, self.values())), indent=indent, **kwargs)
+
+    @classmethod
+    def from_json(cls, json_string: str, **kwargs: Any) -> Record:
+        if isinstance((item := json.loads(json_string, **kwargs)), dict):
+            return cls.from_dict(item)
+        else:
+            raise TypeError(f"The following json string resolves to type '{type(item).__name__}', not type '{dict.__name__}':\n\n{json_string}")
+
+
+_record_classes: dict[tuple[str, tuple[str, ...]], type[Record]] = {}
+
+
+def _rebuild_record(fields: tuple[str, ...], name: str, values: tuple) -> Record:
+    return Dict.compile_record(fields, name=name)(*values)
+
+
+class _ItemFirst:
+    """
+    Wraps a public class attribute of a Dict (e.g. a method) so that an item with the same key takes precedence over it on attribute access, as it did when items were mirrored into the instance __dict__.
+    Accessing it through the class, or on an instance without such a key, behaves exactly as the wrapped attribute.
+    """
+
+    __slots__ = ("name", "attribute", "bind")
+
+    def __init__(self, name: str, attribute: Any) -> None:
+        self.name, self.attribute, self.bind = name, attribute, getattr(type(attribute), "__get__", None)
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is not None and dict.__contains__(instance, self.name):
+            return instance[self.name]
+
+        return self.attribute if self.bind is None else self.bind(self.attribute, instance, owner)
+
+    @classmethod
+    def wrap_namespace(cls, dict_cls: type) -> None:
+        """Wrap every public attribute defined directly on the given Dict class, other than 'dict' methods and data descriptors such as properties, which take precedence over items."""
+        for name, attribute in list(vars(dict_cls).items()):
+            if not name.startswith("_") and name not in dict_fields and not isinstance(attribute, cls) and not hasattr(type(attribute), "__set__"):
+                setattr(dict_cls, name, cls(name, attribute))
+
 
 class BaseDict(dict):
     """
@@ -72,7 +479,7 @@ class BaseDict(dict):
 
     def update(self, item: Mapping = None, **kwargs) -> BaseDict:
         """Same as dict.update(), but returns self and thus allows chaining."""
-        super().update(item)
+        super().update(item if item is not None else {}, **kwargs)
         return self
 
     def clear(self) -> BaseDict:
@@ -88,11 +495,28 @@ class Dict(BaseDict, Generic[K, V], metaclass=TranslatableMeta):
     """
     Subclass of the builtin 'dict' class with where inplace methods like dict.update() return self and therefore allow chaining.
     Also allows item access dynamically through attribute access. It recursively converts any str, list, and dict instances into Str, List, and Dict.
+    Items are only stored once, in the dict itself, and attribute access serves them straight from the dict. Keys take precedence over methods of the same name, which can still be called through the class (e.g. Dict.to_json(item)).
     """
 
     class Accessors(ReprMixin):
         re = RegexAccessor
 
+    class MergeStrategy(Enum):
+        """How Dict.deep_update() resolves a key present on both sides where the values are not both mappings."""
+        REPLACE = APPEND = UNION = Enum.Auto()
+
+    _merge_resolvers_ = {
+        MergeStrategy.REPLACE: lambda key, current, new: new,
+        MergeStrategy.APPEND: lambda key, current, new: _merge_append(current, new),
+        MergeStrategy.UNION: lambda key, current, new: _merge_union(current, new),
+    }
+    _transient_ = frozenset({"_key_indexes_"})
+    _key_indexes_: Optional[dict[bool, KeyIndex]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _ItemFirst.wrap_namespace(cls)
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
@@ -107,21 +531,40 @@ class Dict(BaseDict, Generic[K, V], metaclass=TranslatableMeta):
             return default
 
     def __setitem__(self, key: K, val: V) -> None:
-        clean_val = type(self).translator.translate(val)
-        super().__setitem__(key, clean_val)
+        if self._key_indexes_ is not None and key not in self:
+            del self._key_indexes_
 
-        if is_valid_for_attribute_actions(key):
-            super().__setattr__(key, clean_val)
+        super().__setitem__(key, type(self).translator.translate(val))
 
     def __delitem__(self, key: K) -> None:
         super().__delitem__(key)
+        self._discard_key_indexes_()
 
-        if is_valid_for_attribute_actions(key):
-            super().__delattr__(key)
+    def __ior__(self, other: Any) -> Dict:
+        for key, val in dict(other).items():
+            self[key] = val
+
+        return self
 
     def __getattr__(self, name: str) -> V:
         return self[name]
 
+    def __reduce__(self) -> tuple:
+        # The items are pickled straight from the dict as key-value pairs, and the instance attributes only as state when there are any.
+        return type(self), (), self.__getstate__(), None, iter(dict.items(self))
+
+    def __getstate__(self) -> Optional[dict]:
+        if not (attributes := vars(self)):
+            return None
+
+        return {name: val for name, val in attributes.items() if name not in self._transient_} or None
+
+    def __setstate__(self, state: dict) -> None:
+        vars(self).update(state)
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *[key for key in self if is_valid_for_attribute_actions(key)]]
+
     def __setattr__(self, name: str, val: V) -> None:
         if name in dict_fields:
             raise AttributeError(f"Cannot assign to attribute '{type(self).__name__}.{name}'.")
@@ -140,18 +583,146 @@ class Dict(BaseDict, Generic[K, V], metaclass=TranslatableMeta):
         else:
             del self[name]
 
+    def update(self, item: Mapping = None, **kwargs: Any) -> Dict:
+        self._discard_key_indexes_()
+        return super().update(item, **kwargs)
+
+    def clear(self) -> Dict:
+        self._discard_key_indexes_()
+        return super().clear()
+
+    def pop(self, *args: Any) -> V:
+        self._discard_key_indexes_()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[K, V]:
+        self._discard_key_indexes_()
+        return super().popitem()
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        self._discard_key_indexes_()
+        return super().setdefault(key, default)
+
     def _factory_(self, name: str) -> Dict:
         raise AccessError(f"'{name}' not found in {type(self).__name__}: {self}")
 
+    def _discard_key_indexes_(self) -> None:
+        if self._key_indexes_ is not None:
+            del self._key_indexes_
+
+    def _key_index_(self, ignorecase: bool) -> KeyIndex:
+        if (indexes := self._key_indexes_) is None:
+            indexes = self._key_indexes_ = {}
+
+        if (index := indexes.get(ignorecase)) is None:
+            index = indexes[ignorecase] = KeyIndex(self, ignorecase=ignorecase)
+
+        return index
+
     def setdefault_lazy(self, key: Any, factory: Callable = None, pass_key: bool = False) -> Any:
         if (val := self.get(key, AccessError)) is AccessError:
             self[key] = val = factory(key) if pass_key else factory()
 
         return val
 
+    def deep_update(self, other: Mapping, strategy: Union[Dict.MergeStrategy, Callable[[Any, Any, Any], Any]] = MergeStrategy.REPLACE) -> Dict:
+        """
+        Recursively merge another mapping into this Dict in place, only descending where both sides hold a mapping. Returns self and thus allows chaining.
+        Other conflicts are resolved by the strategy: REPLACE takes the new value, APPEND extends lists with the new items, UNION extends lists with only the new items not already present.
+        A callable strategy is called as strategy(key, current, new) and its return value is kept. Mappings and lists from the other mapping are copied as they are inserted, so that later merges into this Dict never change it.
+        """
+        resolve = self._merge_resolvers_[type(self).MergeStrategy[strategy]] if isinstance(strategy, (Enum, str)) else strategy
+        stack = [(self, other)]
+
+        while stack:
+            target, source = stack.pop()
+
+            for key, new in source.items():
+                if (current := target.get(key, AccessError)) is AccessError:
+                    target[key] = _merge_copy(new)
+                elif isinstance(current, MutableMapping) and isinstance(new, Mapping):
+                    stack.append((current, new))
+                elif (value := resolve(key, current, new)) is not current:
+                    target[key] = _merge_copy(value) if value is new else value
+
+        return self
+
+    def diff(self, other: Mapping) -> list[dict]:
+        """
+        Return a JSON-Patch-like list of the changes that turn this Dict into the other mapping. Each change is a dict with an 'op' ('add', 'remove' or 'replace'), a 'path' (a list of keys) and, unless removing, a 'value'.
+        Only subtrees that differ are walked: values that are identical or equal (compared in C, without walking them here) are skipped outright, and only nested mappings that differ are compared key by key.
+        """
+        changes, queue = [], [((), self, other)]
+
+        for path, old, new in queue:
+            for key, old_val in old.items():
+                if (new_val := new.get(key, AccessError)) is AccessError:
+                    changes.append({"op": "remove", "path": [*path, key]})
+                elif old_val is new_val or old_val == new_val:
+                    continue
+                elif isinstance(old_val, Mapping) and isinstance(new_val, Mapping):
+                    queue.append(((*path, key), old_val, new_val))
+                else:
+                    changes.append({"op": "replace", "path": [*path, key], "value": new_val})
+
+            for key, new_val in new.items():
+                if key not in old:
+                    changes.append({"op": "add", "path": [*path, key], "value": new_val})
+
+        return changes
+
+    def apply_patch(self, patch: Iterable[Mapping]) -> Dict:
+        """Apply a list of changes produced by Dict.diff() to this Dict in place, through the normal item assignment and deletion paths. Returns self and thus allows chaining."""
+        for change in patch:
+            *parents, key = change["path"]
+
+            target = self
+            for parent in parents:
+                target = target[parent]
+
+            if (op := change["op"]) == "remove":
+                del target[key]
+            elif op in ("add", "replace"):
+                target[key] = change["value"]
+            else:
+                raise ValueError(f"Unknown patch operation {repr(op)}, must be one of: 'add', 'remove', 'replace'.")
+
+        return self
+
+    @staticmethod
+    def compile_record(sample_or_keys: Union[Mapping, Iterable[str]], name: str = "Record") -> type[Record]:
+        """
+        Generate (or reuse) a __slots__-backed Record class whose fields are the keys of the given sample mapping, or the given keys. Instances support the same attribute and item access as a Dict with those keys,
+        but need far less memory, which makes them suitable for large numbers of homogeneous records. See Record.from_dict(), Record.to_dict() and List.of_records().
+        """
+        fields = tuple(sample_or_keys.keys() if isinstance(sample_or_keys, Mapping) else sample_or_keys)
+
+        if (record := _record_classes.get((name, fields))) is None:
+            for field in fields:
+                if not (isinstance(field, str) and field.isidentifier() and not field.startswith("_") and not hasattr(Record, field)):
+                    raise ValueError(f"Cannot use {repr(field)} as a record field, fields must be public identifiers that do not clash with the attributes of {Record.__name__}.")
+
+            if len(set(fields)) != len(fields):
+                raise ValueError(f"Record fields must be unique, got: {', '.join(fields)}.")
+
+            record = type(name, (Record,), {"__slots__": fields, "_fields_": fields, "_field_set_": frozenset(fields)})
+            record._setters_ = tuple(getattr(record, field).__set__ for field in fields)
+            _record_classes[(name, fields)] = record
+
+        return record
+
+    @staticmethod
+    def compile_path(expression: str) -> KeyPath:
+        """Compile a path expression such as 'data.items[*].price.amount' into a reusable KeyPath. See KeyPath for the supported syntax."""
+        return KeyPath.compile(expression)
+
     @property
     def re(self) -> RegexAccessor:
-        return self.Accessors.re(parent=self)
+        return type(self).Accessors.re(parent=self)
+
+    def freeze(self) -> FrozenDict:
+        """Create an immutable, hashable FrozenDict from this Dict, recursively freezing any nested mappings, lists and sets (see FrozenDict.from_dict())."""
+        return FrozenDict.from_dict(self)
 
     def to_json(self, indent: int = 4, **kwargs: Any) -> str:
         return json.dumps(self, indent=indent, **kwargs)
@@ -164,6 +735,532 @@ class Dict(BaseDict, Generic[K, V], metaclass=TranslatableMeta):
             raise TypeError(f"The following json string resolves to type '{type(item).__name__}', not type '{dict.__name__}':\n\n{json_string}")
 
 
+_ItemFirst.wrap_namespace(Dict)
+
+
 class DefaultDict(Dict, metaclass=DoNotTranslateMeta):
     def _factory_(self, name: str) -> DefaultDict:
         return type(self)()
+
+    def accumulate(self, items: Iterable[tuple[Union[str, Sequence], Any]], operation: Callable[[Any, Any], Any] = operator.add) -> DefaultDict:
+        """
+        Build an aggregation tree from an iterable of (path, value) pairs in a single pass. Returns self and thus allows chaining.
+        A path is either a sequence of keys or a dot-separated string. Missing branches are created, and each value is combined with any existing leaf value using the operation (addition by default).
+        """
+        cls, missing, translate, set_existing = type(self), AccessError, type(self).translator.translate, dict.__setitem__
+
+        for path, val in items:
+            keys = path.split(".") if isinstance(path, str) else path
+            node = self
+
+            for key in keys[:-1]:
+                if (child := dict.get(node, key, missing)) is missing:
+                    node[key] = child = cls()
+                node = child
+
+            if (current := dict.get(node, leaf := keys[-1], missing)) is missing:
+                node[leaf] = val
+            else:
+                set_existing(node, leaf, translate(operation(current, val)))
+
+        return self
+
+
+class CacheDict(Dict, metaclass=DoNotTranslateMeta):
+    """
+    A Dict that acts as a bounded cache. Once it holds more than 'max_size' items the least recently used ones are evicted, and items older than 'ttl' seconds are treated as missing.
+    CacheDict.setdefault_lazy() is single-flight: when several threads miss on the same key at once, the factory runs only once and the other threads wait for its result.
+    Hit, miss and eviction counts are available from CacheDict.cache_info(), and CacheDict.memoize() provides a decorator form. Item and attribute access work as in Dict.
+    """
+
+    _transient_ = Dict._transient_ | {"_inflight_", "_lock_"}
+
+    def __init__(self, *args: Any, max_size: int = None, ttl: float = None, **kwargs: Any) -> None:
+        self._max_size_, self._ttl_, self._expires_, self._inflight_, self._lock_ = max_size, ttl, OrderedDict(), {}, threading.RLock()
+        self._stats_ = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        # Unpickling calls CacheDict() first, which creates fresh locks, so only the items that have not expired and the limits and bookkeeping are pickled.
+        with self._lock_:
+            self._purge_()
+            return type(self), (), self.__getstate__(), None, iter(list(dict.items(self)))
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock_:
+            if (val := self._lookup_(key)) is AccessError:
+                return super().__getitem__(key)
+
+            return val
+
+    def __setitem__(self, key: K, val: V) -> None:
+        with self._lock_:
+            if dict.__contains__(self, key):
+                dict.__delitem__(self, key)
+
+            super().__setitem__(key, val)
+
+            if self._ttl_ is not None:
+                self._expires_[key] = time.monotonic() + self._ttl_
+                self._expires_.move_to_end(key)
+
+            while self._max_size_ is not None and len(self) > self._max_size_:
+                self._evict_(next(iter(self)))
+                self._stats_["evictions"] += 1
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock_:
+            super().__delitem__(key)
+            self._expires_.pop(key, None)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock_:
+            return dict.__contains__(self, key) and not self._is_expired_(key)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock_:
+            self._purge_()
+            return super().__iter__()
+
+    def __len__(self) -> int:
+        with self._lock_:
+            self._purge_()
+            return super().__len__()
+
+    def keys(self) -> KeysView[K]:
+        with self._lock_:
+            self._purge_()
+            return super().keys()
+
+    def values(self) -> ValuesView[V]:
+        with self._lock_:
+            self._purge_()
+            return super().values()
+
+    def items(self) -> ItemsView[K, V]:
+        with self._lock_:
+            self._purge_()
+            return super().items()
+
+    def get(self, key: K, default: V = None) -> V:
+        with self._lock_:
+            return default if (val := self._lookup_(key)) is AccessError else val
+
+    def update(self, item: Mapping = None, **kwargs: Any) -> CacheDict:
+        for key, val in dict(item if item is not None else {}, **kwargs).items():
+            self[key] = val
+
+        return self
+
+    def clear(self) -> CacheDict:
+        with self._lock_:
+            self._expires_.clear()
+            return super().clear()
+
+    def pop(self, key: K, *args: Any) -> V:
+        with self._lock_:
+            self._expires_.pop(key, None)
+            return super().pop(key, *args)
+
+    def popitem(self) -> tuple[K, V]:
+        with self._lock_:
+            key, val = super().popitem()
+            self._expires_.pop(key, None)
+            return key, val
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        return type(self).setdefault_lazy(self, key, lambda: default)
+
+    def copy(self) -> CacheDict:
+        with self._lock_:
+            return type(self)(self, max_size=self._max_size_, ttl=self._ttl_)
+
+    def setdefault_lazy(self, key: Any, factory: Callable = None, pass_key: bool = False) -> Any:
+        """Return the cached value for this key, or call the factory to create and cache it. Concurrent misses on the same key wait for a single call of the factory rather than each calling it."""
+        with self._lock_:
+            if (val := self._lookup_(key)) is not AccessError:
+                return val
+
+            key_lock = self._inflight_.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock_:
+                if (val := self._peek_(key)) is not AccessError:
+                    return val
+
+            try:
+                val = type(self).translator.translate(factory(key) if pass_key else factory())
+
+                # The value is returned as computed rather than read back, since it may already have been evicted (e.g. with a max_size of 0).
+                with self._lock_:
+                    self[key] = val
+
+                return val
+            finally:
+                with self._lock_:
+                    if self._inflight_.get(key) is key_lock:
+                        del self._inflight_[key]
+
+    def expire(self) -> CacheDict:
+        """Remove every item whose time-to-live has passed. Returns self and thus allows chaining."""
+        with self._lock_:
+            self._purge_()
+
+        return self
+
+    def cache_info(self) -> NameSpace:
+        """Return the hit, miss, eviction and expiration counts of this cache, along with its current size and limits."""
+        with self._lock_:
+            return NameSpace(**self._stats_, size=len(self), max_size=self._max_size_, ttl=self._ttl_)
+
+    @classmethod
+    def memoize(cls, max_size: int = 128, ttl: float = None) -> Callable[[Callable], Callable]:
+        """A decorator that caches the results of a function in a CacheDict, keyed by its arguments, which must be hashable. The cache is available as the 'cache' attribute of the decorated function."""
+        def decorator(func: Callable) -> Callable:
+            cache = cls(max_size=max_size, ttl=ttl)
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return cache.setdefault_lazy((args, frozenset(kwargs.items())), lambda: func(*args, **kwargs))
+
+            wrapper.cache = cache
+            return wrapper
+
+        return decorator
+
+    def _lookup_(self, key: Any) -> Any:
+        if (val := self._peek_(key)) is AccessError:
+            self._stats_["misses"] += 1
+        else:
+            dict.__delitem__(self, key)
+            dict.__setitem__(self, key, val)
+            self._stats_["hits"] += 1
+
+        return val
+
+    def _peek_(self, key: Any) -> Any:
+        if (val := dict.get(self, key, AccessError)) is not AccessError and self._is_expired_(key):
+            self._evict_(key)
+            self._stats_["expirations"] += 1
+            return AccessError
+
+        return val
+
+    def _purge_(self) -> None:
+        # Every item shares the same ttl and is moved to the end of '_expires_' whenever it is set, so items expire in order and the scan stops at the first live one.
+        now, expires = time.monotonic(), self._expires_
+        while expires:
+            key, deadline = next(iter(expires.items()))
+            if deadline > now:
+                break
+
+            self._evict_(key)
+            self._stats_["expirations"] += 1
+
+    def _is_expired_(self, key: Any) -> bool:
+        return (expires := self._expires_.get(key)) is not None and expires <= time.monotonic()
+
+    def _evict_(self, key: Any) -> None:
+        Dict.__delitem__(self, key)
+        self._expires_.pop(key, None)
+
+
+_BITS, _MASK, _HASH_MASK = 5, 0b11111, (1 << 64) - 1
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _BitmapNode:
+    """A HAMT node holding up to 32 entries, each either a (key, value) leaf tuple or a child node, selected by 5 bits of the key's hash."""
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple) -> None:
+        self.bitmap, self.entries = bitmap, entries
+
+    def get(self, shift: int, hash_: int, key: Any, default: Any) -> Any:
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return default
+
+        entry = self.entries[bit_count(self.bitmap & (bit - 1))]
+        if type(entry) is tuple:
+            return entry[1] if entry[0] is key or entry[0] == key else default
+
+        return entry.get(shift + _BITS, hash_, key, default)
+
+    def assoc(self, shift: int, hash_: int, key: Any, val: Any) -> tuple[_BitmapNode, bool]:
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        index = bit_count(self.bitmap & (bit - 1))
+
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, (*self.entries[:index], (key, val), *self.entries[index:])), True
+
+        entry = self.entries[index]
+        if type(entry) is tuple:
+            if entry[0] is key or entry[0] == key:
+                if entry[1] is val:
+                    return self, False
+                new_entry, added = (key, val), False
+            else:
+                new_entry, added = _merge_leaves(shift + _BITS, entry, _hash(entry[0]), (key, val), hash_), True
+        else:
+            new_entry, added = entry.assoc(shift + _BITS, hash_, key, val)
+            if new_entry is entry:
+                return self, False
+
+        return _BitmapNode(self.bitmap, (*self.entries[:index], new_entry, *self.entries[index + 1:])), added
+
+    def dissoc(self, shift: int, hash_: int, key: Any) -> tuple[Optional[_BitmapNode], bool]:
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self, False
+
+        index = bit_count(self.bitmap & (bit - 1))
+        entry = self.entries[index]
+
+        if type(entry) is tuple:
+            if not (entry[0] is key or entry[0] == key):
+                return self, False
+            new_entry = None
+        else:
+            new_entry, removed = entry.dissoc(shift + _BITS, hash_, key)
+            if not removed:
+                return self, False
+            if new_entry is not None and len(new_entry.entries) == 1 and type(new_entry.entries[0]) is tuple:
+                new_entry = new_entry.entries[0]
+
+        if new_entry is not None:
+            return _BitmapNode(self.bitmap, (*self.entries[:index], new_entry, *self.entries[index + 1:])), True
+
+        if self.bitmap == bit:
+            return None, True
+
+        return _BitmapNode(self.bitmap ^ bit, (*self.entries[:index], *self.entries[index + 1:])), True
+
+
+class _CollisionNode:
+    """A HAMT node holding the leaves of keys whose full hashes are identical."""
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash_: int, entries: tuple) -> None:
+        self.hash, self.entries = hash_, entries
+
+    def get(self, shift: int, hash_: int, key: Any, default: Any) -> Any:
+        for entry_key, entry_val in self.entries:
+            if entry_key is key or entry_key == key:
+                return entry_val
+
+        return default
+
+    def assoc(self, shift: int, hash_: int, key: Any, val: Any) -> tuple[Any, bool]:
+        if hash_ != self.hash:
+            return _BitmapNode(1 << ((self.hash >> shift) & _MASK), (self,)).assoc(shift, hash_, key, val)
+
+        for index, (entry_key, entry_val) in enumerate(self.entries):
+            if entry_key is key or entry_key == key:
+                if entry_val is val:
+                    return self, False
+                return _CollisionNode(self.hash, (*self.entries[:index], (key, val), *self.entries[index + 1:])), False
+
+        return _CollisionNode(self.hash, (*self.entries, (key, val))), True
+
+    def dissoc(self, shift: int, hash_: int, key: Any) -> tuple[Optional[_CollisionNode], bool]:
+        for index, (entry_key, _) in enumerate(self.entries):
+            if entry_key is key or entry_key == key:
+                entries = (*self.entries[:index], *self.entries[index + 1:])
+                return (_CollisionNode(self.hash, entries) if entries else None), True
+
+        return self, False
+
+
+def _merge_leaves(shift: int, first: tuple, first_hash: int, second: tuple, second_hash: int) -> Any:
+    if first_hash == second_hash or shift >= 64:
+        return _CollisionNode(first_hash, (first, second))
+
+    first_index, second_index = (first_hash >> shift) & _MASK, (second_hash >> shift) & _MASK
+    if first_index == second_index:
+        return _BitmapNode(1 << first_index, (_merge_leaves(shift + _BITS, first, first_hash, second, second_hash),))
+
+    entries = (first, second) if first_index < second_index else (second, first)
+    return _BitmapNode((1 << first_index) | (1 << second_index), entries)
+
+
+def _build_node(shift: int, leaves: list[tuple[int, Any, Any]]) -> Any:
+    if len({hash_ for hash_, _, _ in leaves}) == 1 and len(leaves) > 1:
+        return _CollisionNode(leaves[0][0], tuple((key, val) for _, key, val in leaves))
+
+    buckets: dict[int, list] = {}
+    for leaf in leaves:
+        buckets.setdefault((leaf[0] >> shift) & _MASK, []).append(leaf)
+
+    bitmap, entries = 0, []
+    for index in sorted(buckets):
+        bitmap |= 1 << index
+        bucket = buckets[index]
+        entries.append((bucket[0][1], bucket[0][2]) if len(bucket) == 1 else _build_node(shift + _BITS, bucket))
+
+    return _BitmapNode(bitmap, tuple(entries))
+
+
+class FrozenItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        return self._mapping._leaves()
+
+
+class FrozenValuesView(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        return (val for _, val in self._mapping._leaves())
+
+
+class FrozenDict(Mapping, Generic[K, V]):
+    """
+    An immutable, hashable mapping implemented as a hash array mapped trie (HAMT). FrozenDict.set(), FrozenDict.delete() and FrozenDict.merge() return new versions
+    which share all unchanged structure with the original, so each update costs O(log n) rather than a full copy. The hash is computed once and cached, so instances can be used as cache keys.
+    Values can also be read through attribute access. Use FrozenDict.from_dict() and FrozenDict.to_dict() (or Dict.freeze()) to convert to and from Dict.
+    """
+
+    __slots__ = ("_root", "_len", "_hash")
+
+    _empty_root = _BitmapNode(0, ())
+
+    def __init__(self, seq: Any = None, **kwargs: Any) -> None:
+        items = dict(seq, **kwargs) if seq is not None else kwargs
+        self._root = _build_node(0, [(_hash(key), key, val) for key, val in items.items()]) if items else self._empty_root
+        self._len, self._hash = len(items), None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({{{', '.join([f'{repr(key)}: {repr(val)}' for key, val in self.items()])}}})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self._leaves():
+            yield key
+
+    def __getitem__(self, key: K) -> V:
+        if (val := self._root.get(0, _hash(key), key, AccessError)) is AccessError:
+            raise AccessError(f"'{key}' not found in {type(self).__name__}: {self}")
+
+        return val
+
+    def __getattr__(self, name: str) -> V:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+
+        return self[name]
+
+    def __contains__(self, key: Any) -> bool:
+        return self._root.get(0, _hash(key), key, AccessError) is not AccessError
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._leaves()))
+
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+        if isinstance(other, FrozenDict) and other._hash is not None and self._hash is not None and other._hash != self._hash:
+            return False
+        if not isinstance(other, Mapping) or len(other) != len(self):
+            return False
+
+        return all(other.get(key, AccessError) == val for key, val in self._leaves())
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __or__(self, other: Mapping) -> FrozenDict:
+        return self.merge(other)
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(self._leaves()),)
+
+    def get(self, key: K, default: V = None) -> V:
+        return self._root.get(0, _hash(key), key, default)
+
+    def items(self) -> ItemsView:
+        return FrozenItemsView(self)
+
+    def values(self) -> ValuesView:
+        return FrozenValuesView(self)
+
+    def set(self, key: K, val: V) -> FrozenDict:
+        """Return a new FrozenDict with this key set to this value, sharing all other structure with this one."""
+        root, added = self._root.assoc(0, _hash(key), key, val)
+        return self if root is self._root else self._from_root(root, self._len + added)
+
+    def delete(self, key: K) -> FrozenDict:
+        """Return a new FrozenDict without this key, sharing all other structure with this one. Raises AccessError if the key is not present."""
+        root, removed = self._root.dissoc(0, _hash(key), key)
+        if not removed:
+            raise AccessError(f"'{key}' not found in {type(self).__name__}: {self}")
+
+        return self._from_root(root if root is not None else self._empty_root, self._len - 1)
+
+    def merge(self, *others: Mapping, **kwargs: Any) -> FrozenDict:
+        """Return a new FrozenDict with the items of all the given mappings (and keyword arguments) set on top of this one, in order."""
+        root, length = self._root, self._len
+        for other in (*others, kwargs):
+            for key, val in other.items():
+                root, added = root.assoc(0, _hash(key), key, val)
+                length += added
+
+        return self if root is self._root else self._from_root(root, length)
+
+    def to_dict(self) -> Dict:
+        """Return a Dict with the same contents as this FrozenDict, recursively converting any nested FrozenDicts into Dicts and tuples into Lists."""
+        return Dict({key: self._thaw(val) for key, val in self._leaves()})
+
+    @classmethod
+    def from_dict(cls, mapping: Mapping) -> FrozenDict:
+        """
+        Create a FrozenDict from a mapping, recursively converting any nested mappings into FrozenDicts, lists (and other sequences) into tuples, and sets into frozensets.
+        The result is hashable as long as the remaining leaves are.
+        """
+        return cls({key: cls._freeze(val) for key, val in mapping.items()})
+
+    @classmethod
+    def _freeze(cls, item: Any) -> Any:
+        if isinstance(item, FrozenDict) or isinstance(item, (str, bytes)):
+            return item
+        elif isinstance(item, Mapping):
+            return cls.from_dict(item)
+        elif isinstance(item, (Sequence, bytearray)):
+            return bytes(item) if isinstance(item, bytearray) else tuple(cls._freeze(val) for val in item)
+        elif isinstance(item, Set):
+            return frozenset(cls._freeze(val) for val in item)
+
+        return item
+
+    @staticmethod
+    def _thaw(item: Any) -> Any:
+        if isinstance(item, FrozenDict):
+            return item.to_dict()
+        elif isinstance(item, tuple):
+            return [FrozenDict._thaw(val) for val in item]
+
+        return item
+
+    def _leaves(self) -> Iterator[tuple[K, V]]:
+        stack = [self._root]
+        while stack:
+            for entry in stack.pop().entries:
+                if type(entry) is tuple:
+                    yield entry
+                else:
+                    stack.append(entry)
+
+    @classmethod
+    def _from_root(cls, root: Any, length: int) -> FrozenDict:
+        new = cls.__new__(cls)
+        new._root, new._len, new._hash = root, length, None
+        return new
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import MutableMapping, MutableSet
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Union
 import enum
 
 
+bit_count = int.bit_count if hasattr(int, "bit_count") else (lambda num: bin(num).count("1"))
+
+
 class EnumMeta(enum.EnumMeta):
     class Auto:
         def __repr__(self) -> str:
@@ -16,7 +21,7 @@ class EnumMeta(enum.EnumMeta):
         def __repr__(self) -> str:
             return f"{type(self).__name__}(value={self.value})"
 
-    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, case_insensitive: bool = False):
         new_namespace = enum._EnumDict()
         new_namespace._cls_name = name
 
@@ -32,9 +37,29 @@ class EnumMeta(enum.EnumMeta):
 
         return super().__new__(mcs, name, bases, new_namespace)
 
-    def __init__(cls, name: str, bases: tuple, namespace: dict) -> None:
+    def __init__(cls, name: str, bases: tuple, namespace: dict, case_insensitive: bool = False) -> None:
         super().__init__(name, bases, namespace)
 
+        # Lookups are resolved by a single probe of a table built once here. Names take precedence over values, and members resolve to themselves.
+        lookup = {}
+        for member in cls.__members__.values():
+            try:
+                lookup.setdefault(member._value_, member)
+            except TypeError:
+                pass
+
+        lookup.update(cls.__members__)
+        lookup.update({member: member for member in cls.__members__.values()})
+
+        cls._lookup_ = MappingProxyType(lookup)
+
+        # Aliases are the same objects as their canonical members, so they share an ordinal.
+        cls._ordered_members_ = tuple(cls)
+        for ordinal, member in enumerate(cls._ordered_members_):
+            member._ordinal_ = ordinal
+
+        cls._folded_lookup_ = MappingProxyType({name.casefold(): member for name, member in cls.__members__.items()}) if case_insensitive else None
+
         vals_to_name_list = {}
         for name, val in cls.__members__.items():
             vals_to_name_list.setdefault(val, []).append(name)
@@ -52,12 +77,12 @@ class EnumMeta(enum.EnumMeta):
 
     def __getitem__(cls, key):
         try:
-            return super().__getitem__(key)
-        except KeyError:
-            if isinstance(key, cls):
-                return key
-            else:
-                raise KeyError(f"{key} is not a valid {cls.__name__}. Must be one of: {', '.join([str(member) for member in cls])}")
+            return cls._lookup_[key]
+        except (KeyError, TypeError):
+            if cls._folded_lookup_ is not None and isinstance(key, str) and (member := cls._folded_lookup_.get(key.casefold())) is not None:
+                return member
+
+            raise KeyError(f"{key} is not a valid {cls.__name__}. Must be one of: {', '.join([str(member) for member in cls])}") from None
 
     def is_enum(cls, candidate: Any) -> bool:
         """Returns True if the candidate is a subclass of Enum, otherwise returns False."""
@@ -77,7 +102,7 @@ class Enum(enum.Enum, metaclass=EnumMeta):
         return id(self)
 
     def __eq__(self, other: Any) -> bool:
-        return other is self or other == self.name
+        return other is self or other == self._name_
 
     def __ne__(self, other: Any) -> bool:
         return not (self == other)
@@ -85,8 +110,153 @@ class Enum(enum.Enum, metaclass=EnumMeta):
     def __str__(self) -> str:
         return str(self.name)
 
-    def map_to(self, mapping: dict, else_: Any = None, raise_for_failure: bool = True) -> Any:
+    def map_to(self, mapping: Union[dict, EnumMap], else_: Any = None, raise_for_failure: bool = True) -> Any:
         if (ret := mapping.get(self, else_)) is None and raise_for_failure:
             raise ValueError(f"No mapping for '{self}' found in {mapping}.")
 
         return ret
+
+
+class EnumMap(MutableMapping):
+    """
+    A mapping whose keys are the members of a single Enum, backed by a list indexed by member ordinal rather than a hash table. Keys can also be given as anything the Enum can resolve (e.g. member names).
+    Build one once and reuse it for hot dispatch, lookups are a single list index.
+    """
+
+    _missing = object()
+
+    def __init__(self, enum_: EnumMeta, mapping: Union[dict, Iterable[tuple]] = None, /, **kwargs: Any) -> None:
+        self.enum, self._values = enum_, [self._missing] * len(enum_._ordered_members_)
+        self.update({} if mapping is None else mapping, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.enum}, {{{', '.join(f'{repr(member)}: {repr(val)}' for member, val in self.items())}}})"
+
+    def __getitem__(self, key: Any) -> Any:
+        if (val := self._values[(key if type(key) is self.enum else self.enum[key])._ordinal_]) is self._missing:
+            raise KeyError(key)
+
+        return val
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        self._values[self._ordinal(key)] = val
+
+    def __delitem__(self, key: Any) -> None:
+        if self._values[ordinal := self._ordinal(key)] is self._missing:
+            raise KeyError(key)
+
+        self._values[ordinal] = self._missing
+
+    def __iter__(self) -> Iterator[Enum]:
+        missing = self._missing
+        return (member for member, val in zip(self.enum._ordered_members_, self._values) if val is not missing)
+
+    def __len__(self) -> int:
+        return len(self._values) - self._values.count(self._missing)
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return self._values[self._ordinal(key)] is not self._missing
+        except KeyError:
+            return False
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _ordinal(self, key: Any) -> int:
+        return (key if type(key) is self.enum else self.enum[key])._ordinal_
+
+
+class EnumSet(MutableSet):
+    """
+    A set of the members of a single Enum, stored as the bits of a single integer indexed by member ordinal. Membership tests are a bit test and set algebra between EnumSets is integer arithmetic.
+    Members can also be given as anything the Enum can resolve (e.g. member names).
+    """
+
+    def __init__(self, enum_: EnumMeta, members: Iterable = (), /) -> None:
+        self.enum, self.bits = enum_, 0
+        for member in members:
+            self.add(member)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.enum}, {{{', '.join(repr(member) for member in self)}}})"
+
+    def __contains__(self, member: Any) -> bool:
+        try:
+            return bool(self.bits >> (member if type(member) is self.enum else self.enum[member])._ordinal_ & 1)
+        except KeyError:
+            return False
+
+    def __iter__(self) -> Iterator[Enum]:
+        bits = self.bits
+        return (member for member in self.enum._ordered_members_ if bits >> member._ordinal_ & 1)
+
+    def __len__(self) -> int:
+        return bit_count(self.bits)
+
+    def __eq__(self, other: Any) -> bool:
+        return self.bits == other.bits and self.enum is other.enum if isinstance(other, EnumSet) else super().__eq__(other)
+
+    def __and__(self, other: Iterable) -> EnumSet:
+        return self.from_bits(self.enum, self.bits & self._coerce(other).bits)
+
+    def __or__(self, other: Iterable) -> EnumSet:
+        return self.from_bits(self.enum, self.bits | self._coerce(other).bits)
+
+    def __xor__(self, other: Iterable) -> EnumSet:
+        return self.from_bits(self.enum, self.bits ^ self._coerce(other).bits)
+
+    def __sub__(self, other: Iterable) -> EnumSet:
+        return self.from_bits(self.enum, self.bits & ~self._coerce(other).bits)
+
+    def __iand__(self, other: Iterable) -> EnumSet:
+        self.bits &= self._coerce(other).bits
+        return self
+
+    def __ior__(self, other: Iterable) -> EnumSet:
+        self.bits |= self._coerce(other).bits
+        return self
+
+    def __ixor__(self, other: Iterable) -> EnumSet:
+        self.bits ^= self._coerce(other).bits
+        return self
+
+    def __isub__(self, other: Iterable) -> EnumSet:
+        self.bits &= ~self._coerce(other).bits
+        return self
+
+    __rand__, __ror__, __rxor__ = __and__, __or__, __xor__
+    __hash__ = None
+
+    def add(self, member: Any) -> None:
+        self.bits |= 1 << self._ordinal(member)
+
+    def discard(self, member: Any) -> None:
+        self.bits &= ~(1 << self._ordinal(member))
+
+    def clear(self) -> None:
+        self.bits = 0
+
+    def copy(self) -> EnumSet:
+        return self.from_bits(self.enum, self.bits)
+
+    @classmethod
+    def from_bits(cls, enum_: EnumMeta, bits: int) -> EnumSet:
+        """Create an EnumSet from the integer representation of another EnumSet of the same Enum."""
+        new = cls.__new__(cls)
+        new.enum, new.bits = enum_, bits
+        return new
+
+    def _ordinal(self, member: Any) -> int:
+        return (member if type(member) is self.enum else self.enum[member])._ordinal_
+
+    def _coerce(self, other: Iterable) -> EnumSet:
+        if isinstance(other, EnumSet):
+            if other.enum is not self.enum:
+                raise TypeError(f"Cannot combine an {type(self).__name__} of {self.enum} with one of {other.enum}.")
+            return other
+
+        return type(self)(self.enum, other)
@@ -1,59 +1,571 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import Counter, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from functools import partial
+from hashlib import sha256
+import inspect
+from itertools import islice
+import os
+from pathlib import Path
+import threading
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Optional, Union
 import json
+import time
 import simplejson
 
 from requests import Session
-from requests.models import Response as BaseResponse
+from requests.adapters import HTTPAdapter
+from requests.models import PreparedRequest, Response as BaseResponse
 from requests.exceptions import HTTPError
+from requests.sessions import merge_setting
+from requests.structures import CaseInsensitiveDict
 from urllib.parse import quote, quote_plus
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
 
-from .enum_ import Enum
+from .enum_ import Enum, EnumMap
+from .instrumentation import instrumented
+from .namespace import NameSpace
 from .translator import TranslatableMeta
 
 
 class Response(BaseResponse):
-    """Subclass of requests.Response with a modified Response.json() method."""
+    """Subclass of requests.Response with a modified Response.json() method. 'from_cache' is True if it was served from an HttpCache rather than read from the network."""
+
+    from_cache, _cache_entry_ = False, None
 
     def __init__(self, namespace: dict) -> None:
         self.__dict__ = namespace
 
     def json(self) -> Any:
-        """Returns Str, List, and Dict items rather than their builtin superclasses. If there is no data will return None rather than raising JSONDecodeError."""
+        """
+        Returns Str, List, and Dict items rather than their builtin superclasses. If there is no data will return None rather than raising JSONDecodeError.
+        The json of a cached response is only parsed and translated once per cache entry. Every call then returns a structural copy of it, so mutating the result never affects later responses.
+        """
+        if (entry := self._cache_entry_) is None:
+            return self._translate_json()
+
+        if entry.json is CacheEntry.MISSING:
+            entry.json = self._translate_json()
+
+        return _copy_json(entry.json)
+
+    def _translate_json(self) -> Any:
         try:
             return TranslatableMeta.translator.translate(super().json())
         except (json.JSONDecodeError, simplejson.JSONDecodeError):
             return None
 
 
-class Http(Session):
+class CacheEntry:
+    """A cached GET response: its body and headers, the request headers it varies on, when it was stored (or last revalidated) and for how many seconds it then stays fresh, and its translated json once something has asked for it."""
+
+    MISSING = object()
+
+    __slots__ = ("key", "url", "status_code", "reason", "encoding", "headers", "content", "vary", "stored_at", "max_age", "no_cache", "public", "json")
+    _metadata_fields = ("key", "url", "status_code", "reason", "encoding", "headers", "vary", "stored_at", "max_age", "no_cache", "public")
+
+    def __init__(self, key: str, response: BaseResponse, request_headers: Mapping[str, str]) -> None:
+        self.key, self.url, self.status_code, self.reason, self.encoding = key, response.url, response.status_code, response.reason, response.encoding
+        self.headers, self.content, self.json = dict(response.headers), response.content, CacheEntry.MISSING
+        self.vary = {name: request_headers.get(name) for name in self._vary_names(self.headers)}
+        self._update_freshness()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(url={repr(self.url)}, size={self.size}, fresh={self.is_fresh()})"
+
+    def dump(self, file: BinaryIO) -> None:
+        """Write this entry to a binary file as a line of json holding everything but the body, followed by the raw body."""
+        file.write(json.dumps({name: getattr(self, name) for name in self._metadata_fields}).encode() + b"\n")
+        file.write(self.content)
+
+    @classmethod
+    def load(cls, file: BinaryIO) -> CacheEntry:
+        """Read an entry written by CacheEntry.dump(), raising ValueError if the file does not hold one."""
+        metadata = json.loads(file.readline())
+        if not isinstance(metadata, dict) or metadata.keys() != set(cls._metadata_fields):
+            raise ValueError(f"Invalid cache entry metadata {repr(metadata)}")
+
+        entry = cls.__new__(cls)
+        for name, value in metadata.items():
+            setattr(entry, name, value)
+
+        entry.content, entry.json = file.read(), CacheEntry.MISSING
+        return entry
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers.items())
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """The headers that make a conditional request for this entry, so that the server can answer 304 Not Modified instead of sending the body again."""
+        headers = CaseInsensitiveDict(self.headers)
+        return {name: value for name, value in (("If-None-Match", headers.get("ETag")), ("If-Modified-Since", headers.get("Last-Modified"))) if value is not None}
+
+    def is_fresh(self, now: float = None) -> bool:
+        return not self.no_cache and self.max_age is not None and (time.time() if now is None else now) - self.stored_at < self.max_age
+
+    def matches(self, request_headers: Mapping[str, str]) -> bool:
+        return all(request_headers.get(name) == value for name, value in self.vary.items())
+
+    def revalidate(self, headers: Mapping[str, str]) -> None:
+        """Update this entry with the headers of a 304 Not Modified response, which restarts its freshness lifetime."""
+        merged = CaseInsensitiveDict(self.headers)
+        merged.update({name: value for name, value in headers.items() if name.lower() not in {"content-length", "content-encoding", "transfer-encoding"}})
+        self.headers = dict(merged)
+        self._update_freshness()
+
+    def to_response(self) -> Response:
+        raw = BaseResponse()
+        raw.status_code, raw.reason, raw.url, raw.encoding, raw.headers = self.status_code, self.reason, self.url, self.encoding, CaseInsensitiveDict(self.headers)
+        raw._content, raw._content_consumed, raw.elapsed = self.content, True, timedelta(0)
+
+        response = Response(raw.__dict__)
+        response.from_cache, response._cache_entry_ = True, self
+        return response
+
+    @classmethod
+    def from_response(cls, key: str, response: BaseResponse, request_headers: Mapping[str, str]) -> Optional[CacheEntry]:
+        """Return an entry for the given response, or None if it may not be cached: if it is not a 200, varies on every request, is marked 'no-store', or has neither a freshness lifetime nor a validator to revalidate with."""
+        if response.status_code != 200 or "*" in cls._vary_names(response.headers) or "no-store" in parse_cache_control(response.headers.get("Cache-Control", "")):
+            return None
+
+        entry = cls(key, response, request_headers)
+        return entry if entry.max_age is not None or entry.validators else None
+
+    def _update_freshness(self) -> None:
+        headers, now = CaseInsensitiveDict(self.headers), time.time()
+        directives = parse_cache_control(headers.get("Cache-Control", ""))
+
+        self.no_cache, self.public, self.max_age = "no-cache" in directives, "public" in directives, None
+        self.stored_at = now - (_to_float(headers.get("Age")) or 0)
+
+        if (max_age := _to_float(directives.get("max-age"))) is not None:
+            self.max_age = max_age
+        elif (expires := _to_timestamp(headers.get("Expires"))) is not None:
+            self.max_age = max(expires - (_to_timestamp(headers.get("Date")) or now), 0)
+
+    @staticmethod
+    def _vary_names(headers: Mapping[str, str]) -> list[str]:
+        return [name.strip().lower() for name in CaseInsensitiveDict(headers).get("Vary", "").split(",") if name.strip()]
+
+
+class HttpCache:
     """
-    Subclass of requests.Session which takes a 'base_url' constructor argument and prepends it to all future requests.
-    It returns Str, List, and Dict instances when deserializing json from responses and can automatically quote all urls passed to its http methods.
+    A thread-safe LRU cache of GET responses for Http. Entries are kept in memory up to a total of 'max_bytes', and, if a 'directory' is given, also written to disk up to a total of 'max_disk_bytes', so that they outlive the process.
+    Either tier evicts its least recently used entries once it grows beyond its limit, and 'max_bytes=0' keeps entries on disk only.
+    Responses are stored according to their Cache-Control 'no-store', 'no-cache' and 'max-age' directives (or their Expires header), and a stale entry is revalidated with a conditional request built from its ETag and Last-Modified headers.
+    Responses to requests that carry credentials (auth, cookies, or an Authorization or Cookie header) are only cached if they are marked 'public'.
     """
 
+    def __init__(self, max_bytes: int = 64 * 2**20, directory: Union[str, os.PathLike] = None, max_disk_bytes: int = 512 * 2**20) -> None:
+        self.max_bytes, self.max_disk_bytes = max_bytes, max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._bytes = self._disk_bytes = 0
+        self._counts = Counter(dict.fromkeys(("hits", "misses", "revalidated", "stores", "evictions", "disk_evictions"), 0))
+        self._lock = threading.RLock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path in sorted(self.directory.glob("*.entry"), key=lambda file: file.stat().st_mtime):
+                self._disk[path.stem] = path.stat().st_size
+                self._disk_bytes += self._disk[path.stem]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_bytes={repr(self.max_bytes)}, directory={repr(self.directory)}, max_disk_bytes={repr(self.max_disk_bytes)})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) if self.directory is None else len(self._disk.keys() | {self._name(key) for key in self._entries})
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries or self._name(key) in self._disk
+
+    def get(self, key: str, request_headers: Mapping[str, str] = None) -> Optional[CacheEntry]:
+        """Return the entry stored under the given key whether fresh or stale, loading it from disk into memory if need be, or None if there is none or it varies on request headers that do not match the given ones."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            elif (entry := self._load(key)) is not None:
+                self._remember(entry)
+
+        return entry if entry is not None and entry.matches(request_headers or {}) else None
+
+    def put(self, entry: CacheEntry) -> None:
+        """Store the entry (replacing any other under its key), evicting the least recently used entries as needed to stay within the size limits."""
+        with self._lock:
+            self._counts["stores"] += 1
+            self._remember(entry)
+            if self.directory is not None:
+                self._dump(entry)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if (entry := self._entries.pop(key, None)) is not None:
+                self._bytes -= entry.size
+
+            if self.directory is not None and (size := self._disk.pop(name := self._name(key), None)) is not None:
+                self._disk_bytes -= size
+                (self.directory / f"{name}.entry").unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for name in list(self._disk):
+                self._evict_file(name, count=False)
+
+    def stats(self) -> NameSpace:
+        """
+        Return the number of requests answered from a fresh entry (hits), answered by revalidating a stale entry with a 304 Not Modified (revalidated), and which transferred a body (misses),
+        along with the number of responses stored and of entries evicted from memory and from disk, and the number of entries and bytes currently held in memory and on disk.
+        """
+        with self._lock:
+            return NameSpace(**self._counts, entries=len(self._entries), bytes=self._bytes, disk_entries=len(self._disk), disk_bytes=self._disk_bytes)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counts:
+                self._counts[name] = 0
+
+    @staticmethod
+    def key(url: str, params: Any = None) -> str:
+        request = PreparedRequest()
+        request.prepare_url(url, params)
+        return f"GET {request.url}"
+
+    def _record(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def _remember(self, entry: CacheEntry) -> None:
+        if (previous := self._entries.pop(entry.key, None)) is not None:
+            self._bytes -= previous.size
+
+        if (size := entry.size) > self.max_bytes:
+            return
+
+        self._entries[entry.key], self._bytes = entry, self._bytes + size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._counts["evictions"] += 1
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        if self.directory is None or (name := self._name(key)) not in self._disk:
+            return None
+
+        path = self.directory / f"{name}.entry"
+        try:
+            with open(path, "rb") as file:
+                entry = CacheEntry.load(file)
+        except (OSError, ValueError):
+            self._evict_file(name, count=False)
+            return None
+
+        os.utime(path)
+        self._disk.move_to_end(name)
+        return entry if entry.key == key else None
+
+    def _dump(self, entry: CacheEntry) -> None:
+        path = self.directory / f"{(name := self._name(entry.key))}.entry"
+        temporary = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(temporary, "wb") as file:
+            entry.dump(file)
+
+        os.replace(temporary, path)
+
+        self._disk_bytes -= self._disk.pop(name, 0)
+        self._disk[name] = size = path.stat().st_size
+        self._disk_bytes += size
+
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            self._evict_file(next(iter(self._disk)))
+
+    def _evict_file(self, name: str, count: bool = True) -> None:
+        self._disk_bytes -= self._disk.pop(name, 0)
+        (self.directory / f"{name}.entry").unlink(missing_ok=True)
+        if count:
+            self._counts["disk_evictions"] += 1
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return sha256(key.encode()).hexdigest()
+
+
+def _copy_json(item: Any) -> Any:
+    """Copy the Dicts and Lists of already-translated json without translating their members again. Everything else json holds is immutable and is shared."""
+    if isinstance(item, dict):
+        copy = type(item).__new__(type(item))
+        dict.update(copy, {key: _copy_json(val) for key, val in dict.items(item)})
+        return copy
+    elif isinstance(item, list):
+        copy = type(item).__new__(type(item))
+        list.extend(copy, [_copy_json(val) for val in list.__iter__(item)])
+        return copy
+    else:
+        return item
+
+
+def parse_cache_control(header: str) -> dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a dict of its lowercased directives and their values (None for directives without one)."""
+    directives = {}
+    for directive in header.split(","):
+        if name := (parts := directive.split("=", 1))[0].strip().lower():
+            directives[name] = parts[1].strip().strip('"') if len(parts) > 1 else None
+
+    return directives
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _to_timestamp(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+class IdleTimeoutPoolMixin:
+    """Mixin for urllib3 connection pools that closes pooled connections which have been idle for longer than 'idle_timeout' seconds when they are next taken from the pool, so they reconnect rather than hit a socket the server has already dropped."""
+
+    def __init__(self, *args: Any, idle_timeout: float = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.idle_timeout, self.num_expired = idle_timeout, 0
+
+    def _get_conn(self, timeout: float = None) -> Any:
+        conn = super()._get_conn(timeout=timeout)
+
+        if self.idle_timeout is not None and (last_used := getattr(conn, "_last_used_", None)) is not None and time.monotonic() - last_used > self.idle_timeout:
+            conn.close()
+            self.num_expired += 1
+
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            conn._last_used_ = time.monotonic()
+
+        super()._put_conn(conn)
+
+
+class IdleTimeoutHTTPConnectionPool(IdleTimeoutPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class IdleTimeoutHTTPSConnectionPool(IdleTimeoutPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PoolAdapter(HTTPAdapter):
+    """Subclass of requests.adapters.HTTPAdapter whose connection pools expire connections that have been idle for longer than 'idle_timeout' seconds."""
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "idle_timeout"]
+
+    def __init__(self, idle_timeout: float = None, **kwargs: Any) -> None:
+        self.idle_timeout = idle_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(IdleTimeoutHTTPConnectionPool, idle_timeout=self.idle_timeout),
+            "https": partial(IdleTimeoutHTTPSConnectionPool, idle_timeout=self.idle_timeout),
+        }
+
+
+class BaseHttp:
+    """Base class for http clients which prepend their 'base_url' to the url of every request and quote it according to their 'quote_level'."""
+
     class QuoteLevel(Enum):
         NONE = NORMAL = PLUS = Enum.Auto()
 
-    Error, Response = HTTPError, Response
+    _quote_encoders = EnumMap(QuoteLevel, {QuoteLevel.NONE: lambda url: url, QuoteLevel.NORMAL: quote, QuoteLevel.PLUS: quote_plus})
 
-    def __init__(self, base_url: str = "", auth: tuple[str, str] = None, quote_level: Http.QuoteLevel = QuoteLevel.NONE) -> None:
+    base_url, quote_level = "", QuoteLevel.NONE
+
+    def _url(self, url: str) -> str:
+        return f"{self.base_url}/{self._quote_encode(url.strip('/'))}".strip("/") if self.base_url else self._quote_encode(url.strip("/"))
+
+    def _quote_encode(self, url: str) -> str:
+        return self._quote_encoders[self.quote_level](url)
+
+
+class Http(BaseHttp, Session):
+    """
+    Subclass of requests.Session which takes a 'base_url' constructor argument and prepends it to all future requests.
+    It returns Str, List, and Dict instances when deserializing json from responses and can automatically quote all urls passed to its http methods.
+    Each host gets a pool of up to 'pool_maxsize' keep-alive connections, and connections to at most 'pool_connections' hosts are pooled at once. With 'pool_block', requests beyond the pool size wait for a free connection rather than opening a throwaway one.
+    Pooled connections idle for longer than 'idle_timeout' seconds are reconnected before reuse. 'retries' is either a urllib3 Retry, or a number of retries for Http.retry_policy(), which only retries idempotent methods.
+    With 'max_in_flight', at most that many requests made through this session (from any thread, including Http.map() and Http.fetch_many()) are in flight at once.
+    With a 'cache' (an HttpCache, or True for an in-memory one with the default size), GET requests are answered from the cache while fresh and revalidated with conditional requests once stale.
+    """
+
+    Error, Response, Retry, Cache = HTTPError, Response, Retry, HttpCache
+
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+    # urllib3 1.x has neither of these Retry arguments, and requests still allows it.
+    _retry_backoff_params = frozenset({"backoff_jitter", "backoff_max"} & set(inspect.signature(Retry).parameters))
+
+    def __init__(self, base_url: str = "", auth: tuple[str, str] = None, quote_level: Http.QuoteLevel = BaseHttp.QuoteLevel.NONE,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, idle_timeout: float = None,
+                 retries: Union[int, Retry] = 0, backoff_factor: float = 0.5, backoff_jitter: float = 0.25, backoff_max: float = 30.0, max_in_flight: int = None,
+                 cache: Union[bool, HttpCache] = None) -> None:
         super().__init__()
         self.base_url, self.auth, self.quote_level = base_url.strip('/'), auth, quote_level
+        self.pool_maxsize, self.max_in_flight = pool_maxsize, max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self.cache = HttpCache() if cache is True else cache if isinstance(cache, HttpCache) else None
+
+        max_retries = retries if isinstance(retries, Retry) or not retries else self.retry_policy(retries, backoff_factor=backoff_factor, backoff_jitter=backoff_jitter, backoff_max=backoff_max)
+        for prefix in ("http://", "https://"):
+            self.mount(prefix, PoolAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block, idle_timeout=idle_timeout, max_retries=max_retries))
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(base_url={repr(self.base_url)}, auth={repr(self.auth)}, headers={repr(self.headers)})"
 
+    @instrumented
     def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
-        response_raw: BaseResponse = super().request(method=method,
-                                                     url=self._quote_encode(f"{self.base_url}/{url.strip('/')}".strip("/")),
-                                                     *args, **kwargs)
+        if self.cache is not None and method.upper() == "GET" and not args and not kwargs.get("stream"):
+            return self._cached_request(self._url(url), **kwargs)
+
+        return self._send(method, self._url(url), *args, **kwargs)
+
+    def map(self, requests: Iterable[Union[str, tuple, Mapping]], workers: int = None, ordered: bool = False) -> Iterator[tuple[int, Union[Response, Exception]]]:
+        """
+        Make the given requests concurrently from a pool of 'workers' threads (by default the connection pool size) sharing this session's connection pool, yielding (index, result) pairs as they complete, or in input order if 'ordered'.
+        Each request is either a url to GET, a (method, url) or (method, url, kwargs) tuple, or a mapping of keyword arguments for Http.request(). A request that raises yields its exception as its result rather than stopping the others.
+        Requests are consumed lazily, a couple per worker ahead of the ones in flight, so this can stream through very large iterables. Closing the iterator early cancels the requests that have not started yet.
+        """
+        workers = workers or self.pool_maxsize
+        executor, pending, requests = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=type(self).__name__), {}, enumerate(requests)
+        buffered, next_index = {}, 0
+
+        def submit(count: int) -> None:
+            for index, request in islice(requests, count):
+                pending[executor.submit(self._fetch, request)] = index
+
+        try:
+            submit(workers * 2)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, result = pending.pop(future), future.exception() or future.result()
+                    if ordered:
+                        buffered[index] = result
+                    else:
+                        yield index, result
+
+                while next_index in buffered:
+                    yield next_index, buffered.pop(next_index)
+                    next_index += 1
+
+                submit(len(done))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_many(self, requests: Iterable[Union[str, tuple, Mapping]], workers: int = None, ordered: bool = True) -> list[Union[Response, Exception]]:
+        """Make the given requests concurrently as Http.map() does, and return a list of their responses (or exceptions) in input order, or in completion order if not 'ordered'."""
+        results = dict(self.map(requests, workers=workers))
+        return [results[index] for index in range(len(results))] if ordered else list(results.values())
+
+    def pool_stats(self) -> dict[str, NameSpace]:
+        """
+        Return the usage of each connection pool, keyed by '<scheme>://<host>:<port>': the number of connections created, requests made, connections idle in the pool and currently checked out,
+        the pool size, and the number of idle connections that expired.
+        """
+        stats = {}
+        for adapter in dict.fromkeys(self.adapters.values()):
+            if (pools := getattr(getattr(adapter, "poolmanager", None), "pools", None)) is None:
+                continue
+
+            for key in pools.keys():
+                if (pool := pools.get(key)) is None or (queue := pool.pool) is None:
+                    continue
+
+                idle = sum(conn is not None for conn in list(queue.queue))
+                stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = NameSpace(created=pool.num_connections, requests=pool.num_requests, idle=idle,
+                                                                             in_use=max(queue.maxsize - queue.qsize(), 0), maxsize=queue.maxsize, expired=getattr(pool, "num_expired", 0))
+
+        return stats
+
+    def cache_stats(self) -> Optional[NameSpace]:
+        """Return the statistics of this session's HttpCache (see HttpCache.stats()), or None if it has none."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def _send(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        with self._in_flight or nullcontext():
+            response_raw: BaseResponse = super().request(method=method, url=url, *args, **kwargs)
+
         return Response(response_raw.__dict__)
 
-    def _quote_encode(self, url: str) -> str:
-        return self.QuoteLevel[self.quote_level].map_to({
-            self.QuoteLevel.NONE: lambda url_: url_,
-            self.QuoteLevel.NORMAL: lambda url_: quote(url_),
-            self.QuoteLevel.PLUS: lambda url_: quote_plus(url_),
-        })(url)
+    def _cached_request(self, url: str, **kwargs: Any) -> Response:
+        cache, key = self.cache, self.cache.key(url, kwargs.get("params"))
+        request_headers = merge_setting(kwargs.get("headers"), self.headers, dict_class=CaseInsensitiveDict)
+        credentialed = self._is_credentialed(request_headers, **kwargs)
+
+        if (entry := cache.get(key, request_headers)) is not None and credentialed and not entry.public:
+            entry = None
+
+        if entry is not None:
+            if entry.is_fresh():
+                cache._record("hits")
+                return entry.to_response()
+
+            kwargs["headers"] = {**entry.validators, **(kwargs.get("headers") or {})}
+
+        response = self._send("GET", url, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            entry.revalidate(response.headers)
+            cache.put(entry)
+            cache._record("revalidated")
+            return entry.to_response()
+
+        cache._record("misses")
+        if (entry := CacheEntry.from_response(key, response, request_headers)) is not None and (entry.public or not credentialed):
+            cache.put(entry)
+            response._cache_entry_ = entry
+        elif response.status_code == 200 and not credentialed:
+            cache.discard(key)
+
+        return response
+
+    def _is_credentialed(self, request_headers: Mapping[str, str], auth: Any = None, cookies: Any = None, **kwargs: Any) -> bool:
+        """Whether a request carries credentials, in which case its response is only cached (and it is only answered from the cache) if the response is marked Cache-Control 'public', so that one user's responses are never served to another."""
+        return bool(auth or self.auth or cookies or self.cookies or "Authorization" in request_headers or "Cookie" in request_headers)
+
+    def _fetch(self, request: Union[str, tuple, Mapping]) -> Response:
+        if isinstance(request, str):
+            return self.request("GET", request)
+        elif isinstance(request, Mapping):
+            return self.request(**{"method": "GET", **request})
+        else:
+            method, url, *kwargs = request
+            return self.request(method, url, **(kwargs[0] if kwargs else {}))
+
+    @classmethod
+    def retry_policy(cls, total: int, backoff_factor: float = 0.5, backoff_jitter: float = 0.25, backoff_max: float = 30.0) -> Retry:
+        """
+        Create a Retry that retries connection errors and the statuses in Http.retry_statuses up to 'total' times with exponential backoff (backoff_factor * 2 ** (retry - 1) seconds, capped at backoff_max),
+        plus up to 'backoff_jitter' seconds of random jitter. Only idempotent methods are retried, and any Retry-After header is respected. Once the retries are exhausted the last response is returned rather than raised.
+        With urllib3 1.x there is no jitter and urllib3's own backoff cap applies instead of 'backoff_max'.
+        """
+        backoff = {name: val for name, val in (("backoff_jitter", backoff_jitter), ("backoff_max", backoff_max)) if name in cls._retry_backoff_params}
+        return Retry(total=total, backoff_factor=backoff_factor, status_forcelist=cls.retry_statuses,
+                     allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, respect_retry_after_header=True, raise_on_status=False, **backoff)
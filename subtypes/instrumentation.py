@@ -0,0 +1,121 @@
+"""
+Opt-in call counting and timing for the hot entry points of subtypes. It is off by default and then costs nothing: @instrumented only records the function it decorates and returns it unchanged.
+instrumentation.enable() replaces the recorded functions on their classes with timing wrappers, and instrumentation.disable() puts the originals back.
+Times are wall-clock and inclusive, so an instrumented function that calls another counts the time spent in both.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from .namespace import NameSpace
+
+
+_registry: dict[str, Callable] = {}
+_stats: dict[str, list] = {}
+_lock = threading.Lock()
+_enabled = False
+
+
+def instrumented(func: Callable) -> Callable:
+    """Register a function (normally a method, beneath any classmethod decorator) as an instrumentation entry point under its '<module>.<qualname>'. The function is returned unchanged unless instrumentation is already enabled."""
+    _registry[name := f"{func.__module__}.{func.__qualname__}"] = func
+    return _wrap(name, func) if _enabled else func
+
+
+def enable() -> None:
+    """Start counting calls to, and timing, every registered entry point."""
+    global _enabled
+    with _lock:
+        if not _enabled:
+            for name, func in _registry.items():
+                _patch(name, _wrap(name, func))
+
+            _enabled = True
+
+
+def disable() -> None:
+    """Stop instrumenting, restoring the original functions. The statistics gathered so far are kept."""
+    global _enabled
+    with _lock:
+        if _enabled:
+            for name, func in _registry.items():
+                _patch(name, func)
+
+            _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def snapshot() -> dict[str, NameSpace]:
+    """Return the number of calls and the total and mean wall time in seconds of every entry point called since the last reset, keyed by '<module>.<qualname>'."""
+    with _lock:
+        return {name: NameSpace(calls=calls, seconds=seconds, mean=seconds / calls) for name, (calls, seconds) in sorted(_stats.items()) if calls}
+
+
+def reset() -> None:
+    """Discard the statistics gathered so far."""
+    with _lock:
+        for entry in _stats.values():
+            entry[:] = [0, 0.0]
+
+
+@contextmanager
+def profile() -> Iterator[dict[str, NameSpace]]:
+    """
+    Instrument the body of a 'with' block. The dict it yields is filled on exit with the statistics of the calls made within the block, in the same format as snapshot().
+    Instrumentation is switched back off on exit, unless it was already enabled beforehand.
+    """
+    was_enabled, before, stats = _enabled, snapshot(), {}
+    enable()
+    try:
+        yield stats
+    finally:
+        if not was_enabled:
+            disable()
+
+        for name, after in snapshot().items():
+            if (calls := after.calls - (previous.calls if (previous := before.get(name)) is not None else 0)) > 0:
+                seconds = after.seconds - (previous.seconds if previous is not None else 0)
+                stats[name] = NameSpace(calls=calls, seconds=seconds, mean=seconds / calls)
+
+
+def _wrap(name: str, func: Callable) -> Callable:
+    entry = _stats.setdefault(name, [0, 0.0])
+    clock = time.perf_counter
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            with _lock:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    return wrapper
+
+
+def _patch(name: str, func: Callable) -> None:
+    original = _registry[name]
+    owner = import_module(original.__module__)
+    *path, attr = original.__qualname__.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+
+    current = vars(owner)[attr]
+    if isinstance(current, classmethod):
+        func = classmethod(func)
+    elif isinstance(current, staticmethod):
+        func = staticmethod(func)
+
+    setattr(owner, attr, func)
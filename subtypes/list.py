@@ -1,29 +1,34 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from functools import cached_property
+import copyreg
+import heapq
+import itertools
 import json
+import os
+import pickle
+import tempfile
 from typing import Any, Iterable, Iterator, Callable, Union
 
 
-from .str import ReprMixin
+from .str import ReprMixin, AccessorSettings
 from .translator import TranslatableMeta
+from .dict import Dict, KeyPath, Record
 
 
 class SliceAccessor(ReprMixin):
     """An accessor class for all slicing-related Str methods"""
 
-    class Settings(ReprMixin):
+    class Settings(AccessorSettings):
         raise_if_absent = False
 
-    def __init__(self, parent: List = None) -> None:
-        self.parent, self.settings = parent, self.Settings()
+    def __init__(self, parent: List = None, settings: SliceAccessor.Settings = None) -> None:
+        self.parent, self.settings = parent, settings if settings is not None else self.Settings()
 
     def __call__(self, raise_if_absent: bool = None) -> SliceAccessor:
-        if raise_if_absent is not None:
-            self.settings.raise_if_absent = raise_if_absent
-
-        return self
+        """Return a new accessor with the given settings changed. This accessor and its settings are left as they are."""
+        return type(self)(parent=self.parent, settings=self.settings.derive(raise_if_absent=raise_if_absent))
 
     def before(self, value: Any) -> List:
         """Return all elements (if any) in the List before the given value. Raises ValueError if multiple matches are found."""
@@ -189,6 +194,12 @@ class List(BaseList, metaclass=TranslatableMeta):
         for index, val in enumerate(self):
             self[index] = type(self).translator.translate(val)
 
+    def __reduce__(self) -> tuple:
+        if not (state := vars(self)):
+            return copyreg.__newobj__, (type(self),), None, iter(self)
+
+        return copyreg.__newobj__, (type(self),), {name: val for name, val in state.items() if not isinstance(getattr(type(self), name, None), cached_property)} or None, iter(self)
+
     @cached_property
     def slice(self) -> SliceAccessor:
         return self.Accessors.slice(parent=self)
@@ -251,6 +262,30 @@ class List(BaseList, metaclass=TranslatableMeta):
 
         return output
 
+    def extract(self, *paths: Union[str, KeyPath], default: Any = KeyPath.MISSING) -> Dict:
+        """Evaluate several path expressions (see Dict.compile_path()) against every item of this List in a single pass. Returns a Dict mapping each path expression to a List column of its results."""
+        compiled = [Dict.compile_path(path) if isinstance(path, str) else path for path in paths]
+        columns = [[] for _ in compiled]
+
+        for item in self:
+            for column, path in zip(columns, compiled):
+                column.append(path.get(item, default))
+
+        return Dict({str(path): type(self)(column) for path, column in zip(compiled, columns)})
+
+    @classmethod
+    def of_records(cls, items: Iterable[Mapping], record: type[Record] = None) -> List:
+        """Convert an iterable of mappings sharing the same keys into a List of slotted records in one pass. If no record class is given, one is compiled from the keys of the first item with Dict.compile_record()."""
+        iterator = iter(items)
+        if (first := next(iterator, None)) is None:
+            return cls()
+
+        from_dict = (record if record is not None else Dict.compile_record(first)).from_dict
+
+        records = cls()
+        records.extend([from_dict(item) for item in itertools.chain((first,), iterator)])
+        return records
+
     def to_json(self, indent: int = 4, **kwargs: Any) -> str:
         return json.dumps(self, indent=indent, **kwargs)
 
@@ -261,3 +296,157 @@ class List(BaseList, metaclass=TranslatableMeta):
             return cls(item)
         else:
             raise TypeError(f"The following json string resolves to type '{type(item).__name__}', not type '{list.__name__}':\n\n{json_string}")
+
+
+class SpillList(ReprMixin):
+    """
+    A List-like container for datasets larger than memory. At most 'buffer_size' items are held in memory, the rest are spilled as pickled runs to temporary files.
+    Supports chaining on its inplace methods, sequential iteration, streaming batches, and an external k-way merge sort. Use it as a context manager (or call SpillList.close()) to delete its temporary files deterministically.
+    """
+
+    block_size, merge_fan_in = 1024, 64
+
+    def __init__(self, iterable: Iterable = None, buffer_size: int = 100_000, directory: os.PathLike = None) -> None:
+        if buffer_size < 1:
+            raise ValueError(f"'buffer_size' must be a positive integer, not {buffer_size}.")
+
+        self.buffer_size, self.directory = buffer_size, directory
+        self._buffer, self._runs, self._spilled, self._tempdir, self._run_count = [], [], 0, None, itertools.count()
+
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self)}, buffer_size={self.buffer_size}, runs={len(self._runs)})"
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._buffer)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for run in list(self._runs):
+            yield from self._read_run(run)
+
+        yield from list(self._buffer)
+
+    def __enter__(self) -> SpillList:
+        return self
+
+    def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
+        self.close()
+
+    def append(self, item: Any) -> SpillList:
+        """Same as List.append(), but spills the in-memory buffer to disk once it reaches 'buffer_size'. Returns self and thus allows chaining."""
+        self._buffer.append(List.translator.translate(item))
+
+        if len(self._buffer) >= self.buffer_size:
+            self._spill()
+
+        return self
+
+    def extend(self, iterable: Iterable) -> SpillList:
+        """Same as List.extend(), but spills the in-memory buffer to disk whenever it reaches 'buffer_size'. Returns self and thus allows chaining."""
+        for item in iterable:
+            self.append(item)
+
+        return self
+
+    def clear(self) -> SpillList:
+        """Remove all items, deleting any spilled runs. Returns self and thus allows chaining."""
+        for run in self._runs:
+            os.remove(run)
+
+        self._buffer, self._runs, self._spilled = [], [], 0
+        return self
+
+    def sort(self, key: Callable = None, reverse: bool = False) -> SpillList:
+        """
+        Sort this container using an external k-way merge of its individually sorted runs, keeping at most 'buffer_size' items per run in memory. The sort is stable. Returns self and thus allows chaining.
+        At most 'merge_fan_in' runs are open at once, so with more runs than that they are first merged in passes of consecutive groups.
+        """
+        if not self._runs:
+            self._buffer.sort(key=key, reverse=reverse)
+            return self
+
+        runs = []
+        for run in self._runs:
+            items = list(self._read_run(run))
+            os.remove(run)
+            items.sort(key=key, reverse=reverse)
+            runs.append(self._write_run(items))
+
+        if self._buffer:
+            self._buffer.sort(key=key, reverse=reverse)
+            runs.append(self._write_run(self._buffer))
+
+        while len(runs) > self.merge_fan_in:
+            merged_runs = []
+            for group in self._chunks(iter(runs), self.merge_fan_in):
+                merged_runs.append(self._write_run(heapq.merge(*[self._read_run(run) for run in group], key=key, reverse=reverse)))
+                for run in group:
+                    os.remove(run)
+
+            runs = merged_runs
+
+        merged = heapq.merge(*[self._read_run(run) for run in runs], key=key, reverse=reverse)
+        self._buffer, self._runs, self._spilled = [], [], 0
+
+        for chunk in self._chunks(merged, self.buffer_size):
+            self._runs.append(self._write_run(chunk))
+            self._spilled += len(chunk)
+
+        for run in runs:
+            os.remove(run)
+
+        return self
+
+    def split_into_batches_of_size(self, batch_size: int) -> Iterator[List]:
+        """Stream this container as Lists of size 'batch_size', reading at most one batch into memory at a time. The final List will be shorter than the rest if the length is not perfectly divisible by 'batch_size'."""
+        for chunk in self._chunks(iter(self), batch_size):
+            yield List(chunk)
+
+    def to_list(self) -> List:
+        """Load the entire contents of this container into memory as a List."""
+        return List(self)
+
+    def close(self) -> None:
+        """Delete all temporary files belonging to this container. It will be empty afterwards."""
+        self._buffer, self._runs, self._spilled = [], [], 0
+
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def _spill(self) -> None:
+        self._runs.append(self._write_run(self._buffer))
+        self._spilled += len(self._buffer)
+        self._buffer = []
+
+    def _write_run(self, items: Iterable) -> str:
+        if self._tempdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="subtypes-spill-", dir=self.directory)
+
+        path = os.path.join(self._tempdir.name, f"run-{next(self._run_count)}.pkl")
+        with open(path, "wb") as file:
+            for block in self._chunks(iter(items), self.block_size):
+                pickle.dump(block, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        return path
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[Any]:
+        with open(path, "rb") as file:
+            while True:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    return
+
+                yield from block
+
+    @staticmethod
+    def _chunks(iterator: Iterator, size: int) -> Iterator[list]:
+        while chunk := list(itertools.islice(iterator, size)):
+            yield chunk
@@ -8,6 +8,7 @@ from prettierfier import prettify_html
 import html_text
 from xml.dom.minidom import parseString as parse_xml
 
+from .instrumentation import instrumented
 from .str import Str
 
 
@@ -71,6 +72,7 @@ class Html(Markup):
 
     parser = "lxml"
 
+    @instrumented
     def __str__(self) -> str:
         return Str(prettify_html(self.prettify())).re(multiline=True).sub(r"^( +)", lambda m: m.group(1)*4)
 
@@ -84,6 +86,7 @@ class Xml(Markup):
 
     parser = "xml"
 
+    @instrumented
     def __str__(self) -> str:
         return Str(parse_xml(super().__str__()).toprettyxml(indent="    ", newl=""))
 
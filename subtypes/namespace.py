@@ -1,42 +1,151 @@
 from __future__ import annotations
 
-from typing import Any, Iterator, Optional, Tuple
+import copyreg
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
 
-class NameSpace:
-    """A namespace class that allows attribute access dynamically through item access."""
+class BaseNameSpace:
+    """Base class for namespaces, whose items are their public attributes and can also be accessed dynamically through item access."""
 
-    def __init__(self, mapping: dict = None, /, **kwargs: Any) -> None:
-        self(mapping, **kwargs)
+    __slots__ = ()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self])})"
 
+    def __getitem__(self, name: Optional[str]) -> Any:
+        return getattr(self, name if name is not None else "__none__")
+
+    def __setitem__(self, name: Optional[str], val: Any) -> None:
+        setattr(self, name if name is not None else "__none__", val)
+
+    def __delitem__(self, name: Optional[str]) -> None:
+        delattr(self, name if name is not None else "__none__")
+
+
+class NameSpace(BaseNameSpace):
+    """
+    A namespace class that allows attribute access dynamically through item access.
+    Attributes whose names start with an underscore are hidden from len(), iteration and repr. Their number is tracked as they are set and deleted, so len() runs in constant time and iteration is lazy.
+    """
+
+    __slots__ = ("__dict__", "__weakref__", "_hidden_")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> NameSpace:
+        self = super().__new__(cls)
+        object.__setattr__(self, "_hidden_", 0)
+        return self
+
+    def __init__(self, mapping: dict = None, /, **kwargs: Any) -> None:
+        self(mapping, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        return copyreg.__newobj__, (type(self),), dict(vars(self))
+
+    def __setstate__(self, state: dict) -> None:
+        vars(self).update(state)
+        self._count_hidden_()
+
     def __call__(self, mapping: dict = None, /, **kwargs: Any) -> NameSpace:
-        for name, _ in self:
-            del self[name]
+        namespace = vars(self)
+        for name in [name for name in namespace if not name.startswith("_")]:
+            del namespace[name]
 
         if mapping is not None:
-            vars(self).update(mapping)
+            namespace.update(mapping)
 
-        vars(self).update(kwargs)
+        namespace.update(kwargs)
+        self._count_hidden_()
 
         return self
 
+    def __setattr__(self, name: str, val: Any) -> None:
+        if not name.startswith("_") or name in (namespace := vars(self)):
+            object.__setattr__(self, name, val)
+        else:
+            object.__setattr__(self, name, val)
+            if name in namespace:
+                object.__setattr__(self, "_hidden_", self._hidden_ + 1)
+
+    def __delattr__(self, name: str) -> None:
+        hidden = name.startswith("_") and name in vars(self)
+        object.__delattr__(self, name)
+
+        if hidden:
+            object.__setattr__(self, "_hidden_", self._hidden_ - 1)
+
     def __len__(self) -> int:
-        return len([item for item in self])
+        return len(vars(self)) - self._hidden_
 
-    def __getitem__(self, name: Optional[str]) -> Any:
-        return getattr(self, name if name is not None else "__none__")
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return ((name, val) for name, val in vars(self).items() if not name.startswith("_"))
 
-    def __setitem__(self, name: Optional[str], val: Any) -> None:
-        setattr(self, name if val is not None else "__none__", val)
+    def __contains__(self, other: Any) -> bool:
+        return other in vars(self)
 
-    def __delitem__(self, name: Optional[str]) -> None:
-        delattr(self, name if name is not None else "__none__")
+    def _count_hidden_(self) -> None:
+        object.__setattr__(self, "_hidden_", sum(1 for name in vars(self) if name.startswith("_")))
+
+    @staticmethod
+    def define(name: str, fields: Iterable[str]) -> type[SlottedNameSpace]:
+        """
+        Generate (or reuse) a __slots__-backed namespace class with the given fields, for fixed-shape data. Instances support the same attribute and item access as a NameSpace,
+        but have no per-instance __dict__, which makes them much smaller. Fields that are not given a value when an instance is created are set to None.
+        """
+        fields = tuple(fields)
+
+        if (namespace := _namespace_classes.get((name, fields))) is None:
+            for field in fields:
+                if not (isinstance(field, str) and field.isidentifier() and not field.startswith("_") and not hasattr(SlottedNameSpace, field)):
+                    raise ValueError(f"Cannot use {repr(field)} as a namespace field, fields must be public identifiers that do not clash with the attributes of {SlottedNameSpace.__name__}.")
+
+            if len(set(fields)) != len(fields):
+                raise ValueError(f"Namespace fields must be unique, got: {', '.join(fields)}.")
+
+            namespace = _namespace_classes[(name, fields)] = type(name, (SlottedNameSpace,), {"__slots__": fields, "_fields_": fields, "_field_set_": frozenset(fields)})
+
+        return namespace
+
+
+class SlottedNameSpace(BaseNameSpace):
+    """Base class for the __slots__-backed namespace classes generated by NameSpace.define(). Its fields are fixed, so they can be reassigned but not added or deleted."""
+
+    __slots__ = ()
+
+    _fields_: tuple[str, ...] = ()
+    _field_set_: frozenset[str] = frozenset()
+
+    def __init__(self, mapping: dict = None, /, **kwargs: Any) -> None:
+        self(mapping, **kwargs)
+
+    def __reduce__(self) -> tuple:
+        return _rebuild_namespace, (type(self).__name__, self._fields_, tuple(getattr(self, name) for name in self._fields_))
+
+    def __call__(self, mapping: dict = None, /, **kwargs: Any) -> SlottedNameSpace:
+        values = {**(mapping if mapping is not None else {}), **kwargs}
+
+        if unexpected := [name for name in values if name not in self._field_set_]:
+            raise AttributeError(f"{type(self).__name__} has no fields named: {', '.join(map(str, unexpected))}, expected: {', '.join(self._fields_)}.")
+
+        for name in self._fields_:
+            object.__setattr__(self, name, values.get(name))
+
+        return self
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete field '{name}' of {type(self).__name__}, its fields are fixed.")
+
+    def __len__(self) -> int:
+        return len(self._fields_)
 
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
-        return iter([(name, val) for name, val in vars(self).items() if not name.startswith("_")])
+        return ((name, getattr(self, name)) for name in self._fields_)
 
     def __contains__(self, other: Any) -> bool:
-        return other in set(vars(self).keys())
+        return other in self._field_set_
+
+
+_namespace_classes: dict[tuple[str, tuple[str, ...]], type[SlottedNameSpace]] = {}
+
+
+def _rebuild_namespace(name: str, fields: tuple[str, ...], values: tuple) -> SlottedNameSpace:
+    return NameSpace.define(name, fields)(dict(zip(fields, values)))
@@ -4,6 +4,8 @@ import os
 import subprocess
 from typing import Any, Union
 
+from .instrumentation import instrumented
+
 PathLike = Union[str, os.PathLike]
 
 
@@ -38,6 +40,7 @@ class Process(subprocess.Popen):
     def __str__(self) -> str:
         return subprocess.list2cmdline(self.args)
 
+    @instrumented
     def wait(self, timeout: float = None) -> CompletedProcess:  # type: ignore
         """Wait for the process to complete. Returns CompletedProcess rather than a returncode, and prints the stdout to the console in realtime"""
         if self.stdout is None:
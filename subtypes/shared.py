@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import struct
+from typing import Any, Iterable, Iterator, Union
+
+from .list import List
+from .dict import Dict
+
+
+class SharedBlock:
+    """
+    Base class for read-only containers published into a named multiprocessing.shared_memory segment. Other processes attach to the segment by name and read from it directly, without the container being pickled for every task.
+    Pickling an instance pickles only the segment name, so passing one to a process pool sends a few bytes and the worker attaches on unpickle.
+    The process that published the segment owns it and unlinks it on close(), or on leaving its 'with' block. Processes that are still attached keep their mapping until they close it themselves, so a worker never loses a segment it is reading from.
+    """
+
+    header = struct.Struct("<Q")
+    _published: set[str] = set()
+
+    def __init__(self, segment: SharedMemory, owner: bool) -> None:
+        self.segment, self.name, self.owner = segment, segment.name, owner
+        self._views: list[memoryview] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={repr(self.name)}, len={len(self)}, owner={self.owner})"
+
+    def __enter__(self) -> SharedBlock:
+        return self
+
+    def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __reduce__(self) -> tuple:
+        return type(self).attach, (self.name,)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedBlock:
+        """Attach to a segment published by another process. The segment is not unlinked when this process closes it or exits."""
+        try:
+            segment = SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching always registers the segment with this process' resource tracker, which would unlink it on exit while the publisher still owns it, so it is unregistered again.
+            # Segments this process published itself (or inherited from a forked publisher along with its tracker) are left registered, since that registration is the publisher's own.
+            segment = SharedMemory(name=name)
+            if os.name == "posix" and segment.name not in cls._published:
+                resource_tracker.unregister(segment._name, "shared_memory")
+
+        return cls(segment, owner=False)
+
+    def close(self) -> None:
+        """Release this process' mapping of the segment, and unlink the segment if this process published it."""
+        if getattr(self, "segment", None) is None:
+            return
+
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+
+        self.segment.close()
+        if self.owner:
+            self._published.discard(self.name)
+            with suppress(FileNotFoundError):
+                self.segment.unlink()
+
+        self.segment = None
+
+    def _view(self, start: int, stop: int, format: str = "B") -> memoryview:
+        view = self.segment.buf[start:stop].toreadonly()
+        self._views.append(view)
+
+        if format != "B":
+            self._views.append(view := view.cast(format))
+
+        return view
+
+    @classmethod
+    def _create(cls, size: int, name: str = None) -> SharedMemory:
+        segment = SharedMemory(name=name, create=True, size=max(size, 1))
+        cls._published.add(segment.name)
+        return segment
+
+
+class _BlobTable(SharedBlock):
+    """A segment holding a count, a table of offsets, and a run of pickled blobs, each of which is only unpickled when it is read."""
+
+    def __init__(self, segment: SharedMemory, owner: bool) -> None:
+        super().__init__(segment, owner)
+
+        count, = self.header.unpack_from(segment.buf)
+        self._offsets = self._view(self.header.size, self.header.size + (count + 1) * 8, "Q")
+
+    @classmethod
+    def _publish(cls, blobs: list[bytes], name: str = None) -> SharedBlock:
+        offsets, position = array("Q"), cls.header.size + (len(blobs) + 1) * 8
+        for blob in blobs:
+            offsets.append(position)
+            position += len(blob)
+        offsets.append(position)
+
+        segment = cls._create(position, name=name)
+        cls.header.pack_into(segment.buf, 0, len(blobs))
+        segment.buf[cls.header.size:offsets[0]] = offsets.tobytes()
+
+        for start, blob in zip(offsets, blobs):
+            segment.buf[start:start + len(blob)] = blob
+
+        return cls(segment, owner=True)
+
+    def _blob_count(self) -> int:
+        return len(self._offsets) - 1
+
+    def _load(self, index: int) -> Any:
+        with self.segment.buf[self._offsets[index]:self._offsets[index + 1]] as view:
+            return pickle.loads(view)
+
+
+class SharedList(_BlobTable, Sequence):
+    """
+    A read-only List published into shared memory. Each item is pickled separately, so reading one item only unpickles that item.
+    Slicing returns a List of the unpickled items. Use SharedList.publish() to create one and SharedList.attach() to open it from another process.
+    """
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return List([self._load(position) for position in range(*index.indices(len(self)))])
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index {index} out of range.")
+
+        return self._load(index % len(self))
+
+    def __len__(self) -> int:
+        return self._blob_count()
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._load(index) for index in range(len(self)))
+
+    @classmethod
+    def publish(cls, items: Iterable, name: str = None) -> SharedList:
+        """Translate and pickle the items into a new shared memory segment owned by this process."""
+        translate, dumps, protocol = List.translator.translate_recursively, pickle.dumps, pickle.HIGHEST_PROTOCOL
+        return cls._publish([dumps(translate(item), protocol=protocol) for item in items], name=name)
+
+    def to_list(self) -> List:
+        return List(self)
+
+
+class SharedDict(_BlobTable, Mapping):
+    """
+    A read-only Dict published into shared memory. The keys are unpickled once when the segment is opened, and each value only when it is read.
+    Use SharedDict.publish() to create one and SharedDict.attach() to open it from another process.
+    """
+
+    def __init__(self, segment: SharedMemory, owner: bool) -> None:
+        super().__init__(segment, owner)
+        self._positions = {key: position for position, key in enumerate(self._load(0), start=1)}
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._load(self._positions[key])
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"'{name}' not found in {type(self).__name__}.") from None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._positions)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._positions
+
+    @classmethod
+    def publish(cls, mapping: Mapping, name: str = None) -> SharedDict:
+        """Translate and pickle the values of the mapping into a new shared memory segment owned by this process."""
+        translate, dumps, protocol = Dict.translator.translate_recursively, pickle.dumps, pickle.HIGHEST_PROTOCOL
+        return cls._publish([dumps(list(mapping), protocol=protocol), *[dumps(translate(val), protocol=protocol) for val in mapping.values()]], name=name)
+
+    def to_dict(self) -> Dict:
+        return Dict({key: self[key] for key in self})
+
+
+class SharedArray(SharedBlock, Sequence):
+    """
+    A read-only array of numbers published into shared memory in a columnar layout, using the typecodes of the stdlib 'array' module.
+    Items are read straight out of the segment without unpickling anything, and SharedArray.view exposes the underlying memoryview for zero-copy use (e.g. with numpy.frombuffer).
+    """
+
+    def __init__(self, segment: SharedMemory, owner: bool) -> None:
+        super().__init__(segment, owner)
+
+        count, = self.header.unpack_from(segment.buf)
+        self.typecode = bytes(segment.buf[self.header.size:self.header.size + 1]).decode()
+        start = self.header.size * 2
+        self.view = self._view(start, start + count * array(self.typecode).itemsize, self.typecode)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return List(self.view[index].tolist()) if isinstance(index, slice) else self.view[index]
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.view)
+
+    @classmethod
+    def publish(cls, values: Iterable, typecode: str = "d", name: str = None) -> SharedArray:
+        """Copy the values into a new shared memory segment owned by this process, as an array of the given typecode."""
+        values = values if isinstance(values, array) and values.typecode == typecode else array(typecode, values)
+        start = cls.header.size * 2
+
+        segment = cls._create(start + len(values) * values.itemsize, name=name)
+        cls.header.pack_into(segment.buf, 0, len(values))
+        segment.buf[cls.header.size:cls.header.size + 1] = typecode.encode()
+        segment.buf[start:start + len(values) * values.itemsize] = values.tobytes()
+
+        return cls(segment, owner=True)
+
+    def to_list(self) -> List:
+        return List(self.view.tolist())
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-from functools import reduce, cached_property
+from functools import reduce, cached_property, lru_cache
 from operator import ior
 import re
 from typing import Any, Callable, Iterable, Tuple, Mapping, Match, Union
@@ -9,15 +9,20 @@ import warnings
 
 import regex
 import case_conversion
-import inflect
-import clipboard
 
 from .enum_ import Enum
+from .instrumentation import instrumented
 from .translator import TranslatableMeta
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    from fuzzywuzzy import fuzz
+
+@lru_cache(maxsize=None)
+def _import_fuzz() -> Any:
+    # fuzzywuzzy is only imported once a fuzzy accessor is first used, to keep it out of 'import subtypes'.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from fuzzywuzzy import fuzz
+
+    return fuzz
 
 
 class Case(Enum):
@@ -29,11 +34,53 @@ class ReprMixin:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
 
 
+class AccessorSettings:
+    """
+    Base class for the immutable settings of an accessor, whose defaults are declared as class attributes. Calling an accessor derives new settings rather than changing these ones,
+    so an accessor cached on a shared object can be used from several threads at once without one caller's settings leaking into another's.
+    """
+
+    _fields_: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields_ = tuple(dict.fromkeys([*cls._fields_, *[name for name, val in vars(cls).items() if not name.startswith("_") and not callable(val) and not isinstance(val, (property, cached_property, classmethod, staticmethod))]]))
+
+    def __init__(self, **settings: Any) -> None:
+        for name, val in settings.items():
+            if name not in self._fields_:
+                raise TypeError(f"Invalid setting {repr(name)} for {type(self).__qualname__}, must be one of: {', '.join(self._fields_)}.")
+
+            object.__setattr__(self, name, val)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join([f'{name}={repr(getattr(self, name))}' for name in self._fields_])})"
+
+    def __setattr__(self, name: str, val: Any) -> None:
+        raise AttributeError(f"{type(self).__qualname__} is immutable, use {type(self).__qualname__}.derive() to change its settings.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__qualname__} is immutable, use {type(self).__qualname__}.derive() to change its settings.")
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self._fields_)
+
+    def __hash__(self) -> int:
+        return hash((type(self), *[getattr(self, name) for name in self._fields_]))
+
+    def derive(self, **changes: Any) -> AccessorSettings:
+        """Return new settings with the given values replaced. Values of None are ignored, and if nothing changes these settings are returned as they are."""
+        if not (changes := {name: val for name, val in changes.items() if val is not None and val != getattr(self, name, None)}):
+            return self
+
+        return type(self)(**{**{name: getattr(self, name) for name in self._fields_}, **changes})
+
+
 class RegexAccessor(ReprMixin):
     """An accessor class for all regex-related Str methods"""
 
-    class Settings(ReprMixin):
-        dotall, ignorecase, multiline = True, True, False
+    class Settings(AccessorSettings):
+        dotall, ignorecase, multiline = True, True, True
 
         def __int__(self) -> int:
             return self.to_flag()
@@ -51,28 +98,22 @@ class RegexAccessor(ReprMixin):
             return self.to_flag() | other
 
         def to_flag(self) -> int:
-            flags = [flag for attr, flag in [(self.dotall, re.DOTALL), (self.ignorecase, re.IGNORECASE), (self.multiline, re.MULTILINE)]]
-            return reduce(ior, flags)
+            flags = [flag for enabled, flag in [(self.dotall, re.DOTALL), (self.ignorecase, re.IGNORECASE), (self.multiline, re.MULTILINE)] if enabled]
+            return reduce(ior, flags, 0)
 
-    def __init__(self, parent: Str = None) -> None:
-        self.parent, self.settings = parent, self.Settings()
+    def __init__(self, parent: Str = None, settings: RegexAccessor.Settings = None) -> None:
+        self.parent, self.settings = parent, settings if settings is not None else self.Settings()
 
     def __call__(self, dotall: bool = None, ignorecase: bool = None, multiline: bool = None) -> RegexAccessor:
-        if dotall is not None:
-            self.settings.dotall = dotall
-
-        if ignorecase is not None:
-            self.settings.ignorecase = ignorecase
-
-        if multiline is not None:
-            self.settings.multiline = multiline
-
-        return self
+        """Return a new accessor with the given settings changed. This accessor and its settings are left as they are."""
+        return type(self)(parent=self.parent, settings=self.settings.derive(dotall=dotall, ignorecase=ignorecase, multiline=multiline))
 
+    @instrumented
     def search(self, pattern: str, flags: int = None, partial: bool = False) -> Match[str]:
         """Perform a regex.search on this Str"""
         return regex.search(pattern=pattern, string=self.parent, flags=flags if flags is not None else self.settings.to_flag(), partial=partial)
 
+    @instrumented
     def sub(self, pattern: str, repl: Union[str, Callable[[Match], str]], flags: int = None) -> Str:
         """Perform a regex.search on this Str"""
         subbed = regex.sub(pattern=pattern, repl=repl, string=self.parent,
@@ -80,10 +121,12 @@ class RegexAccessor(ReprMixin):
 
         return type(self.parent)(subbed)
 
+    @instrumented
     def findall(self, pattern: str, flags: int = None) -> Iterable[Match[str]]:
         """Perform a regex.finditer on this Str"""
         return regex.finditer(pattern=pattern, string=self.parent, flags=flags if flags is not None else self.settings.to_flag())
 
+    @instrumented
     def split(self, pattern: str, flags: int = None) -> list[Str]:
         """Perform a regex.split on this Str"""
         return [
@@ -99,26 +142,21 @@ class RegexAccessor(ReprMixin):
 class FuzzyAccessor(ReprMixin):
     """An accessor class for all fuzzy-matching-related Str methods"""
 
-    class Settings(ReprMixin):
+    class Settings(AccessorSettings):
         tokenize, partial = False, False
 
-    def __init__(self, parent: Str = None) -> None:
-        self.parent, self.settings = parent, self.Settings()
+    def __init__(self, parent: Str = None, settings: FuzzyAccessor.Settings = None) -> None:
+        self.parent, self.settings = parent, settings if settings is not None else self.Settings()
         self._determine_matcher()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
 
     def __call__(self, tokenize: bool = None, partial: bool = None) -> FuzzyAccessor:
-        if tokenize is not None:
-            self.settings.tokenize = tokenize
-
-        if partial is not None:
-            self.settings.partial = partial
-
-        self._determine_matcher()
-        return self
+        """Return a new accessor with the given settings changed. This accessor and its settings are left as they are."""
+        return type(self)(parent=self.parent, settings=self.settings.derive(tokenize=tokenize, partial=partial))
 
+    @instrumented
     def match(self, other: str) -> int:
         """Return a score out of 100 representing a fuzzy-match between this Str and another using the current fuzzy-matching settings"""
         return self._matcher(self.parent, other)
@@ -129,6 +167,7 @@ class FuzzyAccessor(ReprMixin):
         return {match_scores[score]: score for index, score in itertools.takewhile(lambda tup: tup[0] < num, enumerate(sorted(match_scores, reverse=True)))}
 
     def _determine_matcher(self) -> None:
+        fuzz = _import_fuzz()
         for func, tokenize, partial in [(fuzz.ratio, False, False), (fuzz.partial_ratio, False, True), (fuzz.token_set_ratio, True, False), (fuzz.partial_token_set_ratio, True, True)]:
             if self.settings.tokenize is tokenize and self.settings.partial is partial:
                 self._matcher = func
@@ -179,6 +218,7 @@ class CasingAccessor(ReprMixin):
 
     def plural(self) -> Str:
         """Return the English plural of this Str"""
+        import inflect
         return type(self.parent)(inflect.engine().plural(self.parent))
 
     def from_enum(self, case: Str.Case) -> Str:
@@ -201,17 +241,15 @@ class CasingAccessor(ReprMixin):
 class SliceAccessor(ReprMixin):
     """An accessor class for all slicing-related Str methods"""
 
-    class Settings(ReprMixin):
+    class Settings(AccessorSettings):
         raise_if_absent = False
 
-    def __init__(self, parent: Str = None) -> None:
-        self.parent, self.settings = parent, self.Settings()
+    def __init__(self, parent: Str = None, settings: SliceAccessor.Settings = None) -> None:
+        self.parent, self.settings = parent, settings if settings is not None else self.Settings()
 
     def __call__(self, raise_if_absent: bool = None) -> SliceAccessor:
-        if raise_if_absent is not None:
-            self.settings.raise_if_absent = raise_if_absent
-
-        return self
+        """Return a new accessor with the given settings changed. This accessor and its settings are left as they are."""
+        return type(self)(parent=self.parent, settings=self.settings.derive(raise_if_absent=raise_if_absent))
 
     def before(self, pattern: str) -> Str:
         """Return a new Str from the portion of this Str before the given regex. Raises ValueError if multiple matches are found."""
@@ -402,6 +440,12 @@ class Str(BaseStr, metaclass=TranslatableMeta):
     class Accessors(ReprMixin):
         re, case, slice, trim, fuzzy = RegexAccessor, CasingAccessor, SliceAccessor, TrimAccessor, FuzzyAccessor
 
+    def __reduce__(self) -> tuple:
+        if not (state := vars(self)):
+            return type(self), (str.__str__(self),)
+
+        return type(self), (str.__str__(self),), {name: val for name, val in state.items() if not isinstance(getattr(type(self), name, None), cached_property)} or None
+
     @cached_property
     def re(self) -> RegexAccessor:
         return self.Accessors.re(parent=self)
@@ -424,9 +468,11 @@ class Str(BaseStr, metaclass=TranslatableMeta):
 
     def to_clipboard(self) -> None:
         """Save the content of this string to the clipboard"""
+        import clipboard
         clipboard.copy(self)
 
     @classmethod
     def from_clipboard(cls) -> Str:
         """Create a Str from the content of the clipboard"""
+        import clipboard
         return cls(clipboard.paste())
@@ -1,40 +1,366 @@
 from __future__ import annotations
 
-from typing import Any, MutableSequence, MutableMapping
+import datetime as dt
+import enum
+import operator
+import os
+import sys
+import concurrent.futures
+from itertools import repeat
+from typing import Any, Callable, Generic, Mapping, MutableSequence, MutableMapping, Optional, Sequence, Union
 from json import loads
 
+from .instrumentation import instrumented
+
 
 class Translator:
+    """
+    Translates builtin objects into their registered subtypes (e.g. str -> Str, list -> List, dict -> Dict). Subclasses of a registered type are translated as well, resolved once per type through its MRO.
+    Instances of the target types (and their subclasses) are considered already translated and are left alone.
+    """
+
+    LEAVE, CONSTRUCT, FILL, WALK = range(4)
+
     def __init__(self, translations: dict = None) -> None:
         self.translations = translations or {}
+        self._dispatch: dict[type, tuple[Optional[type], int, bool]] = {}
+        self._builtin_converters: dict[tuple[str, str], _BuiltinConverter] = {}
+        self._targets = tuple(self.translations.values())
 
     def __call__(self, item: Any, recursive: bool = False) -> Any:
         return self.translate_recursively(item) if recursive else self.translate(item)
 
+    def register(self, translations: dict[type, type]) -> None:
+        """Register additional translations, invalidating the resolved-type cache."""
+        self.translations.update(translations)
+        self._dispatch.clear()
+        self._targets = tuple(self.translations.values())
+
+    def resolve(self, type_: type) -> Optional[type]:
+        """Return the type that instances of the given type translate into, or None if they are left as they are. The result is cached per type."""
+        return self._resolve(type_)[0]
+
+    @instrumented
     def translate(self, item: Any) -> Any:
-        return item if (constructor := self.translations.get(type(item))) is None else constructor(item)
+        try:
+            constructor = self._dispatch[type(item)][0]
+        except KeyError:
+            constructor = self._resolve(type(item))[0]
+
+        return item if constructor is None else constructor(item)
 
+    @instrumented
     def translate_recursively(self, item: Any) -> Any:
-        translated = self.translate(item)
+        """
+        Translate an item and everything nested within it, using an explicit stack rather than recursion. Containers that are referenced more than once (including self-referential ones) are translated once and the references are preserved.
+        Subtrees that are already translated are not walked again.
+        """
+        memo: dict[int, tuple[Any, Any]] = {}
+        stack: list[tuple[Any, Any, bool]] = []
+
+        translated = self._visit(item, memo, stack)
+
+        while stack:
+            original, target, is_mapping = stack.pop()
 
-        if isinstance(translated, MutableSequence):
-            for index, val in enumerate(translated):
-                translated[index] = self.translate_recursively(val)
-        elif isinstance(translated, MutableMapping):
-            for key, val in translated.items():
-                translated[key] = self.translate_recursively(val)
+            if is_mapping:
+                for key, val in list(original.items()):
+                    target[key] = self._visit(val, memo, stack)
+            elif target is original:
+                for index, val in enumerate(original):
+                    target[index] = self._visit(val, memo, stack)
+            else:
+                target.extend([self._visit(val, memo, stack) for val in original])
 
         return translated
 
+    @instrumented
+    def translate_parallel(self, item: Any, workers: int = None, chunk_size: int = None, threshold: int = 100_000) -> Any:
+        """
+        Translate an item recursively, splitting a large top-level mapping or sequence into chunks that are translated concurrently and reassembled in order.
+        Chunks go to worker processes, or to worker threads on interpreters running without the GIL. Items with fewer than 'threshold' top-level entries are translated serially.
+        Shared references are only preserved within a chunk, not across chunks.
+        """
+        constructor, action, is_mapping = self._resolve(type(item))
+        if action in (self.LEAVE, self.CONSTRUCT) or len(item) < threshold:
+            return self.translate_recursively(item)
+
+        workers = workers or os.cpu_count() or 1
+        entries = list(item.items()) if is_mapping else list(item)
+        chunk_size = chunk_size or -(-len(entries) // (workers * 4))
+        chunks = [entries[start:start + chunk_size] for start in range(0, len(entries), chunk_size)]
+
+        with self._executor(workers) as executor:
+            results = list(executor.map(_translate_chunk, repeat(None if self is TranslatableMeta.translator else self), repeat(is_mapping), chunks))
+
+        translated = constructor() if action == self.FILL else item
+        if is_mapping:
+            translated.update({key: val for chunk in results for key, val in chunk})
+        elif translated is item:
+            translated[:] = [val for chunk in results for val in chunk]
+        else:
+            translated.extend([val for chunk in results for val in chunk])
+
+        return translated
+
+    @instrumented
     def translate_json(self, json: str, **kwargs: Any) -> Any:
-        return self.translate(loads(json, **kwargs))
+        return self.translate_recursively(loads(json, **kwargs))
+
+    @instrumented
+    def to_builtin(self, item: Any, datetime: str = "native", enum: str = "value") -> Any:
+        """
+        Convert an item and everything nested within it back into plain builtins (str, list, dict, tuple, datetime...). Shared containers are converted once and cycles are preserved.
+        Values that are already builtin are returned as they are, and builtin containers are only copied when something inside them changed.
+        Dates and times are kept as stdlib objects ('native'), or converted to isoformat strings ('iso') or POSIX timestamps ('epoch'). Enum members become their 'value' or their 'name'.
+        """
+        for option, choice in (("datetime", datetime), ("enum", enum)):
+            if choice not in _BuiltinConverter.options[option]:
+                raise ValueError(f"Invalid {option} option {repr(choice)}, must be one of: {', '.join(repr(allowed) for allowed in _BuiltinConverter.options[option])}.")
+
+        if (converter := self._builtin_converters.get((datetime, enum))) is None:
+            converter = self._builtin_converters[(datetime, enum)] = _BuiltinConverter(datetime=datetime, enum=enum)
+
+        return converter(item)
+
+    def __getstate__(self) -> dict:
+        return {"translations": self.translations}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["translations"])
+
+    @staticmethod
+    def _executor(workers: int) -> concurrent.futures.Executor:
+        # Accessing the executor classes through the package imports their submodules (and multiprocessing) on first use rather than on import.
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers) if gil_enabled else concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    def _resolve(self, type_: type) -> tuple[Optional[type], int, bool]:
+        try:
+            return self._dispatch[type_]
+        except KeyError:
+            pass
+
+        constructor, is_mapping = None, issubclass(type_, MutableMapping)
+        container = is_mapping or issubclass(type_, MutableSequence)
+        if not (issubclass(type_, enum.Enum) or issubclass(type_, self._targets)):
+            for base in type_.__mro__:
+                if (constructor := self.translations.get(base)) is not None:
+                    break
+
+        if constructor is None:
+            action = self.WALK if container and not issubclass(type_, self._targets) else self.LEAVE
+        else:
+            action = self.FILL if container and issubclass(constructor, (MutableMapping, MutableSequence)) else self.CONSTRUCT
+
+        self._dispatch[type_] = resolved = constructor, action, is_mapping
+        return resolved
+
+    def _visit(self, item: Any, memo: dict[int, tuple[Any, Any]], stack: list[tuple[Any, Any, bool]]) -> Any:
+        try:
+            constructor, action, is_mapping = self._dispatch[type(item)]
+        except KeyError:
+            constructor, action, is_mapping = self._resolve(type(item))
+
+        if action == self.LEAVE:
+            return item
+        elif action == self.CONSTRUCT:
+            return constructor(item)
+        elif (seen := memo.get(id(item))) is not None:
+            return seen[1]
+
+        translated = constructor() if action == self.FILL else item
+        memo[id(item)] = (item, translated)
+        stack.append((item, translated, is_mapping))
+        return translated
+
+
+class _Memo(dict):
+    """The containers converted so far by one _BuiltinConverter call keyed by their id(), along with the ids of those that were reached again while they were still being converted or afterwards."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.revisited: set[int] = set()
+
+
+class _BuiltinConverter:
+    """
+    The reverse of a Translator, converting subtypes (and subclasses of builtins in general) back into builtins. The converter for each type is resolved once and cached.
+    Containers are converted with an explicit stack of frames rather than by recursion, so nesting depth is not limited by the recursion limit.
+    """
+
+    MAPPING, LIST, TUPLE = range(3)
+
+    options = {"datetime": ("native", "iso", "epoch"), "enum": ("value", "name")}
+
+    def __init__(self, datetime: str = "native", enum: str = "value") -> None:
+        self.datetime, self.enum = datetime, enum
+        # Maps each type seen so far to None if its instances are builtin already, to its container kind (MAPPING, LIST or TUPLE), or to the function converting its instances.
+        self.dispatch: dict[type, Union[None, int, Callable[[Any], Any]]] = dict.fromkeys((str, int, float, bool, complex, type(None), bytes, bytearray))
+
+    def __call__(self, item: Any) -> Any:
+        return self.convert(item, _Memo())
+
+    def convert(self, item: Any, memo: _Memo) -> Any:
+        """Convert a single item, which is returned as it is if it is builtin already."""
+        if (converter := self._converter(type(item))) is None:
+            return item
+        elif type(converter) is not int:
+            return converter(item)
+        elif (ident := id(item)) in memo:
+            if converter != self.TUPLE:
+                memo.revisited.add(ident)
+            return memo[ident]
+
+        return self._run(item, converter, memo)
+
+    def _converter(self, type_: type) -> Union[None, int, Callable[[Any], Any]]:
+        try:
+            return self.dispatch[type_]
+        except KeyError:
+            converter = self.dispatch[type_] = self._resolve(type_)
+            return converter
+
+    def _run(self, item: Any, kind: int, memo: _Memo) -> Any:
+        """
+        Convert a container that has not been reached before, using an explicit stack of frames rather than recursion. Each frame is a tuple of a container, its kind, an iterator over its remaining members,
+        its converted members so far, and the key under which it goes into its parent once complete. A frame is pushed on reaching a nested container, and the frame below resumes once it is complete.
+        """
+        get, missing, revisited, mapping, tuple_ = self.dispatch.get, object(), memo.revisited, self.MAPPING, self.TUPLE
+        stack = [self._frame(item, kind, None, memo)]
+
+        while True:
+            item, kind, members, converted, slot = stack[-1]
+            child = None
+
+            if kind == mapping:
+                for key, val in members:
+                    if (converter := get(type(key), missing)) is not None:
+                        key = converter(key) if converter is not missing and type(converter) is not int else self.convert(key, memo)
+
+                    if (converter := get(type(val), missing)) is None:
+                        converted[key] = val
+                    elif converter is missing:
+                        converted[key] = self.convert(val, memo)
+                    elif type(converter) is not int:
+                        converted[key] = converter(val)
+                    elif (ident := id(val)) in memo:
+                        if converter != tuple_:
+                            revisited.add(ident)
+                        converted[key] = memo[ident]
+                    else:
+                        child = self._frame(val, converter, key, memo)
+                        break
+            else:
+                append = converted.append
+                for val in members:
+                    if (converter := get(type(val), missing)) is None:
+                        append(val)
+                    elif converter is missing:
+                        append(self.convert(val, memo))
+                    elif type(converter) is not int:
+                        append(converter(val))
+                    elif (ident := id(val)) in memo:
+                        if converter != tuple_:
+                            revisited.add(ident)
+                        append(memo[ident])
+                    else:
+                        child = self._frame(val, converter, None, memo)
+                        break
+
+            if child is not None:
+                stack.append(child)
+                continue
+
+            # The frame on top has run out of members, so its container is complete and goes into the container of the frame below.
+            stack.pop()
+            converted = self._complete(item, kind, converted, memo)
+            if not stack:
+                return converted
+
+            if (parent := stack[-1])[1] == mapping:
+                parent[3][slot] = converted
+            else:
+                parent[3].append(converted)
+
+    def _frame(self, item: Any, kind: int, slot: Any, memo: _Memo) -> tuple:
+        if kind == self.MAPPING:
+            memo[id(item)] = converted = {}
+            return item, kind, iter(item.items()), converted, slot
+
+        # Tuples are only memoized once complete, since they are built from their converted members.
+        converted = []
+        if kind == self.LIST:
+            memo[id(item)] = converted
+
+        return item, kind, iter(item), converted, slot
+
+    def _complete(self, item: Any, kind: int, converted: Any, memo: _Memo) -> Any:
+        if kind == self.MAPPING:
+            if type(item) is dict and len(converted) == len(item) and all(map(operator.is_, converted, item)) and all(map(operator.is_, converted.values(), item.values())):
+                return self._keep_original(item, converted, memo)
+        elif kind == self.LIST:
+            if type(item) is list and all(map(operator.is_, converted, item)):
+                return self._keep_original(item, converted, memo)
+        else:
+            memo[id(item)] = converted = item if type(item) is tuple and all(map(operator.is_, converted, item)) else tuple(converted)
+
+        return converted
+
+    @staticmethod
+    def _keep_original(item: Any, converted: Any, memo: _Memo) -> Any:
+        """Return a builtin container in place of its unchanged copy, unless the copy was already handed out to a reference to the container from within itself."""
+        if (ident := id(item)) in memo.revisited:
+            return converted
+
+        memo[ident] = item
+        return item
+
+    def _resolve(self, type_: type) -> Union[None, int, Callable[[Any], Any]]:
+        if issubclass(type_, enum.Enum):
+            getter = operator.attrgetter(self.enum)
+            return lambda member: self(getter(member))
+        elif issubclass(type_, (dt.date, dt.time)):
+            if self.datetime == "iso" or (self.datetime == "epoch" and issubclass(type_, dt.time)):
+                return type_.isoformat
+            elif self.datetime == "epoch":
+                return type_.timestamp if issubclass(type_, dt.datetime) else lambda date: dt.datetime(date.year, date.month, date.day).timestamp()
+            elif type_ in (dt.datetime, dt.date, dt.time):
+                return None
+            elif issubclass(type_, dt.datetime):
+                return lambda value: dt.datetime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond, value.tzinfo, fold=value.fold)
+            elif issubclass(type_, dt.date):
+                return lambda value: dt.date(value.year, value.month, value.day)
+            else:
+                return lambda value: dt.time(value.hour, value.minute, value.second, value.microsecond, value.tzinfo, fold=value.fold)
+        elif issubclass(type_, Mapping):
+            return self.MAPPING
+        elif issubclass(type_, tuple):
+            return self.TUPLE
+        elif issubclass(type_, (str, bytes, bytearray)):
+            return str.__str__ if issubclass(type_, str) else next(base for base in (bytes, bytearray) if issubclass(type_, base))
+        elif issubclass(type_, Sequence):
+            return self.LIST
+        elif issubclass(type_, (int, float, complex)):
+            return next(base for base in (bool, int, float, complex) if issubclass(type_, base))
+
+        return None
+
+
+def _translate_chunk(translator: Optional[Translator], is_mapping: bool, chunk: list) -> list:
+    """Translate one chunk of a top-level container. Runs in a worker, where None stands for the shared registry (populated by importing the package)."""
+    translator = TranslatableMeta.translator if translator is None else translator
+    if is_mapping:
+        return [(key, translator.translate_recursively(val)) for key, val in chunk]
+
+    return [translator.translate_recursively(val) for val in chunk]
 
 
 class TranslatableMeta(type):
     translator = Translator()
 
     def __init__(cls, name: str, bases: tuple, namespace: dict) -> None:
-        cls.translator.translations.update({base: cls for base in cls.mro()[1:] if base is not object})
+        cls.translator.register({base: cls for base in cls.mro()[1:] if base not in (object, Generic)})
 
 
 class DoNotTranslateMeta(TranslatableMeta):
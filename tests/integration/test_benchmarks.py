@@ -0,0 +1,26 @@
+import json
+
+from benchmarks import REGISTRY, Benchmark, Failure, discover, run
+from benchmarks.__main__ import main
+
+
+class TestBenchmarks:
+    def test_run(self):
+        results = run(repeat=1, min_time=0)
+        assert results.keys() == discover().keys()
+        assert all(result.seconds > 0 and result.number == 1 for result in results.values())
+
+    def test_main(self, tmp_path, capsys):
+        output = tmp_path / "results.json"
+        assert main(["run", "--filter", "enum.*", "--repeat", "1", "--min-time", "0", "--output", str(output)]) == 0
+        assert set(json.loads(output.read_text())) == {"enum.getitem", "enum.getitem_case_insensitive", "enum.call_member", "enum.eq", "enum.eq_member"}
+        assert "enum.getitem" in capsys.readouterr().out
+
+    def test_failure(self, monkeypatch, capsys):
+        def broken():
+            raise RecursionError("maximum recursion depth exceeded")
+
+        monkeypatch.setitem(REGISTRY, "broken.recursion", Benchmark(name="broken.recursion", setup=broken))
+        assert run(pattern="broken.*", repeat=1, min_time=0) == {"broken.recursion": Failure(name="broken.recursion", error="RecursionError: maximum recursion depth exceeded")}
+        assert main(["run", "--filter", "broken.*", "--repeat", "1", "--min-time", "0"]) == 1
+        assert "broken.recursion" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+import pytest
+
+import asyncio
+from contextlib import asynccontextmanager
+
+web = pytest.importorskip("aiohttp.web")
+
+from subtypes import AsyncHttp, Dict, List
+
+
+@asynccontextmanager
+async def serve():
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def items(request: web.Request) -> web.Response:
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(float(request.query.get("delay", 0)))
+            return web.json_response({"route": request.path, "items": [1, 2], "auth": request.headers.get("Authorization")})
+        finally:
+            state["in_flight"] -= 1
+
+    async def echo(request: web.Request) -> web.Response:
+        return web.json_response(await request.json())
+
+    async def empty(request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.add_routes([web.get("/items/{name}", items), web.post("/echo", echo), web.get("/empty", empty)])
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield f"http://127.0.0.1:{runner.addresses[0][1]}", state
+    finally:
+        await runner.cleanup()
+
+
+def run(scenario):
+    async def main():
+        async with serve() as (url, state):
+            return await scenario(url, state)
+
+    return asyncio.run(main())
+
+
+class TestAsyncResponse:
+    def test_json(self):
+        async def scenario(url, state):
+            async with AsyncHttp(url) as http:
+                return await http.get("/items/a"), await http.post("echo", json={"nested": [{"a": 1}]}), await http.get("empty")
+
+        items, echo, empty = run(scenario)
+        assert items.ok and isinstance(items.json(), Dict) and items.json().route == "/items/a"
+        assert isinstance(echo.json().nested, List) and echo.json().nested[0].a == 1
+        assert empty.status_code == 204 and empty.json() is None
+
+
+class TestAsyncHttp:
+    def test_request(self):
+        async def scenario(url, state):
+            async with AsyncHttp(url, auth=("user", "pass"), quote_level=AsyncHttp.QuoteLevel.NORMAL) as http:
+                return await http.get("/items/a b/")
+
+        response = run(scenario)
+        assert response.json().route == "/items/a b" and response.json().auth.startswith("Basic ")
+
+    def test_get_many(self):
+        async def scenario(url, state):
+            async with AsyncHttp(url, concurrency=3) as http:
+                return await http.get_many([f"/items/{index}?delay=0.02" for index in range(12)]), state["max_in_flight"]
+
+        responses, max_in_flight = run(scenario)
+        assert [response.json().route for response in responses] == [f"/items/{index}" for index in range(12)]
+        assert max_in_flight == 3
+
+    def test_timeout(self):
+        async def scenario(url, state):
+            async with AsyncHttp(url, timeout=5) as http:
+                return await http.gather([http.get("/items/slow?delay=1", timeout=0.05), http.get("/items/fast")], return_exceptions=True)
+
+        slow, fast = run(scenario)
+        assert isinstance(slow, asyncio.TimeoutError) and fast.ok
+
+    def test_close(self):
+        async def scenario(url, state):
+            http = AsyncHttp(url)
+            first = await http.get("/items/a")
+            await http.close()
+            second = await http.get("/items/b")
+            await http.close()
+            return first, second, http._session
+
+        first, second, session = run(scenario)
+        assert first.ok and second.ok and session is None
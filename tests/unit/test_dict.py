@@ -1,6 +1,12 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import time
+
 import pytest
 
-from subtypes import Dict
+from subtypes import Str, Dict, DefaultDict, CacheDict, List
+from subtypes.dict import AccessError, FrozenDict, KeyIndex, KeyPath, Record, literal_prefix
 
 
 @pytest.fixture
@@ -8,17 +14,36 @@ def example_dict():
     return Dict({"one": 1, "two": 2, "three": 3, 4: "four", 5: "five", "done": None})
 
 
+@pytest.fixture
+def wide_dict():
+    return Dict({**{f"key_{num}": num for num in range(KeyIndex.min_size)}, "Prefixed": "a", "prefix\nfirst": "b"})
+
+
 def test_is_valid_for_attribute_actions():  # synced
     assert True
 
 
+def test_literal_prefix():
+    assert literal_prefix(r"^abc\d") == "abc" and literal_prefix(r"\Aab*") == "a" and literal_prefix(r"^ab+") == "ab"
+    assert literal_prefix(r"abc") is None and literal_prefix(r"^ab|cd") is None and literal_prefix(r"^.bc") is None
+
+
+class TestKeyIndex:
+    def test_candidates(self):
+        index = KeyIndex(["beta", "Alpha", 3, "alpine", "x\nalp"], ignorecase=True)
+        assert index.candidates("alp") == ["Alpha", "alpine", "x\nalp"]
+        assert KeyIndex(["beta", "Alpha", "alpine"], ignorecase=False).candidates("alp") == ["alpine"]
+
+
 class TestAccessError:
     pass
 
 
 class TestRegexAccessor:
-    def test___call__(self):  # synced
-        assert True
+    def test___call__(self, example_dict):
+        accessor = example_dict.re
+        assert accessor(ignorecase=False) is not accessor and accessor.settings.ignorecase is True
+        assert Dict({"One": 1}).re(ignorecase=False).filter(r"one") == {} and Dict({"One": 1}).re.filter(r"one") == {"One": 1}
 
     def test_filter(self, example_dict):  # synced
         assert example_dict.re.filter(r"one") == {"one": 1, "done": None}
@@ -32,12 +57,65 @@ class TestRegexAccessor:
         with pytest.raises(KeyError):
             example_dict.getone_re(r"one")
 
+    def test_key_index(self, wide_dict):
+        assert wide_dict.re.get_all(r"^key_6\d$") == [60, 61, 62, 63] and wide_dict.re.get_all(r"^pre") == ["a", "b"]
+
+        wide_dict["prefix_new"], wide_dict.key_3 = "c", None
+        del wide_dict["Prefixed"]
+        assert wide_dict.re.get_all(r"^pre") == ["b", "c"]
+
+        wide_dict.update({"PREFIX": "d"})
+        assert wide_dict.re.filter(r"^pre") == {"prefix\nfirst": "b", "prefix_new": "c", "PREFIX": "d"}
+
+        wide_dict |= {"new_key": "e"}
+        assert wide_dict.re.get_all(r"^new") == ["e"] and type(wide_dict.new_key) is Str
+
+        merged = wide_dict | {"newer_key": {"f": 1}}
+        assert merged.re.get_all(r"^newer") == [{"f": 1}] and type(merged.newer_key) is Dict and not wide_dict.re.get_all(r"^newer")
+
+
+@pytest.fixture
+def nested_dict():
+    return Dict({"data": {"items": [{"price": {"amount": 1}}, {"price": {"amount": 2}}, {}], "a.b": 3}})
+
+
+class TestKeyPath:
+    def test_get(self, nested_dict):
+        assert KeyPath("data.items[-2].price.amount").get(nested_dict) == 2 and KeyPath("data['a.b']").get(nested_dict) == 3
+        assert KeyPath("data.items[*].price.amount").get(nested_dict, default=None) == [1, 2, None]
+
+        with pytest.raises(AccessError):
+            KeyPath("data.items[2].price").get(nested_dict)
+
+        assert KeyPath("a[*].b").get({"a": None}, default="DEF") == "DEF" and KeyPath("a[*]").get(Dict(a="text"), default="DEF") == "DEF"
+        assert KeyPath("a[*].b").get({"a": [{"b": 1}, None, "text", 5]}, default="DEF") == [1, "DEF", "DEF", "DEF"] and KeyPath("a[*]").get({"a": []}) == []
+
+        with pytest.raises(AccessError):
+            KeyPath("a[*]").get({"a": 5})
+
+    def test_column(self, nested_dict):
+        assert KeyPath("data.items[0].price.amount").column([nested_dict, {}], default=0) == [1, 0]
+
+    def test_set(self, nested_dict):
+        KeyPath("data.items[*].price.currency").set(nested_dict, "GBP")
+        KeyPath("meta.source").set(nested_dict, {"name": "test"})
+        assert [item.price.currency for item in nested_dict.data["items"]] == ["GBP"]*3 and nested_dict.meta.source.name == "test"
+
+    def test__parse(self):
+        assert KeyPath("a[0].*.b").steps == [(KeyPath.KEY, "a"), (KeyPath.INDEX, 0), (KeyPath.ALL, None), (KeyPath.KEY, "b")]
+
+        for expression in ["", "a.", "a..b", "a.[0]", "a[x]"]:
+            with pytest.raises(ValueError):
+                KeyPath(expression)
+
 
 class TestBaseDict:
     def test_update(self, example_dict):  # synced
         updated = example_dict.update({"six": 6, "done": True})
         assert updated.get("six") == 6 and updated.get("done") == True and example_dict is updated
 
+        assert example_dict.update(seven=7).get("seven") == 7
+
     def test_clear(self, example_dict):  # synced
         cleared = example_dict.clear()
         assert cleared == {} and example_dict is cleared
@@ -50,6 +128,22 @@ class TestDict:
     class TestAccessors:
         pass
 
+    def test___reduce__(self, wide_dict):
+        wide_dict.re.get_one(r"key_1$")
+        data = pickle.dumps(wide_dict)
+        restored = pickle.loads(data)
+        assert type(restored) is Dict and restored == wide_dict and "_key_indexes_" not in vars(restored)
+        assert len(data) < len(pickle.dumps(dict(wide_dict))) * 1.1
+        assert wide_dict.__reduce__()[2] is None
+
+        nested = Dict(inner={"items": ["a"]})
+        nested.self = nested
+        restored = pickle.loads(pickle.dumps(nested))
+        assert restored.self is restored and type(restored.inner["items"][0]) is Str
+
+        tree = pickle.loads(pickle.dumps(DefaultDict().accumulate([("a.b", 1)])))
+        assert type(tree) is DefaultDict and type(tree.a) is DefaultDict and tree.missing == {}
+
     def test___getitem__(self):  # synced
         assert True
 
@@ -59,14 +153,32 @@ class TestDict:
     def test___delitem__(self):  # synced
         assert True
 
-    def test___getattr__(self):  # synced
-        assert True
+    def test___getattr__(self, example_dict):  # synced
+        assert example_dict.one == 1 and not vars(example_dict)
 
-    def test___setattr__(self):  # synced
-        assert True
+        with pytest.raises(AttributeError):
+            example_dict.six
 
-    def test___delattr__(self):  # synced
-        assert True
+        shadowed = Dict(to_json="json", setdefault_lazy=1, diff={"a": 1}, re="regex", items="not a key")
+        assert shadowed.to_json == "json" and shadowed.setdefault_lazy == 1 and shadowed.diff.a == 1 and callable(shadowed.re.filter) and callable(shadowed.items)
+        assert Dict.to_json(Dict(to_json=1), indent=None) == '{"to_json": 1}' and callable(Dict().to_json)
+
+    def test___dir__(self, example_dict):
+        assert {"one", "two", "three", "done", "items"} <= set(dir(example_dict))
+
+    def test___setattr__(self, example_dict):  # synced
+        example_dict.six, example_dict._private_ = 6, "private"
+        assert example_dict["six"] == 6 and "_private_" not in example_dict and example_dict._private_ == "private"
+
+        with pytest.raises(AttributeError):
+            example_dict.items = None
+
+    def test___delattr__(self, example_dict):  # synced
+        del example_dict.one
+        assert "one" not in example_dict
+
+        with pytest.raises(AttributeError):
+            del example_dict.keys
 
     def test__factory_(self):  # synced
         assert True
@@ -74,9 +186,83 @@ class TestDict:
     def test_setdefault_lazy(self):  # synced
         assert True
 
+    def test_compile_path(self):
+        assert Dict.compile_path("a.b[*]") is Dict.compile_path("a.b[*]") and Dict({"a": {"b": [1, 2]}}).compile_path("a.b[*]").get(Dict({"a": {"b": [1, 2]}})) == [1, 2]
+        assert Dict(path="/tmp").path == "/tmp"
+
+        with pytest.raises(AttributeError):
+            Dict().path
+
     def test_re(self):  # synced
         assert True
 
+    def test_deep_update(self):
+        merged = Dict({"a": {"b": 1, "items": [1, 2]}, "c": 1}).deep_update({"a": {"d": {"e": 2}, "items": [2, 3]}, "c": {"f": 3}})
+        assert merged == {"a": {"b": 1, "items": [2, 3], "d": {"e": 2}}, "c": {"f": 3}} and isinstance(merged.a.d, Dict)
+
+        appended = Dict({"a": {"items": [1, 2]}}).deep_update({"a": {"items": [2, {"x": 1}]}}, strategy=Dict.MergeStrategy.APPEND)
+        assert appended.a["items"] == [1, 2, 2, {"x": 1}] and isinstance(appended.a["items"][-1], Dict)
+
+        assert Dict({"a": [1, 2]}).deep_update({"a": [2, 3]}, strategy="UNION") == {"a": [1, 2, 3]}
+        assert Dict({"a": {"n": 1}}).deep_update({"a": {"n": 2}}, strategy=lambda key, current, new: current + new) == {"a": {"n": 3}}
+
+    def test_deep_update_copies(self):
+        base, override = Dict({"db": {"hosts": ["a"], "opts": {"x": 1}}}), Dict({"db": {"hosts": ["b"], "opts": {"y": 2}}, "extra": {"z": [3]}})
+        merged = Dict().deep_update(base).deep_update(override, strategy="APPEND")
+        merged.deep_update({"extra": {"z": [4], "w": 5}}, strategy="APPEND")
+
+        assert merged == {"db": {"hosts": ["a", "b"], "opts": {"x": 1, "y": 2}}, "extra": {"z": [3, 4], "w": 5}}
+        assert base == {"db": {"hosts": ["a"], "opts": {"x": 1}}} and override == {"db": {"hosts": ["b"], "opts": {"y": 2}}, "extra": {"z": [3]}}
+        assert type(merged.extra) is Dict and type(merged.extra.z) is List and merged.db.hosts is not base.db.hosts
+
+    def test_deep_update_default_dict(self):
+        totals = DefaultDict().accumulate([("eu.sales", 1)])
+        merged = DefaultDict().deep_update(totals).deep_update(DefaultDict().accumulate([("us.sales", 2), ("us.refunds", 1)]))
+        merged.eu.returns.count = 1
+        merged.us.refunds += 1
+
+        assert merged == {"eu": {"sales": 1, "returns": {"count": 1}}, "us": {"sales": 2, "refunds": 2}} and totals == {"eu": {"sales": 1}}
+        assert type(merged.eu) is DefaultDict and type(merged.us) is DefaultDict and merged.eu is not totals.eu
+
+        nested = node = {}
+        for _ in range(5_000):
+            node["child"] = node = {"items": [1, (2, [3])]}
+
+        node, depth = Dict().deep_update(nested), 0
+        while "child" in node:
+            node, depth = node.child, depth + 1
+
+        assert depth == 5_000 and node == {"items": [1, (2, [3])]} and type(node["items"][1][1]) is List
+
+    def test_diff(self):
+        shared = Dict({"unchanged": True})
+        old = Dict({"a": 1, "b": {"c": [1, 2], "d": {"e": 1}}, "gone": 0, "shared": shared})
+        new = {"a": 2, "b": {"c": [1, 2], "d": {"e": 1, "f": 2}}, "added": {"g": 1}, "shared": shared}
+        assert old.diff(new) == [
+            {"op": "replace", "path": ["a"], "value": 2},
+            {"op": "remove", "path": ["gone"]},
+            {"op": "add", "path": ["added"], "value": {"g": 1}},
+            {"op": "add", "path": ["b", "d", "f"], "value": 2},
+        ]
+
+    def test_apply_patch(self):
+        old, new = Dict({"a": 1, "b": {"c": {"d": 1}}, "gone": 0}), {"a": [1], "b": {"c": {"d": 2, "e": 3}}}
+        assert old.apply_patch(old.diff(new)) == new and isinstance(old.a, List)
+
+        with pytest.raises(ValueError):
+            old.apply_patch([{"op": "move", "path": ["a"]}])
+
+    def test_compile_record(self, example_dict):
+        record = Dict.compile_record({"one": 1, "two": 2})
+        assert issubclass(record, Record) and record is Dict.compile_record(["one", "two"]) and record._fields_ == ("one", "two")
+
+        with pytest.raises(ValueError):
+            Dict.compile_record(["one", "items"])
+
+    def test_freeze(self, nested_dict):
+        frozen = nested_dict.freeze()
+        assert isinstance(frozen, FrozenDict) and isinstance(frozen.data, FrozenDict) and frozen.to_dict() == nested_dict
+
     def test_to_json(self):  # synced
         assert True
 
@@ -87,3 +273,155 @@ class TestDict:
 class TestDefaultDict:
     def test__factory_(self):  # synced
         assert True
+
+    def test_accumulate(self):
+        tree = DefaultDict().accumulate([("a.b", 1), (("a", "b"), 2), ("a.c", 5), ("d", 1)])
+        assert tree == {"a": {"b": 3, "c": 5}, "d": 1} and isinstance(tree.a, DefaultDict)
+        assert DefaultDict().accumulate([("a", [1]), ("a", [2])]).a == [1, 2]
+
+
+class TestFrozenDict:
+    def test_set(self):
+        original = FrozenDict(one=1, two=2)
+        updated = original.set("three", 3).set("one", 0)
+        assert original == {"one": 1, "two": 2} and updated == {"one": 0, "two": 2, "three": 3} and len(updated) == 3
+
+    def test_delete(self):
+        original = FrozenDict({num: str(num) for num in range(100)})
+        updated = original.delete(50)
+        assert len(original) == 100 and 50 in original and len(updated) == 99 and 50 not in updated
+
+        with pytest.raises(AccessError):
+            updated.delete(50)
+
+    def test_merge(self):
+        assert FrozenDict(one=1).merge({"two": 2}, three=3) == FrozenDict(one=1) | {"two": 2, "three": 3} == {"one": 1, "two": 2, "three": 3}
+
+    def test___hash__(self):
+        assert hash(FrozenDict(one=1, two=2)) == hash(FrozenDict(two=2).set("one", 1)) and {FrozenDict(one=1): True}[FrozenDict(one=1)]
+
+    def test___getattr__(self):
+        assert FrozenDict(one=1).one == 1
+
+        with pytest.raises(AttributeError):
+            FrozenDict(one=1).two
+
+    def test_to_dict(self):
+        thawed = FrozenDict(one=FrozenDict(two=2)).to_dict()
+        assert isinstance(thawed, Dict) and isinstance(thawed.one, Dict) and thawed == {"one": {"two": 2}}
+
+    def test_from_dict(self):
+        assert isinstance(FrozenDict.from_dict({"one": {"two": 2}}).one, FrozenDict)
+
+        config = {"hosts": ["a", "b"], "ports": {"http": [80, 8080]}, "nested": [{"tags": {"x"}}], "name": "cfg"}
+        frozen = FrozenDict.from_dict(config)
+        assert frozen.hosts == ("a", "b") and frozen.ports.http == (80, 8080) and frozen.nested[0].tags == frozenset({"x"}) and frozen.name == "cfg"
+        assert hash(frozen) == hash(FrozenDict.from_dict(config)) and frozen.to_dict() == {**config, "nested": [{"tags": frozenset({"x"})}]}
+        assert type(frozen.to_dict().hosts) is List and type(frozen.to_dict().nested[0]) is Dict
+
+
+class TestRecord:
+    @pytest.fixture
+    def record(self):
+        return Dict.compile_record(["name", "tags"], name="Item")
+
+    def test___init__(self, record):
+        item = record("x", tags=["a"])
+        assert item.name == "x" and item["tags"] == ["a"] and isinstance(item.tags, List) and not hasattr(item, "__dict__")
+
+        with pytest.raises(TypeError):
+            record("x")
+
+    def test___setitem__(self, record):
+        item = record("x", [])
+        item["name"], item.tags = "y", ["b"]
+        assert item == {"name": "y", "tags": ["b"]}
+
+        with pytest.raises(AccessError):
+            item["other"] = 1
+
+    def test_to_dict(self, record):
+        assert record("x", []).to_dict() == Dict(name="x", tags=[]) and isinstance(record("x", []).to_dict(), Dict)
+
+    def test_from_dict(self, record):
+        assert record.from_dict(Dict(name="x", tags=[], extra=1)) == record("x", [])
+
+    def test_json(self, record):
+        item = record("x", ["a"])
+        assert record.from_json(item.to_json()) == item
+
+    def test___reduce__(self, record):
+        item = record("x", ["a"])
+        assert pickle.loads(pickle.dumps(item)) == item
+
+
+class TestCacheDict:
+    def test___getitem__(self):
+        cache = CacheDict({"one": 1, "two": 2}, max_size=2)
+        assert cache["one"] == 1 and cache.two == 2 and cache.cache_info().hits == 2
+
+        with pytest.raises(AttributeError):
+            cache.three
+
+    def test___setitem__(self):
+        cache = CacheDict(max_size=2)
+        cache["one"], cache["two"] = 1, 2
+        cache.one
+        cache.three = 3
+        assert list(cache) == ["one", "three"] and cache.cache_info().evictions == 1
+
+    def test___reduce__(self):
+        cache = CacheDict({"one": 1}, max_size=2, ttl=60)
+        cache.one
+        restored = pickle.loads(pickle.dumps(cache))
+        assert type(restored) is CacheDict and restored == {"one": 1} and restored.cache_info().hits == 1
+        assert restored.cache_info().max_size == 2 and restored.setdefault_lazy("two", lambda: 2) == 2
+
+        copied = copy.deepcopy(cache)
+        assert copied == cache and copied._lock_ is not cache._lock_
+
+    def test_ttl(self):
+        cache = CacheDict(one=1, ttl=0.01)
+        assert "one" in cache
+        time.sleep(0.02)
+        assert "one" not in cache and cache.get("one") is None and cache.cache_info().expirations == 1
+
+    def test_ttl_iteration(self):
+        cache = CacheDict(one=1, two=2, ttl=0.05)
+        time.sleep(0.06)
+        cache.three, cache.one = 3, 10
+
+        assert len(cache) == 2 and list(cache) == ["three", "one"] and [key for key in ["one", "two", "three"] if key in cache] == ["one", "three"]
+        assert dict(cache.items()) == {"three": 3, "one": 10} and list(cache.values()) == [3, 10] and list(cache.keys()) == ["three", "one"]
+        assert cache == {"three": 3, "one": 10} and cache.cache_info().expirations == 1 and cache.cache_info().size == 2
+
+    def test_setdefault_lazy(self):
+        cache, calls = CacheDict(), []
+
+        def factory():
+            calls.append(None)
+            time.sleep(0.05)
+            return [len(calls)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: cache.setdefault_lazy("key", factory), range(16)))
+
+        assert len(calls) == 1 and all(result is results[0] for result in results) and isinstance(results[0], List)
+
+    def test_memoize(self):
+        calls = []
+
+        @CacheDict.memoize(max_size=1)
+        def square(num):
+            calls.append(num)
+            return num*num
+
+        assert [square(2), square(2), square(3), square(2)] == [4, 4, 9, 4] and calls == [2, 3, 2]
+        assert square.cache.cache_info().evictions == 2
+
+        @CacheDict.memoize(max_size=0)
+        def uncached(num):
+            calls.append(num)
+            return [num]
+
+        assert [uncached(1), uncached(1)] == [[1], [1]] and calls[-2:] == [1, 1] and type(uncached(1)) is List and not uncached.cache
@@ -1,4 +1,17 @@
-# import pytest
+import pytest
+import pickle
+
+from subtypes import Enum, EnumMap, EnumSet
+
+
+class Color(Enum):
+    RED = CRIMSON = Enum.Alias()
+    GREEN = Enum.Auto()
+    BLUE = "green"
+
+
+class Direction(Enum, case_insensitive=True):
+    UP, DOWN = "up", "down"
 
 
 class TestEnumMeta:
@@ -14,8 +27,23 @@ class TestEnumMeta:
     def test___str__(self):  # synced
         assert True
 
-    def test___getitem__(self):  # synced
-        assert True
+    def test___getitem__(self):
+        assert Color["RED"] is Color(Color.RED) is Color(1) is Color.RED
+        assert Color["CRIMSON"] is Color.CRIMSON is Color.RED and Color(2) is Color.GREEN
+        assert Color["GREEN"] is Color.GREEN and Color("green") is Color.BLUE
+        assert pickle.loads(pickle.dumps(Color.BLUE)) is Color.BLUE
+
+        with pytest.raises(KeyError):
+            Color["red"]
+
+        with pytest.raises(KeyError):
+            Color[[]]
+
+    def test_case_insensitive(self):
+        assert Direction["up"] is Direction["Up"] is Direction("UP") is Direction.UP
+
+        with pytest.raises(KeyError):
+            Direction["left"]
 
     def test_names(self):  # synced
         assert True
@@ -31,8 +59,8 @@ class TestEnum:
     def test___hash__(self):  # synced
         assert True
 
-    def test___eq__(self):  # synced
-        assert True
+    def test___eq__(self):
+        assert Color.RED == "RED" and Color.RED == Color.RED and Color.RED != Color.GREEN and Color.RED != "GREEN"
 
     def test___ne__(self):  # synced
         assert True
@@ -40,5 +68,48 @@ class TestEnum:
     def test___str__(self):  # synced
         assert True
 
-    def test_map_to(self):  # synced
-        assert True
+    def test_map_to(self):
+        assert Color.RED.map_to({Color.RED: 1}) == 1 and Color.RED.map_to(EnumMap(Color, RED=1)) == 1
+
+        with pytest.raises(ValueError):
+            Color.GREEN.map_to(EnumMap(Color, RED=1))
+
+
+class TestEnumMap:
+    def test___getitem__(self):
+        mapping = EnumMap(Color, {Color.RED: 1}, GREEN=2)
+        assert mapping[Color.RED] == mapping["CRIMSON"] == 1 and mapping["GREEN"] == 2 and mapping.get(Color.BLUE) is None
+
+        with pytest.raises(KeyError):
+            mapping[Color.BLUE]
+
+        with pytest.raises(KeyError):
+            mapping["PURPLE"]
+
+    def test___delitem__(self):
+        mapping = EnumMap(Color, RED=1, GREEN=2)
+        del mapping[Color.RED]
+        assert Color.RED not in mapping and len(mapping) == 1 and list(mapping.items()) == [(Color.GREEN, 2)]
+
+        with pytest.raises(KeyError):
+            del mapping[Color.RED]
+
+
+class TestEnumSet:
+    def test___contains__(self):
+        members = EnumSet(Color, [Color.RED, "BLUE"])
+        assert Color.RED in members and Color.CRIMSON in members and Color.GREEN not in members and "PURPLE" not in members
+        assert len(members) == 2 and list(members) == [Color.RED, Color.BLUE] and members.bits == 0b101
+
+    def test_set_algebra(self):
+        first, second = EnumSet(Color, [Color.RED, Color.GREEN]), EnumSet(Color, [Color.GREEN, Color.BLUE])
+        assert list(first & second) == [Color.GREEN] and len(first | second) == 3
+        assert list(first - second) == [Color.RED] and list(first ^ second) == [Color.RED, Color.BLUE]
+        assert first | [Color.BLUE] == {Color.RED, Color.GREEN, Color.BLUE} and first <= first | second
+
+        first -= [Color.RED]
+        first.discard(Color.BLUE)
+        assert first == EnumSet.from_bits(Color, 0b10)
+
+        with pytest.raises(TypeError):
+            first | EnumSet(Direction)
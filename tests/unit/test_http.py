@@ -1,17 +1,214 @@
-# import pytest
+import pytest
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from subtypes import Http, Dict, List
+from subtypes.http import HttpCache
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: Counter = Counter()
+    lock, in_flight, max_in_flight = threading.Lock(), Counter(), Counter()
+
+    def do_GET(self):
+        self.hits[("GET", self.path)] += 1
+
+        if self.path.startswith("/flaky") and self.hits[("GET", self.path)] <= 2:
+            self.respond(503, {"error": "unavailable"})
+        elif self.path.startswith("/slow"):
+            # Concurrency is counted per '/slow/<group>' so that slow requests left over from other tests cannot affect a group's count.
+            group = self.path.split("/")[2]
+            with self.lock:
+                self.in_flight[group] += 1
+                self.max_in_flight[group] = max(self.max_in_flight[group], self.in_flight[group])
+
+            time.sleep(0.05)
+            with self.lock:
+                self.in_flight[group] -= 1
+
+            self.respond(200, {"route": self.path})
+        elif self.path.startswith("/cached"):
+            self.cached()
+        else:
+            self.respond(200, {"route": self.path, "items": [1, 2]})
+
+    def do_POST(self):
+        self.hits[("POST", self.path)] += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.respond(503, {"error": "unavailable"})
+
+    def cached(self):
+        policy = {"fresh": "max-age=60", "stale": "max-age=0", "revalidate": "no-cache", "nostore": "no-store", "public": "public, max-age=60"}[self.path.split("/")[2]]
+        validators = {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+
+        if self.headers.get("If-None-Match") == validators["ETag"] or self.headers.get("If-Modified-Since") == validators["Last-Modified"]:
+            self.send_response(304)
+            for name, value in {"Cache-Control": policy, **validators}.items():
+                self.send_header(name, value)
+            self.end_headers()
+        else:
+            self.hits[("BODY", self.path)] += 1
+            self.respond(200, {"route": self.path, "items": [1, 2], "auth": self.headers.get("Authorization")}, headers={"Cache-Control": policy, **validators})
+
+    def respond(self, status: int, payload: dict, headers: dict = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
 
 
 class TestResponse:
-    def test_json(self):  # synced
-        assert True
+    def test_json(self, server):
+        data = Http(server).get("/json").json()
+        assert isinstance(data, Dict) and data["items"] == [1, 2] and data.route == "/json"
 
 
 class TestHttp:
     class TestQuoteLevel:
         pass
 
-    def test_request(self):  # synced
-        assert True
+    def test_request(self, server):
+        http = Http(server)
+        assert all(http.get(f"/json/{index}").status_code == 200 for index in range(5))
+
+        stats = http.pool_stats()[server]
+        assert (stats.created, stats.requests, stats.idle, stats.in_use, stats.maxsize) == (1, 5, 1, 0, 10)
+
+    def test_pool_options(self, server):
+        http = Http(server, pool_maxsize=3, pool_block=True, idle_timeout=0.05)
+        http.get("/json")
+        time.sleep(0.1)
+        http.get("/json")
+
+        stats = http.pool_stats()[server]
+        assert stats.maxsize == 3 and stats.expired == 1 and stats.requests == 2
+
+    def test_retries(self, server):
+        assert Http(server).get("/flaky/none").status_code == 503
+        assert Http(server, retries=3, backoff_factor=0, backoff_jitter=0).get("/flaky/some").status_code == 200
+        assert Handler.hits[("GET", "/flaky/some")] == 3
+
+        assert Http(server, retries=3, backoff_factor=0, backoff_jitter=0).post("/flaky/post", json={}).status_code == 503
+        assert Handler.hits[("POST", "/flaky/post")] == 1
+
+    def test_map(self, server):
+        http = Http(server)
+        results = list(http.map((f"/json/{index}" for index in range(20)), workers=4))
+        assert sorted(index for index, _ in results) == list(range(20)) and all(response.json().route == f"/json/{index}" for index, response in results)
+
+        assert [index for index, _ in http.map([f"/slow/{index}" for index in range(6)], workers=3, ordered=True)] == list(range(6))
+
+    def test_fetch_many(self, server):
+        results = Http(server).fetch_many(["/json/a", ("POST", "/flaky/many", {"json": {}}), {"url": "/slow/timeout", "timeout": 0.001}, "/json/b"])
+        assert [result.status_code if isinstance(result, Http.Response) else type(result).__name__ for result in results] == [200, 503, "ReadTimeout", 200]
+        assert results[0].json().route == "/json/a" and results[3].json().route == "/json/b"
+
+    def test_max_in_flight(self, server):
+        results = Http(server, max_in_flight=2).fetch_many([f"/slow/limited/{index}" for index in range(8)], workers=8)
+        assert all(result.ok for result in results) and Handler.max_in_flight["limited"] == 2
+
+    def test_cache(self, server):
+        http = Http(server, cache=True)
+        routes = [f"/cached/{policy}/a" for policy in ("fresh", "stale", "revalidate", "nostore") for _ in range(3)]
+        responses = [http.get(route) for route in routes]
+
+        assert [response.from_cache for response in responses] == [False, True, True] + [False, True, True] * 2 + [False] * 3
+        assert [(response.status_code, response.json().route) for response in responses] == [(200, route) for route in routes]
+        assert [Handler.hits[("BODY", f"/cached/{policy}/a")] for policy in ("fresh", "stale", "revalidate", "nostore")] == [1, 1, 1, 3]
+
+        stats = http.cache_stats()
+        assert (stats.hits, stats.revalidated, stats.misses, stats.entries) == (2, 4, 6, 3)
+
+    def test_cache_credentials(self, server):
+        http = Http(server, cache=True)
+        alice, bob = http.get("/cached/fresh/me", auth=("alice", "x")), http.get("/cached/fresh/me", auth=("bob", "y"))
+        carol, anonymous = http.get("/cached/fresh/me", headers={"Authorization": "Bearer carol"}), http.get("/cached/fresh/me")
+
+        assert [response.json().auth for response in (alice, bob, carol)] == [alice.request.headers["Authorization"], bob.request.headers["Authorization"], "Bearer carol"]
+        assert alice.json().auth != bob.json().auth and anonymous.json().auth is None and not any(response.from_cache for response in (alice, bob, carol, anonymous))
+        assert http.get("/cached/fresh/me").from_cache and not http.get("/cached/fresh/me", auth=("alice", "x")).from_cache
+
+        http.get("/cached/public/shared", auth=("alice", "x"))
+        assert http.get("/cached/public/shared", auth=("bob", "y")).from_cache
+
+    def test_cache_json(self, server):
+        http = Http(server, cache=True)
+        first, second = http.get("/cached/stale/json"), http.get("/cached/stale/json")
+        assert second.from_cache and first._cache_entry_ is second._cache_entry_ and isinstance(second.json(), Dict) and second.json().route == "/cached/stale/json"
+
+        first.json()["items"].append(99)
+        mutated = second.json()
+        mutated["items"].append(99)
+        mutated.route = "changed"
+        assert http.get("/cached/stale/json").json() == {"route": "/cached/stale/json", "items": [1, 2], "auth": None} and isinstance(mutated["items"], List)
+        assert Http(server).get("/cached/stale/json").json() is not Http(server).get("/cached/stale/json").json()
+
+    def test_retry_policy(self):
+        policy = Http.retry_policy(5, backoff_factor=0.1, backoff_jitter=0.5)
+        assert policy.total == 5 and "POST" not in policy.allowed_methods and 503 in policy.status_forcelist and policy.backoff_jitter == 0.5
+        assert Http(retries=policy).adapters["https://"].max_retries is policy
+
+        class LegacyHttp(Http):
+            _retry_backoff_params = frozenset()
+
+        assert LegacyHttp.retry_policy(5, backoff_jitter=0.5, backoff_max=1.0).backoff_jitter == 0.0
+
+    def test__quote_encode(self):
+        assert Http()._quote_encode("a b/c") == "a b/c"
+        assert Http(quote_level=Http.QuoteLevel.NORMAL)._quote_encode("a b/c") == "a%20b/c"
+        assert Http(quote_level="PLUS")._quote_encode("a b/c") == "a+b%2Fc"
+
+
+class TestHttpCache:
+    def test_eviction(self, server):
+        http = Http(server, cache=HttpCache(max_bytes=0))
+        size = http.get("/cached/fresh/size")._cache_entry_.size
+
+        cache = http.cache = HttpCache(max_bytes=size * 2 + size // 2)
+        http.get("/cached/fresh/evict/a"), http.get("/cached/fresh/evict/b"), http.get("/cached/fresh/evict/a"), http.get("/cached/fresh/evict/c")
+
+        assert HttpCache.key(f"{server}/cached/fresh/evict/b") not in cache and HttpCache.key(f"{server}/cached/fresh/evict/a") in cache
+        assert cache.stats().evictions == 1 and cache.stats().bytes <= cache.max_bytes
+
+    def test_disk(self, server, tmp_path):
+        Http(server, cache=HttpCache(directory=tmp_path)).get("/cached/fresh/disk")
+        http = Http(server, cache=HttpCache(max_bytes=0, directory=tmp_path))
+
+        response = http.get("/cached/fresh/disk")
+        assert response.from_cache and response.json().route == "/cached/fresh/disk" and Handler.hits[("BODY", "/cached/fresh/disk")] == 1
+        assert (http.cache_stats().hits, http.cache_stats().entries, http.cache_stats().disk_entries, len(http.cache)) == (1, 0, 1, 1)
+
+        http.cache.clear()
+        assert not list(tmp_path.iterdir()) and len(http.cache) == 0
+
+    def test_disk_format(self, server, tmp_path):
+        Http(server, cache=HttpCache(directory=tmp_path)).get("/cached/fresh/format")
+        path, = tmp_path.iterdir()
+        metadata, body = path.read_bytes().split(b"\n", 1)
+        assert json.loads(metadata)["url"].endswith("/cached/fresh/format") and json.loads(body)["route"] == "/cached/fresh/format"
 
-    def test__quote_encode(self):  # synced
-        assert True
+        path.write_bytes(b"\x80\x04garbage")
+        http = Http(server, cache=HttpCache(directory=tmp_path))
+        assert not http.get("/cached/fresh/format").from_cache and Handler.hits[("BODY", "/cached/fresh/format")] == 2
@@ -0,0 +1,47 @@
+import pytest
+from pathlib import Path
+import subprocess
+import sys
+
+import subtypes
+
+
+HEAVY_MODULES = {"aiohttp", "bs4", "lxml", "requests", "simplejson", "fuzzywuzzy", "inflect", "clipboard", "parsedatetime", "colour", "dateutil"}
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Run the statement in a fresh interpreter under '-X importtime' and return the cumulative import time in microseconds of every module it imported."""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=Path(subtypes.__file__).parents[1], capture_output=True, text=True, check=True)
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and (fields := line.removeprefix("import time:").split("|"))[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+
+    return times
+
+
+class TestImport:
+    def test_import_time(self):
+        times = import_times("import subtypes")
+        assert not {module.split(".")[0] for module in times} & HEAVY_MODULES
+        assert times["subtypes"] < 1_000_000
+
+    def test_deferred_dependencies(self):
+        times = import_times("import subtypes; subtypes.Str('a').fuzzy; subtypes.Http")
+        assert {"fuzzywuzzy", "requests"} <= set(times) and "inflect" not in times
+
+    def test___getattr__(self):
+        assert subtypes.Http is subtypes.http.Http and subtypes.DateTime is subtypes.datetime_.DateTime
+        assert {"Html", "Color", "SharedList"} <= set(dir(subtypes))
+
+        with pytest.raises(AttributeError):
+            subtypes.Missing
+
+    def test_missing_optional_dependency(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "aiohttp", None)
+        monkeypatch.delitem(sys.modules, "subtypes.async_http", raising=False)
+        monkeypatch.delitem(vars(subtypes), "AsyncHttp", raising=False)
+
+        with pytest.raises(ImportError, match=r"pip install pysubtypes\[async\]"):
+            subtypes.AsyncHttp
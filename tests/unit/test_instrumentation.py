@@ -0,0 +1,53 @@
+import pytest
+
+from subtypes import Str, Dict, DateTime, TranslatableMeta, instrumentation
+from subtypes.str import RegexAccessor
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_instrumented(self):
+        search = vars(RegexAccessor)["search"]
+        assert not hasattr(search, "__wrapped__") and instrumentation._registry["subtypes.str.RegexAccessor.search"] is search
+
+    def test_enable(self):
+        original = vars(DateTime)["from_string"]
+
+        instrumentation.enable()
+        assert instrumentation.is_enabled() and isinstance(vars(DateTime)["from_string"], classmethod) and vars(DateTime)["from_string"] is not original
+        assert DateTime.from_string("march 4th 2021").date() == DateTime(2021, 3, 4).date()
+
+        instrumentation.disable()
+        assert vars(DateTime)["from_string"].__func__ is original.__func__
+        assert instrumentation.snapshot()["subtypes.datetime_.datetime_.DateTime.from_string"].calls == 1
+
+    def test_snapshot(self):
+        instrumentation.enable()
+        Str("abc").re.search("b")
+        Str("abc").re.search("c")
+        Dict(abc=1).re.filter("a")
+
+        stats = instrumentation.snapshot()
+        assert stats["subtypes.str.RegexAccessor.search"].calls == 2 and stats["subtypes.dict.RegexAccessor.filter"].calls == 1
+        assert stats["subtypes.str.RegexAccessor.search"].seconds > 0
+
+        instrumentation.reset()
+        assert instrumentation.snapshot() == {}
+
+    def test_profile(self):
+        Str("abc").re.search("b")
+
+        with instrumentation.profile() as stats:
+            TranslatableMeta.translator.translate_recursively({"a": [1]})
+            Str("abc").fuzzy.match("abd")
+
+        assert {"subtypes.translator.Translator.translate_recursively", "subtypes.str.FuzzyAccessor.match"} <= set(stats) and "subtypes.str.RegexAccessor.search" not in stats
+        assert not instrumentation.is_enabled() and not hasattr(vars(RegexAccessor)["search"], "__wrapped__")
@@ -1,6 +1,9 @@
 import pytest
 
-from subtypes import List
+import os
+import pickle
+
+from subtypes import Str, List, Dict, SpillList
 
 
 @pytest.fixture
@@ -12,8 +15,11 @@ class TestSliceAccessor:
     class TestSettings:
         pass
 
-    def test___call__(self):  # synced
-        assert True
+    def test___call__(self, default_list):
+        assert default_list.slice.after(9) == [] and not default_list.slice.settings.raise_if_absent
+
+        with pytest.raises(ValueError):
+            default_list.slice(raise_if_absent=True).after(9)
 
     def test_before(self, default_list):  # synced
         assert default_list.slice.before(2) == [0, 1, 1, 1]
@@ -131,6 +137,17 @@ class TestList:
     class TestAccessors:
         pass
 
+    def test___reduce__(self):
+        items = List([{"a": "b"}, [1]])
+        items.slice
+        restored = pickle.loads(pickle.dumps(items))
+        assert type(restored) is List and restored == items and not vars(restored)
+        assert type(restored[0]) is Dict and type(restored[0].a) is Str and type(restored[1]) is List
+
+        items.append(items)
+        restored = pickle.loads(pickle.dumps(items))
+        assert list.__getitem__(restored, 2) is restored
+
     def test_slice(self):  # synced
         assert True
 
@@ -152,6 +169,14 @@ class TestList:
     def test_split_into_batches_of_size(self):  # synced
         assert True
 
+    def test_extract(self):
+        records = List([{"a": {"b": [1, 2]}, "c": "x"}, {"a": {"b": [3]}}])
+        assert records.extract("a.b[0]", "c", default=None) == {"a.b[0]": [1, 3], "c": ["x", None]}
+
+    def test_of_records(self):
+        records = List.of_records([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+        assert isinstance(records, List) and records.attr.a == [1, 2] and records[1] == {"a": 2, "b": "y"} and List.of_records([]) == []
+
     def test_to_json(self):  # synced
         assert True
 
@@ -163,3 +188,43 @@ class TestList:
 
     def test_from_json(self):  # synced
         assert True
+
+
+class TestSpillList:
+    def test_append(self):
+        spill = SpillList(buffer_size=3).append(1).append(2).append(3).append(4)
+        assert len(spill) == 4 and list(spill) == [1, 2, 3, 4] and len(spill._runs) == 1
+        spill.close()
+
+    def test_sort(self):
+        with SpillList([5, 3, 9, 1, 7, 2, 8, 6, 4, 0], buffer_size=3) as spill:
+            assert list(spill.sort()) == list(range(10))
+            assert list(spill.sort(key=lambda x: x % 3, reverse=True)) == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9]
+
+    def test_sort_fan_in(self):
+        class CountingSpillList(SpillList):
+            merge_fan_in, open_runs, max_open_runs = 3, 0, 0
+
+            def _read_run(self, path):
+                type(self).open_runs += 1
+                type(self).max_open_runs = max(self.max_open_runs, self.open_runs)
+                try:
+                    yield from super()._read_run(path)
+                finally:
+                    type(self).open_runs -= 1
+
+        data = [(index * 7919 % 41, index) for index in range(41)]
+        with CountingSpillList(data, buffer_size=2) as spill:
+            assert list(spill.sort(key=lambda item: item[0] // 4)) == sorted(data, key=lambda item: item[0] // 4)
+            assert spill.max_open_runs == 3 and len(os.listdir(spill._tempdir.name)) == len(spill._runs)
+
+    def test_split_into_batches_of_size(self):
+        with SpillList(range(7), buffer_size=2) as spill:
+            batches = list(spill.split_into_batches_of_size(3))
+            assert batches == [[0, 1, 2], [3, 4, 5], [6]] and all(isinstance(batch, List) for batch in batches)
+
+    def test_close(self):
+        spill = SpillList(range(10), buffer_size=2)
+        directory = spill._tempdir.name
+        spill.close()
+        assert not os.path.exists(directory) and not spill
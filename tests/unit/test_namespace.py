@@ -1,24 +1,71 @@
-# import pytest
+import pytest
+import pickle
+
+from subtypes import NameSpace
 
 
 class TestNameSpace:
+    def test___reduce__(self):
+        namespace = NameSpace(a=1, b="two")
+        restored = pickle.loads(pickle.dumps(namespace))
+        assert type(restored) is NameSpace and list(restored) == [("a", 1), ("b", "two")]
+
     def test___call__(self):  # synced
         assert True
 
-    def test___len__(self):  # synced
-        assert True
+    def test___len__(self):
+        namespace = NameSpace(a=1, b=2)
+        namespace._private, namespace.c = "hidden", 3
+        namespace._private = "still hidden"
+        assert len(namespace) == 3
+
+        del namespace._private, namespace.a
+        assert len(namespace) == 2
+
+        namespace(_private=1, d=4)
+        assert len(namespace) == 1 and len(pickle.loads(pickle.dumps(namespace))) == 1
 
     def test___getitem__(self):  # synced
         assert True
 
-    def test___setitem__(self):  # synced
-        assert True
+    def test___setitem__(self):
+        namespace = NameSpace()
+        namespace["a"], namespace[None] = 1, 2
+        assert namespace.a == 1 and namespace[None] == 2 and namespace.__none__ == 2
 
     def test___delitem__(self):  # synced
         assert True
 
-    def test___iter__(self):  # synced
-        assert True
+    def test___iter__(self):
+        namespace = NameSpace(a=1, _b=2, c=3)
+        assert list(namespace) == [("a", 1), ("c", 3)]
 
-    def test___contains__(self):  # synced
-        assert True
+    def test___contains__(self):
+        namespace = NameSpace(a=1)
+        assert "a" in namespace and "b" not in namespace
+
+    def test_define(self):
+        Point = NameSpace.define("Point", ["x", "y"])
+        assert NameSpace.define("Point", ("x", "y")) is Point
+
+        point = Point(x=1)
+        assert not hasattr(point, "__dict__") and repr(point) == "Point(x=1, y=None)"
+        assert len(point) == 2 and "x" in point and "z" not in point and list(point) == [("x", 1), ("y", None)]
+
+        point["y"] = 2
+        assert point.y == 2 and pickle.loads(pickle.dumps(point)).y == 2
+
+        with pytest.raises(AttributeError):
+            point.z = 3
+
+        with pytest.raises(AttributeError):
+            del point.x
+
+        with pytest.raises(AttributeError):
+            Point(z=3)
+
+        with pytest.raises(ValueError):
+            NameSpace.define("Invalid", ["x", "x"])
+
+        with pytest.raises(ValueError):
+            NameSpace.define("Invalid", ["_x"])
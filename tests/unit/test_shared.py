@@ -0,0 +1,90 @@
+import pytest
+
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import subprocess
+import sys
+
+from subtypes import Str, List, Dict, SharedList, SharedDict, SharedArray
+
+
+def read_name(table, index):
+    return str(table[index].name)
+
+
+class TestSharedBlock:
+    def test___reduce__(self):
+        with SharedList.publish([1, 2, 3]) as shared:
+            attached = pickle.loads(pickle.dumps(shared))
+            assert len(pickle.dumps(shared)) < 200 and attached.name == shared.name and not attached.owner
+            assert list(attached) == [1, 2, 3]
+            attached.close()
+
+    def test_attach(self):
+        with SharedList.publish([Dict(name="first")]) as shared:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                assert list(executor.map(read_name, [shared] * 2, [0, 0])) == ["first", "first"]
+
+            code = f"from subtypes import SharedList; print(SharedList.attach({shared.name!r})[0].name)"
+            assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "first"
+            assert shared[0].name == "first"
+
+            with SharedList.attach(shared.name) as attached:
+                assert attached[0].name == "first"
+
+    def test_close(self):
+        shared = SharedList.publish(["a"])
+        attached = SharedList.attach(shared.name)
+        shared.close()
+
+        assert attached[0] == "a"
+        attached.close()
+
+        with pytest.raises(FileNotFoundError):
+            SharedList.attach(shared.name)
+
+
+class TestSharedList:
+    def test___getitem__(self):
+        with SharedList.publish([{"a": "b"}, [1], "c", None]) as shared:
+            assert len(shared) == 4 and shared[-1] is None and shared[2] == "c"
+            assert type(shared[0]) is Dict and type(shared[0].a) is Str and type(shared[1]) is List
+            assert type(shared[1:3]) is List and shared[1:3] == [[1], "c"]
+            assert shared.index("c") == 2 and "c" in shared
+
+            with pytest.raises(IndexError):
+                shared[4]
+
+    def test_to_list(self):
+        with SharedList.publish([]) as shared:
+            assert shared.to_list() == [] and type(shared.to_list()) is List
+
+
+class TestSharedDict:
+    def test___getitem__(self):
+        with SharedDict.publish(Dict({"one": 1, "two": ["a"], 3: "three"})) as shared:
+            assert shared["one"] == 1 and shared.two == ["a"] and type(shared.two) is List and shared[3] == "three"
+            assert list(shared) == ["one", "two", 3] and "one" in shared and len(shared) == 3
+
+            with pytest.raises(KeyError):
+                shared["missing"]
+
+            with pytest.raises(AttributeError):
+                shared.missing
+
+    def test_to_dict(self):
+        with SharedDict.publish({"one": {"two": 2}}) as shared:
+            assert shared.to_dict() == {"one": {"two": 2}} and type(shared.to_dict().one) is Dict
+
+
+class TestSharedArray:
+    def test___getitem__(self):
+        with SharedArray.publish([1.5, 2.5, 3.5]) as shared:
+            attached = SharedArray.attach(shared.name)
+            assert attached[0] == 1.5 and attached[-1] == 3.5 and attached[1:] == [2.5, 3.5] and type(attached[1:]) is List
+            assert attached.typecode == "d" and attached.view.readonly and sum(attached) == 7.5
+            attached.close()
+
+    def test_to_list(self):
+        with SharedArray.publish(range(5), typecode="q") as shared:
+            assert shared.to_list() == [0, 1, 2, 3, 4]
@@ -1,6 +1,12 @@
 import pytest
 
-from subtypes import Str
+from concurrent.futures import ThreadPoolExecutor
+import pickle
+import re
+import sys
+
+from subtypes import Str, List, Dict
+from subtypes.str import RegexAccessor
 
 
 @pytest.fixture
@@ -38,11 +44,47 @@ class TestRegexAccessor:
         def test___ror__(self):  # synced
             assert True
 
-        def test_to_flag(self):  # synced
-            assert True
+        def test_to_flag(self):
+            assert RegexAccessor.Settings().to_flag() == re.DOTALL | re.IGNORECASE | re.MULTILINE
+            assert RegexAccessor.Settings(dotall=False, ignorecase=False, multiline=False).to_flag() == 0
 
-    def test___call__(self):  # synced
-        assert True
+        def test_multiline(self):
+            text = Str("first line\nsecond line")
+            assert [match.group() for match in text.re.findall(r"^\w+")] == ["first", "second"] and [match.group() for match in text.re.findall(r"\w+$")] == ["line", "line"]
+            assert [match.group() for match in text.re(multiline=False).findall(r"^\w+")] == ["first"] and [match.group() for match in text.re(multiline=False).findall(r"\w+$")] == ["line"]
+            assert Dict({"x\ny": 1}).re.get_all(r"^y") == [1] and Dict({"x\ny": 1}).re(multiline=False).get_all(r"^y") == []
+
+        def test_derive(self):
+            settings = RegexAccessor.Settings()
+            assert settings.derive(ignorecase=None, multiline=True) is settings
+
+            derived = settings.derive(ignorecase=False)
+            assert derived == RegexAccessor.Settings(ignorecase=False) and (derived.dotall, derived.ignorecase, settings.ignorecase) == (True, False, True)
+
+            with pytest.raises(AttributeError):
+                settings.ignorecase = False
+
+            with pytest.raises(TypeError):
+                settings.derive(verbose=True)
+
+    def test___call__(self, default_string):
+        accessor = default_string.re(ignorecase=False)
+        assert accessor is not default_string.re and accessor.settings.ignorecase is False and default_string.re.settings.ignorecase is True
+        assert accessor.search(r"world") is None and default_string.re.search(r"world").group() == "World"
+
+    def test_concurrent(self):
+        text, interval = Str("Hello World!"), sys.getswitchinterval()
+
+        def search(index: int) -> bool:
+            ignorecase = bool(index % 2)
+            return all((text.re(ignorecase=ignorecase).search(r"world") is not None) is ignorecase for _ in range(200))
+
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                assert all(executor.map(search, range(64)))
+        finally:
+            sys.setswitchinterval(interval)
 
     def test_search(self, default_string):  # synced
         assert default_string.re.search(r"\bwor[A-Za-z]+\b").group() == "World"
@@ -64,8 +106,9 @@ class TestFuzzyAccessor:
     class TestSettings:
         pass
 
-    def test___call__(self):  # synced
-        assert True
+    def test___call__(self, default_string):
+        accessor = default_string.fuzzy(partial=True)
+        assert accessor.match("Hello") == 100 and default_string.fuzzy.match("Hello") < 100 and not default_string.fuzzy.settings.partial
 
     def test_match(self, default_string):  # synced
         assert default_string.fuzzy.match("Hello Worlds!") > 95
@@ -127,8 +170,11 @@ class TestSliceAccessor:
     class TestSettings:
         pass
 
-    def test___call__(self):  # synced
-        assert True
+    def test___call__(self, default_string):
+        assert default_string.slice.after(r"x") == ""
+
+        with pytest.raises(ValueError):
+            default_string.slice(raise_if_absent=True).after(r"x")
 
     def test_before(self, default_string):  # synced
         assert default_string.slice.before(r"w") == "Hello "
@@ -282,6 +328,13 @@ class TestStr:
     class TestAccessors:
         pass
 
+    def test___reduce__(self):
+        text = Str("Hello World")
+        text.case, text.re
+        restored = pickle.loads(pickle.dumps(text))
+        assert type(restored) is Str and restored == text and not vars(restored)
+        assert pickle.loads(pickle.dumps(List([text, text])))[1] == "Hello World"
+
     def test_re(self):  # synced
         assert True
 
@@ -1,18 +1,129 @@
-# import pytest
+import pytest
+from collections import OrderedDict
+import datetime as dt
+
+from subtypes import Str, List, Dict, Enum, DateTime
+from subtypes.translator import Translator, TranslatableMeta
 
 
 class TestTranslator:
     def test___call__(self):  # synced
-        assert True
+        translator = TranslatableMeta.translator
+        assert type(translator("a")) is Str
+        assert type(translator({"a": [{}]}, recursive=True).a[0]) is Dict
 
     def test_translate(self):  # synced
-        assert True
+        translator = TranslatableMeta.translator
+        assert type(translator.translate("a")) is Str
+        assert type(translator.translate(OrderedDict(a=1))) is Dict
+        assert translator.translate(1) == 1
+
+        class Color(str, Enum):
+            RED = "red"
+
+        assert translator.translate(Color.RED) is Color.RED
+
+        already = List([1])
+        assert translator.translate(already) is already
 
     def test_translate_recursively(self):  # synced
-        assert True
+        translator = TranslatableMeta.translator
+
+        shared = {"x": [1, "a"]}
+        payload = {"one": shared, "two": shared, "items": [shared, (shared,)]}
+        translated = translator.translate_recursively(payload)
+        assert type(translated) is Dict and type(translated.one) is Dict and type(translated.one.x) is List
+        assert type(translated.one.x[1]) is Str
+        assert translated.one is translated.two is translated["items"][0]
+        assert translated["items"][1][0] is shared
+
+        cyclic = {"name": "root"}
+        cyclic["self"] = cyclic
+        translated = translator.translate_recursively(cyclic)
+        assert translated["self"] is translated
+
+        deep = current = []
+        for _ in range(5000):
+            current.append(current := [])
+        assert type(translator.translate_recursively(deep)[0][0]) is List
+
+        untouched = Dict(inner={"a": 1})
+        dict.__setitem__(untouched, "inner", {"a": 1})
+        assert type(translator.translate_recursively(untouched)["inner"]) is dict
+
+    def test_translate_parallel(self):
+        translator = TranslatableMeta.translator
+
+        sequence = [{"id": index, "tags": ["a"]} for index in range(50)]
+        translated = translator.translate_parallel(sequence, workers=2, chunk_size=7, threshold=10)
+        assert type(translated) is List and translated == sequence
+        assert type(translated[49]) is Dict and type(translated[49].tags[0]) is Str
+
+        mapping = {f"key{index}": {"value": [index]} for index in range(50)}
+        translated = translator.translate_parallel(mapping, workers=2, threshold=10)
+        assert type(translated) is Dict and list(translated) == list(mapping)
+        assert type(translated.key3.value) is List
+
+        small = [{"a": 1}]
+        assert type(translator.translate_parallel(small, threshold=10)[0]) is Dict
+
+        custom = Translator({dict: Dict})
+        translated = custom.translate_parallel([{"a": "b"}] * 20, workers=2, threshold=10)
+        assert type(translated) is list and type(translated[0]) is Dict
 
     def test_translate_json(self):  # synced
-        assert True
+        translated = TranslatableMeta.translator.translate_json('{"a": [{"b": "c"}]}')
+        assert type(translated.a[0]) is Dict and type(translated.a[0].b) is Str
+
+    def test_to_builtin(self):
+        translator = TranslatableMeta.translator
+
+        class Color(Enum):
+            RED = "red"
+
+        plain = {"a": [1, "b", {"c": None}], "d": ("e", 2.0)}
+        assert translator.to_builtin(plain) is plain
+        assert translator.to_builtin(plain["a"]) is plain["a"]
+
+        translated = translator.translate_recursively({"name": "x", "items": [{"color": Color.RED}], "pair": ("y", Str("z")), Str("key"): 1})
+        converted = translator.to_builtin(translated)
+        assert converted == {"name": "x", "items": [{"color": "red"}], "pair": ("y", "z"), "key": 1}
+        assert type(converted) is dict and type(converted["name"]) is str and type(converted["items"]) is list
+        assert type(converted["pair"][1]) is str and all(type(key) is str for key in converted)
+        assert translator.to_builtin(Color.RED, enum="name") == "RED"
+
+        when = DateTime(2020, 1, 2, 3, 4, 5)
+        assert type(translator.to_builtin(when)) is dt.datetime and translator.to_builtin(when) == when
+        assert translator.to_builtin([when], datetime="iso") == ["2020-01-02T03:04:05"]
+        assert translator.to_builtin(when, datetime="epoch") == dt.datetime(2020, 1, 2, 3, 4, 5).timestamp()
+
+        shared = List([Str("s")])
+        cyclic = Dict(one=shared, two=shared)
+        cyclic["self"] = cyclic
+        converted = translator.to_builtin(cyclic)
+        assert type(converted) is dict and converted["self"] is converted and converted["one"] is converted["two"]
+
+        deep = current = List()
+        for _ in range(5000):
+            current.append(current := List([Str("x")]))
+        converted = translator.to_builtin(deep)
+        assert type(converted) is list and type(converted[0][1]) is list and type(converted[0][0]) is str
+
+        with pytest.raises(ValueError):
+            translator.to_builtin(plain, datetime="unix")
+
+    def test_resolve(self):
+        translator = Translator({dict: Dict})
+
+        class Sub(OrderedDict):
+            pass
+
+        assert translator.resolve(Sub) is Dict
+        assert translator.resolve(Dict) is None
+        assert translator.resolve(int) is None
+
+        translator.register({int: float})
+        assert translator.resolve(int) is float
 
 
 class TestTranslatableMeta: